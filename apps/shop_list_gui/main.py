@@ -1,12 +1,30 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
-from storage import ShoppingItem, default_data_path, load_items, save_items
+from storage import ShoppingItem, default_data_path, item_to_dict, load_items, save_items
+
+# Tcl lambda that writes every visible row in one interpreter call; rows are (iid, *values).
+# Pooled rows get new values and are (re)attached in place, missing ones are created.
+_SYNC_ROWS_LAMBDA = (
+    "{tree rows} {set i 0; foreach row $rows {"
+    "set iid [lindex $row 0]; set values [lrange $row 1 end]; "
+    "if {[$tree exists $iid]} {$tree item $iid -values $values; $tree move $iid {} $i} "
+    "else {$tree insert {} $i -id $iid -values $values}; "
+    "incr i"
+    "}}"
+)
+
+# Used until the Treeview has been mapped and can be measured.
+_DEFAULT_VISIBLE_ROWS = 25
+_DEFAULT_ROW_HEIGHT = 20
+_DEFAULT_HEADING_HEIGHT = 24
+_WHEEL_STEP = 3
+# Bursts of edits within this window are written to disk once.
+_SAVE_DELAY_MS = 500
 
 
 class ShopListApp:
@@ -17,7 +35,18 @@ class ShopListApp:
 
         self.data_path: Path = default_data_path()
         self.items: list[ShoppingItem] = []
+        self._by_id: dict[str, ShoppingItem] = {}
         self.selected_id: str | None = None
+        self._save_after_id: str | None = None
+        self._dirty = False
+
+        # The Treeview is virtualized: it only holds a pool of rows ("row0".."rowN")
+        # covering the viewport, filled from self.items[self._view_start:].
+        self._view_start = 0
+        self._row_items: dict[str, ShoppingItem] = {}
+        self._row_of: dict[str, str] = {}
+        self._tree_height = 0
+        self._render_after_id: str | None = None
 
         self._build_style()
         self._build_menu()
@@ -27,30 +56,30 @@ class ShopListApp:
 
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
+    # Style and menu are static, so each is built with a single Tcl script
+    # instead of one Python->Tcl call per option.
     def _build_style(self) -> None:
-        style = ttk.Style()
-        try:
-            style.theme_use("clam")
-        except tk.TclError:
-            pass
-
-        style.configure("Title.TLabel", font=("Segoe UI", 16, "bold"))
-        style.configure("Hint.TLabel", font=("Segoe UI", 10))
+        self.root.tk.eval(
+            "catch {ttk::style theme use clam}\n"
+            "ttk::style configure Title.TLabel -font {{Segoe UI} 16 bold}\n"
+            "ttk::style configure Hint.TLabel -font {{Segoe UI} 10}\n"
+        )
 
     def _build_menu(self) -> None:
-        menubar = tk.Menu(self.root)
-
-        file_menu = tk.Menu(menubar, tearoff=False)
-        file_menu.add_command(label="Open…", command=self._menu_open)
-        file_menu.add_command(label="Save", command=self._menu_save)
-        file_menu.add_separator()
-        file_menu.add_command(label="Import JSON…", command=self._menu_import)
-        file_menu.add_command(label="Export JSON…", command=self._menu_export)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self._on_close)
-
-        menubar.add_cascade(label="File", menu=file_menu)
-        self.root.config(menu=menubar)
+        cmd = self.root.register
+        self.root.tk.eval(
+            "menu .menubar\n"
+            "menu .menubar.file -tearoff 0\n"
+            f".menubar.file add command -label {{Open…}} -command {cmd(self._menu_open)}\n"
+            f".menubar.file add command -label {{Save}} -command {cmd(self._menu_save)}\n"
+            ".menubar.file add separator\n"
+            f".menubar.file add command -label {{Import JSON…}} -command {cmd(self._menu_import)}\n"
+            f".menubar.file add command -label {{Export JSON…}} -command {cmd(self._menu_export)}\n"
+            ".menubar.file add separator\n"
+            f".menubar.file add command -label {{Exit}} -command {cmd(self._on_close)}\n"
+            ".menubar add cascade -label {File} -menu .menubar.file\n"
+            ". configure -menu .menubar\n"
+        )
 
     def _build_layout(self) -> None:
         outer = ttk.Frame(self.root, padding=14)
@@ -82,14 +111,19 @@ class ShopListApp:
         self.tree.column("notes", width=260, anchor=tk.W)
         self.tree.column("purchased", width=60, anchor=tk.CENTER)
 
-        yscroll = ttk.Scrollbar(left, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=yscroll.set)
+        self.yscroll = ttk.Scrollbar(left, orient=tk.VERTICAL, command=self._on_yview)
 
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        yscroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.yscroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self._prime_row_pool()
 
         self.tree.bind("<<TreeviewSelect>>", self._on_select)
         self.tree.bind("<Double-1>", self._on_double_click)
+        self.tree.bind("<Configure>", self._on_tree_configure)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", self._on_mousewheel)
+        self.tree.bind("<Button-5>", self._on_mousewheel)
 
         # Right: editor
         right = ttk.Frame(body, padding=(14, 0, 0, 0))
@@ -108,6 +142,10 @@ class ShopListApp:
         self.name_entry = ttk.Entry(editor, width=34, textvariable=self.name_var)
         self.qty_entry = ttk.Entry(editor, width=12, textvariable=self.qty_var)
         self.notes_text = tk.Text(editor, width=34, height=6, wrap="word")
+        # Python-side copy of the notes; only re-read from Tk after the user edits it.
+        self._notes_cache = ""
+        self._notes_stale = False
+        self.notes_text.bind("<<Modified>>", self._on_notes_modified)
 
         self.name_entry.grid(row=0, column=1, sticky=tk.W, padx=10, pady=(10, 4))
         self.qty_entry.grid(row=1, column=1, sticky=tk.W, padx=10, pady=4)
@@ -140,9 +178,13 @@ class ShopListApp:
 
     # ---- Persistence
     def _load_from_disk(self, path: Path) -> None:
+        # Pending edits belong to the current file; write them before switching.
+        if self._save_after_id is not None:
+            self._flush_save()
         try:
             self.items = load_items(path)
             self.data_path = path
+            self._dirty = False
             self.path_label.config(text=str(self.data_path))
             self._refresh_tree()
             self._set_status(f"Loaded {len(self.items)} item(s)")
@@ -150,29 +192,107 @@ class ShopListApp:
             messagebox.showerror("Load failed", str(e))
 
     def _save_to_disk(self) -> None:
+        if not self._dirty:
+            return
         try:
             save_items(self.data_path, self.items)
+            self._dirty = False
             self._set_status("Saved")
         except Exception as e:
             messagebox.showerror("Save failed", str(e))
 
+    def _schedule_save(self) -> None:
+        # Every mutation goes through here, so this is also where the list becomes dirty.
+        self._dirty = True
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(_SAVE_DELAY_MS, self._flush_save)
+
+    def _flush_save(self) -> None:
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        self._save_to_disk()
+
     # ---- UI helpers
     def _set_status(self, text: str) -> None:
         self.status_var.set(text)
 
     def _refresh_tree(self) -> None:
-        self.tree.delete(*self.tree.get_children())
-        for item in self.items:
-            done = "✓" if item.purchased else ""
-            self.tree.insert("", tk.END, iid=item.id, values=(item.name, item.qty, item.notes, done))
+        self._by_id = {it.id: it for it in self.items}
+        self._view_start = 0
+        self._render_rows()
 
         self._clear_editor(keep_selection=False)
 
+    def _prime_row_pool(self) -> None:
+        # Create the default pool up front; reloads then only rewrite values.
+        rows = tuple((f"row{i}",) for i in range(_DEFAULT_VISIBLE_ROWS))
+        self.tree.tk.call("apply", _SYNC_ROWS_LAMBDA, str(self.tree), rows)
+        self.tree.detach(*self.tree.get_children())
+
+    def _visible_rows(self) -> int:
+        height = self.tree.winfo_height()
+        if height <= 1:
+            return _DEFAULT_VISIBLE_ROWS
+
+        bbox = self.tree.bbox("row0") if self.tree.exists("row0") else ""
+        if bbox:
+            top, row_h = bbox[1], bbox[3]
+        else:
+            top, row_h = _DEFAULT_HEADING_HEIGHT, _DEFAULT_ROW_HEIGHT
+        return max(1, (height - top) // max(1, row_h))
+
+    def _render_rows(self) -> None:
+        total = len(self.items)
+        capacity = self._visible_rows()
+        self._view_start = max(0, min(self._view_start, total - capacity))
+        window = self.items[self._view_start : self._view_start + capacity]
+
+        rows = tuple((f"row{i}", *self._row_values(item)) for i, item in enumerate(window))
+        if rows:
+            self.tree.tk.call("apply", _SYNC_ROWS_LAMBDA, str(self.tree), rows)
+        # Rows past the window stay in the pool (detached) so their iids are reused.
+        extra = self.tree.get_children()[len(window):]
+        if extra:
+            self.tree.detach(*extra)
+
+        self._row_items = {f"row{i}": item for i, item in enumerate(window)}
+        self._row_of = {item.id: iid for iid, item in self._row_items.items()}
+
+        selected_row = self._row_of.get(self.selected_id or "")
+        current = self.tree.selection()
+        if selected_row and current != (selected_row,):
+            self.tree.selection_set(selected_row)
+        elif not selected_row and current:
+            self.tree.selection_remove(*current)
+
+        self._update_scrollbar()
+
+    @staticmethod
+    def _row_values(item: ShoppingItem) -> tuple[str, str, str, str]:
+        done = "✓" if item.purchased else ""
+        return (item.name, item.qty, item.notes, done)
+
+    # In-place repaint for edits that keep the list's shape; adds and deletes
+    # shift the visible window, so they re-render it with _render_rows.
+    def _update_row(self, item: ShoppingItem) -> None:
+        iid = self._row_of.get(item.id)
+        if iid:
+            self.tree.item(iid, values=self._row_values(item))
+
+    def _update_scrollbar(self) -> None:
+        total = len(self.items)
+        if total:
+            self.yscroll.set(self._view_start / total, (self._view_start + len(self._row_items)) / total)
+        else:
+            self.yscroll.set(0.0, 1.0)
+
     def _clear_editor(self, keep_selection: bool) -> None:
         self.selected_id = None
         self.name_var.set("")
         self.qty_var.set("1")
-        self.notes_text.delete("1.0", tk.END)
+        self._set_notes("")
         self.update_btn.config(state=tk.DISABLED)
         self.delete_btn.config(state=tk.DISABLED)
         self.toggle_btn.config(state=tk.DISABLED)
@@ -181,42 +301,103 @@ class ShopListApp:
                 self.tree.selection_remove(sel)
 
     def _get_notes(self) -> str:
-        return self.notes_text.get("1.0", tk.END).strip()
+        if self._notes_stale:
+            self._notes_cache = self.notes_text.get("1.0", "end-1c")
+            self._notes_stale = False
+        return self._notes_cache.strip()
+
+    def _set_notes(self, text: str) -> None:
+        self.notes_text.delete("1.0", tk.END)
+        if text:
+            self.notes_text.insert("1.0", text)
+        # Reset the flag so the queued <<Modified>> from this change is ignored.
+        self.notes_text.edit_modified(False)
+        self._notes_cache = text
+        self._notes_stale = False
 
     def _find_item(self, item_id: str) -> ShoppingItem | None:
-        for it in self.items:
-            if it.id == item_id:
-                return it
-        return None
+        return self._by_id.get(item_id)
+
+    def _index_of(self, item: ShoppingItem) -> int:
+        # A visible row knows its list position, so avoid scanning (and list.remove's
+        # field-by-field dataclass __eq__) for the common case of editing the selection.
+        iid = self._row_of.get(item.id)
+        if iid is not None:
+            pos = self._view_start + int(iid[3:])
+            if pos < len(self.items) and self.items[pos] is item:
+                return pos
+        return next(i for i, x in enumerate(self.items) if x is item)
 
     # ---- Events
     def _on_select(self, _evt: object) -> None:
         selection = self.tree.selection()
         if not selection:
-            self._clear_editor(keep_selection=True)
+            # Rows are recycled while scrolling, so an empty selection only means the
+            # selected item left the viewport; explicit clears go through _clear_editor.
             return
 
-        item_id = selection[0]
-        it = self._find_item(item_id)
+        it = self._row_items.get(selection[0])
         if not it:
             self._clear_editor(keep_selection=True)
             return
+        if it.id == self.selected_id:
+            return
 
-        self.selected_id = item_id
+        self.selected_id = it.id
         self.name_var.set(it.name)
         self.qty_var.set(it.qty)
-        self.notes_text.delete("1.0", tk.END)
-        self.notes_text.insert("1.0", it.notes)
+        self._set_notes(it.notes)
 
         self.update_btn.config(state=tk.NORMAL)
         self.delete_btn.config(state=tk.NORMAL)
         self.toggle_btn.config(state=tk.NORMAL)
 
+    def _on_notes_modified(self, _evt: object) -> None:
+        # Fires when the modified flag flips either way; only a set flag means a user edit.
+        if self.notes_text.edit_modified():
+            self._notes_stale = True
+            self.notes_text.edit_modified(False)
+
     def _on_double_click(self, _evt: object) -> None:
         # Double-click toggles completion
         if self.tree.selection():
             self._toggle_done()
 
+    def _on_tree_configure(self, evt: tk.Event) -> None:
+        # Width changes don't affect how many rows fit, and a drag-resize fires a
+        # stream of events: re-render once per idle pass, only when height changed.
+        if evt.height == self._tree_height:
+            return
+        self._tree_height = evt.height
+        if self._render_after_id is None:
+            self._render_after_id = self.root.after_idle(self._render_rows_idle)
+
+    def _render_rows_idle(self) -> None:
+        self._render_after_id = None
+        self._render_rows()
+
+    def _on_yview(self, *args: str) -> None:
+        if not args:
+            return
+        if args[0] == tk.MOVETO:
+            start = int(float(args[1]) * len(self.items))
+        elif args[0] == tk.SCROLL:
+            step = int(args[1])
+            if args[2] == tk.PAGES:
+                step *= max(1, len(self._row_items))
+            start = self._view_start + step
+        else:
+            return
+
+        if start != self._view_start:
+            self._view_start = start
+            self._render_rows()
+
+    def _on_mousewheel(self, evt: tk.Event) -> str:
+        up = evt.num == 4 or evt.delta > 0
+        self._on_yview(tk.SCROLL, str(-_WHEEL_STEP if up else _WHEEL_STEP), tk.UNITS)
+        return "break"
+
     # ---- Commands
     def _add_item(self) -> None:
         name = self.name_var.get().strip()
@@ -226,8 +407,10 @@ class ShopListApp:
 
         item = ShoppingItem.new(name=name, qty=self.qty_var.get(), notes=self._get_notes())
         self.items.append(item)
-        self._refresh_tree()
-        self._save_to_disk()
+        self._by_id[item.id] = item
+        self._render_rows()
+        self._clear_editor(keep_selection=False)
+        self._schedule_save()
         self._set_status("Added")
 
     def _update_item(self) -> None:
@@ -247,8 +430,9 @@ class ShopListApp:
         it.notes = self._get_notes()
         it.touch()
 
-        self._refresh_tree()
-        self._save_to_disk()
+        self._update_row(it)
+        self._clear_editor(keep_selection=False)
+        self._schedule_save()
         self._set_status("Updated")
 
     def _delete_item(self) -> None:
@@ -262,33 +446,34 @@ class ShopListApp:
         if not messagebox.askyesno("Delete item", f"Delete '{it.name}'?"):
             return
 
-        self.items = [x for x in self.items if x.id != self.selected_id]
-        self._refresh_tree()
-        self._save_to_disk()
+        self._by_id.pop(it.id, None)
+        del self.items[self._index_of(it)]
+        self._render_rows()
+        self._clear_editor(keep_selection=False)
+        self._schedule_save()
         self._set_status("Deleted")
 
     def _toggle_done(self) -> None:
-        selection = self.tree.selection()
-        if not selection:
+        if not self.selected_id:
             return
-
-        item_id = selection[0]
-        it = self._find_item(item_id)
+        it = self._find_item(self.selected_id)
         if not it:
             return
 
         it.purchased = not it.purchased
         it.touch()
-        self._refresh_tree()
-        self._save_to_disk()
+        # Only the Done column changed: repaint that row and leave the selection
+        # and editor (which don't show purchase state) as they are.
+        self._update_row(it)
+        self._schedule_save()
         self._set_status("Toggled")
 
     def _clear_completed(self) -> None:
         before = len(self.items)
-        self.items = [x for x in self.items if not x.purchased]
+        self.items[:] = [x for x in self.items if not x.purchased]
         removed = before - len(self.items)
         self._refresh_tree()
-        self._save_to_disk()
+        self._schedule_save()
         self._set_status(f"Cleared {removed} completed")
 
     def _clear_all(self) -> None:
@@ -296,9 +481,9 @@ class ShopListApp:
             return
         if not messagebox.askyesno("Clear all", "Remove all items?"):
             return
-        self.items = []
+        self.items.clear()
         self._refresh_tree()
-        self._save_to_disk()
+        self._schedule_save()
         self._set_status("Cleared all")
 
     # ---- Menu
@@ -312,7 +497,7 @@ class ShopListApp:
         self._load_from_disk(Path(path_str))
 
     def _menu_save(self) -> None:
-        self._save_to_disk()
+        self._flush_save()
 
     def _menu_export(self) -> None:
         path_str = filedialog.asksaveasfilename(
@@ -327,7 +512,7 @@ class ShopListApp:
             export_path = Path(path_str)
             payload = {
                 "version": 1,
-                "items": [asdict(i) for i in self.items],
+                "items": [item_to_dict(i) for i in self.items],
             }
             export_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
             self._set_status("Exported")
@@ -356,14 +541,14 @@ class ShopListApp:
 
             self.items = import_items
             self._refresh_tree()
-            self._save_to_disk()
+            self._schedule_save()
             self._set_status("Imported")
         except Exception as e:
             messagebox.showerror("Import failed", str(e))
 
     def _on_close(self) -> None:
         try:
-            self._save_to_disk()
+            self._flush_save()
         finally:
             self.root.destroy()
 
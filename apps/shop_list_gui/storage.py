@@ -3,18 +3,23 @@ from __future__ import annotations
 import json
 import os
 import tempfile
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable
 from uuid import uuid4
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is the fallback
+    orjson = None
+
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class ShoppingItem:
     id: str
     name: str
@@ -41,6 +46,19 @@ class ShoppingItem:
         self.updated_at = _utc_now_iso()
 
 
+def item_to_dict(item: ShoppingItem) -> dict[str, Any]:
+    # Plain field copy; dataclasses.asdict deep-copies every value.
+    return {
+        "id": item.id,
+        "name": item.name,
+        "qty": item.qty,
+        "notes": item.notes,
+        "purchased": item.purchased,
+        "created_at": item.created_at,
+        "updated_at": item.updated_at,
+    }
+
+
 def default_data_path(app_name: str = "AuraShopList") -> Path:
     appdata = os.environ.get("APPDATA")
     if appdata:
@@ -53,27 +71,38 @@ def default_data_path(app_name: str = "AuraShopList") -> Path:
     return folder / "shopping_list.json"
 
 
-def _coerce_item(obj: dict[str, Any]) -> ShoppingItem:
+def _coerce_item(obj: Any) -> ShoppingItem | None:
+    # Hot path on load: bail out early on junk and construct positionally.
+    if not isinstance(obj, dict):
+        return None
+    get = obj.get
+    name = str(get("name") or "").strip()
+    if not name:
+        return None
     return ShoppingItem(
-        id=str(obj.get("id") or uuid4()),
-        name=str(obj.get("name") or "").strip(),
-        qty=str(obj.get("qty") or "1"),
-        notes=str(obj.get("notes") or ""),
-        purchased=bool(obj.get("purchased") or False),
-        created_at=str(obj.get("created_at") or ""),
-        updated_at=str(obj.get("updated_at") or ""),
+        str(get("id") or uuid4()),
+        name,
+        str(get("qty") or "1"),
+        str(get("notes") or ""),
+        bool(get("purchased")),
+        str(get("created_at") or ""),
+        str(get("updated_at") or ""),
     )
 
 
 def load_items(path: Path) -> list[ShoppingItem]:
-    if not path.exists():
+    try:
+        with path.open("rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
         return []
 
-    raw = path.read_text(encoding="utf-8")
-    if not raw.strip():
+    # Parse the bytes directly: both parsers decode UTF-8 themselves, so no
+    # intermediate str copy of the whole file is needed.
+    if not raw or raw.isspace():
         return []
 
-    data = json.loads(raw)
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     if isinstance(data, dict) and isinstance(data.get("items"), list):
         items = data["items"]
@@ -82,14 +111,7 @@ def load_items(path: Path) -> list[ShoppingItem]:
     else:
         raise ValueError("Invalid shopping list format")
 
-    result: list[ShoppingItem] = []
-    for it in items:
-        if isinstance(it, dict):
-            item = _coerce_item(it)
-            if item.name:
-                result.append(item)
-
-    return result
+    return [item for item in map(_coerce_item, items) if item is not None]
 
 
 def save_items(path: Path, items: Iterable[ShoppingItem]) -> None:
@@ -97,19 +119,25 @@ def save_items(path: Path, items: Iterable[ShoppingItem]) -> None:
     payload = {
         "version": 1,
         "updated_at": _utc_now_iso(),
-        "items": [asdict(i) for i in items],
+        "items": list(items) if orjson is not None else [item_to_dict(i) for i in items],
     }
 
     # atomic-ish save for Windows: write to temp then replace
     fd, tmp_name = tempfile.mkstemp(prefix=path.stem + "_", suffix=path.suffix, dir=str(path.parent))
     try:
-        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        # Serialize up front so the file gets one large write instead of many small ones.
+        if orjson is not None:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS)
+        else:
+            data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
 
         os.replace(tmp_name, path)
     finally:
+        # Normally already renamed away; one unlink attempt beats exists() + remove().
         try:
-            if os.path.exists(tmp_name):
-                os.remove(tmp_name)
+            os.remove(tmp_name)
         except OSError:
             pass
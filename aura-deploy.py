@@ -18,13 +18,19 @@ Usage:
 """
 
 import argparse
+import json
 import os
 import sys
 import platform
+import shutil
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+
+# Successful prerequisite checks are reused for this long (seconds).
+PREREQ_CACHE_TTL = 24 * 60 * 60
 
 
 class AuraDeploymentSystem:
@@ -36,6 +42,7 @@ class AuraDeploymentSystem:
         self.python_script = Path(__file__).parent / "sdk" / "android" / "aura_apk.py"
         self.ps_script = Path(__file__).parent / "sdk" / "android" / "aura-apk-emulator.ps1"
         self.os_name = platform.system()
+        self.prereq_cache = Path.home() / ".aura" / "prereq_cache.json"
     
     def print_banner(self):
         """Display startup banner."""
@@ -50,15 +57,81 @@ class AuraDeploymentSystem:
 ╚══════════════════════════════════════════════════════════════╝
         """)
     
-    def check_prerequisites(self) -> Tuple[bool, str]:
+    def check_prerequisites(self, use_cache: bool = True) -> Tuple[bool, str]:
         """Check if system has required tools."""
-        checks = []
-        
         # Check Windows/PowerShell
         if self.os_name != "Windows":
             return False, f"Currently requires Windows (detected: {self.os_name})"
         
-        # Check PowerShell
+        if use_cache:
+            cached = self._load_prereq_cache()
+            if cached is not None:
+                print("\nSystem Prerequisites (cached, use --recheck to refresh):")
+                for check in cached:
+                    print(f"  {check}")
+                return True, ""
+        
+        # The probes are independent process spawns, so run them concurrently
+        # and report in a fixed order.
+        probes = [self._probe_powershell, self._probe_python, self._probe_git, self._probe_java]
+        with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+            results = list(pool.map(lambda probe: probe(), probes))
+        
+        checks = []
+        for check, error in results:
+            if check:
+                checks.append(check)
+            if error:
+                return False, error
+        
+        # Print checks
+        print("\nSystem Prerequisites:")
+        for check in checks:
+            print(f"  {check}")
+        
+        self._save_prereq_cache(checks)
+        return True, ""
+    
+    def _prereq_fingerprint(self) -> dict:
+        """Cheap facts that invalidate the prerequisite cache when they change."""
+        fingerprint = {"python": sys.version}
+        for tool in ("powershell", "java"):
+            exe = shutil.which(tool)
+            try:
+                fingerprint[tool] = [exe, os.stat(exe).st_mtime] if exe else None
+            except OSError:
+                fingerprint[tool] = None
+        return fingerprint
+    
+    def _load_prereq_cache(self) -> Optional[List[str]]:
+        """Return cached check lines if still valid, else None."""
+        try:
+            cache = json.loads(self.prereq_cache.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(cache, dict) or time.time() - cache.get("ts", 0) > PREREQ_CACHE_TTL:
+            return None
+        if cache.get("fingerprint") != self._prereq_fingerprint():
+            return None
+        checks = cache.get("checks")
+        return checks if isinstance(checks, list) else None
+    
+    def _save_prereq_cache(self, checks: List[str]) -> None:
+        """Remember a successful prerequisite check."""
+        cache = {
+            "ts": time.time(),
+            "fingerprint": self._prereq_fingerprint(),
+            "checks": checks,
+        }
+        try:
+            self.prereq_cache.parent.mkdir(parents=True, exist_ok=True)
+            self.prereq_cache.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+        except OSError:
+            pass
+    
+    def _probe_powershell(self) -> Tuple[str, Optional[str]]:
+        """Check PowerShell. Returns (check line, error or None)."""
         try:
             result = subprocess.run(
                 ["powershell", "-Version"],
@@ -67,24 +140,25 @@ class AuraDeploymentSystem:
                 timeout=5
             )
             if result.returncode == 0:
-                checks.append("✓ PowerShell available")
-            else:
-                checks.append("✗ PowerShell not working properly")
-                return False, "PowerShell 5.1+ required"
-        except:
-            return False, "PowerShell not found"
-        
-        # Check Python
-        checks.append(f"✓ Python {sys.version.split()[0]}")
-        
-        # Check Git (optional but useful)
+                return "✓ PowerShell available", None
+            return "✗ PowerShell not working properly", "PowerShell 5.1+ required"
+        except Exception:
+            return "", "PowerShell not found"
+    
+    def _probe_python(self) -> Tuple[str, Optional[str]]:
+        """Report the running Python."""
+        return f"✓ Python {sys.version.split()[0]}", None
+    
+    def _probe_git(self) -> Tuple[str, Optional[str]]:
+        """Check Git (optional but useful)."""
         try:
             subprocess.run(["git", "--version"], capture_output=True, timeout=2)
-            checks.append("✓ Git available")
-        except:
-            checks.append("ℹ Git not found (optional)")
-        
-        # Check Java
+            return "✓ Git available", None
+        except Exception:
+            return "ℹ Git not found (optional)", None
+    
+    def _probe_java(self) -> Tuple[str, Optional[str]]:
+        """Check Java."""
         try:
             result = subprocess.run(
                 ["java", "-version"],
@@ -94,23 +168,14 @@ class AuraDeploymentSystem:
             )
             if result.returncode == 0:
                 version = result.stderr.split('\n')[0]
-                checks.append(f"✓ Java found ({version})")
-            else:
-                return False, "Java 17+ not working"
-        except:
-            checks.append("✗ Java not found (REQUIRED)")
-            return False, (
+                return f"✓ Java found ({version})", None
+            return "", "Java 17+ not working"
+        except Exception:
+            return "✗ Java not found (REQUIRED)", (
                 "Java 17+ is required.\n"
                 "Download from: https://adoptium.net/\n"
                 "Then retry this script."
             )
-        
-        # Print checks
-        print("\nSystem Prerequisites:")
-        for check in checks:
-            print(f"  {check}")
-        
-        return True, ""
     
     def interactive_setup(self) -> bool:
         """Interactive setup wizard."""
@@ -234,12 +299,12 @@ For more info: cat sdk/android/README.md
             print(f"Error: {e}")
             return False
     
-    def run(self, source: Optional[str] = None, interactive: bool = True):
+    def run(self, source: Optional[str] = None, interactive: bool = True, recheck: bool = False):
         """Main entry point."""
         self.print_banner()
         
         # Check prerequisites
-        ok, msg = self.check_prerequisites()
+        ok, msg = self.check_prerequisites(use_cache=not recheck)
         if not ok:
             print(f"\n✗ Error: {msg}")
             return 1
@@ -293,13 +358,19 @@ Examples:
         help="Check system status and prerequisites"
     )
     
+    parser.add_argument(
+        "--recheck",
+        action="store_true",
+        help="Ignore cached prerequisite results and probe again"
+    )
+    
     args = parser.parse_args()
     
     system = AuraDeploymentSystem()
     
     if args.status:
         system.print_banner()
-        ok, msg = system.check_prerequisites()
+        ok, msg = system.check_prerequisites(use_cache=False)
         if not ok:
             print(f"\n✗ Error: {msg}")
             return 1
@@ -308,7 +379,8 @@ Examples:
     
     return system.run(
         source=args.source,
-        interactive=not args.non_interactive
+        interactive=not args.non_interactive,
+        recheck=args.recheck
     )
 
 
@@ -5,22 +5,60 @@ Downloads Gradle, generates wrapper files, and builds APK
 No Java or Gradle pre-installation required
 """
 
+import argparse
+import hashlib
 import os
+import signal
 import sys
 import subprocess
 import shutil
+import threading
 import zipfile
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import libarchive  # libarchive-c: inflates in C without holding the GIL
+except (ImportError, OSError):  # optional; OSError when the C library is missing
+    libarchive = None
+
+# Read size for streaming the Gradle download; one progress update per chunk.
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Published SHA-256 of gradle-<version>-bin.zip (services.gradle.org/distributions/*.sha256)
+GRADLE_SHA256 = {
+    "8.6": "9631d53cf3e74bfa726893aee1f8994fee4e060c401335946dba2156f440f24c",
+}
+
+
+def sha256_file(path: Path) -> str:
+    """Hash a file in 1 MiB chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 class AndroidBuilder:
-    def __init__(self):
+    def __init__(self, dev: bool = False):
+        # dev: repeated local rebuilds, worth paying for Gradle's configuration cache
+        self.dev = dev
         self.repo_root = Path(__file__).parent.resolve()
         self.gradle_version = "8.6"
         self.gradle_home = self.repo_root / "gradle" / f"gradle-{self.gradle_version}"
+        self.gradle_bin = self.gradle_home / "bin" / ("gradle.bat" if os.name == "nt" else "gradle")
         self.sample_project = self.repo_root / "samples" / "android" / "AuraSentinelSample"
-        self.gradle_zip = self.repo_root / f"gradle-wrapper-{self.gradle_version}.zip"
+        self.apk_outputs = self.sample_project / "app" / "build" / "outputs" / "apk"
+        # The downloaded archive lives in a per-user cache shared across clones and CI runs
+        self.cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "aura"
+        self.gradle_zip = self.cache_dir / f"gradle-{self.gradle_version}-bin.zip"
+        self.cpu_count = os.cpu_count() or 1
+        self._downloaded_sha = None
+        self.dist_android = self.repo_root / "dist-release" / "android"
+        self._log_lock = threading.Lock()
         
     def log(self, message: str, level: str = "INFO"):
         """Log a message"""
@@ -35,7 +73,8 @@ class AndroidBuilder:
         color = colors.get(level, colors["INFO"])
         reset = colors["RESET"]
         prefix = f"[{timestamp}] [{level}]"
-        print(f"{color}{prefix}{reset} {message}")
+        with self._log_lock:
+            print(f"{color}{prefix}{reset} {message}")
     
     def download_gradle(self) -> bool:
         """Download Gradle binary distribution"""
@@ -43,24 +82,54 @@ class AndroidBuilder:
             self.log(f"✓ Gradle {self.gradle_version} already present", level="SUCCESS")
             return True
         
+        expected_sha = GRADLE_SHA256.get(self.gradle_version)
+        if self.gradle_zip.exists():
+            if expected_sha is None or sha256_file(self.gradle_zip) == expected_sha:
+                self.log(f"✓ Using cached {self.gradle_zip}", level="SUCCESS")
+                return True
+            self.log("Cached Gradle archive failed checksum, downloading again", level="WARN")
+            self.gradle_zip.unlink()
+        
         gradle_url = f"https://services.gradle.org/distributions/gradle-{self.gradle_version}-bin.zip"
         self.log(f"Downloading Gradle {self.gradle_version}...")
         self.log(f"URL: {gradle_url}")
         
+        # Download next to the cache entry and rename once verified, so an
+        # interrupted download never looks like a cached archive
+        partial_zip = self.gradle_zip.with_name(self.gradle_zip.name + ".part")
         try:
-            # Download with progress callback
-            def download_progress(block_num, block_size, total_size):
-                downloaded = block_num * block_size
-                if total_size > 0:
-                    percent = min(downloaded * 100 // total_size, 100)
-                    mb_downloaded = downloaded / (1024 * 1024)
-                    mb_total = total_size / (1024 * 1024)
-                    print(f"\r  Progress: {percent}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)", end="", flush=True)
-            
-            urllib.request.urlretrieve(gradle_url, self.gradle_zip, download_progress)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Stream in 1 MiB chunks and report progress once per MB
+            request = urllib.request.Request(gradle_url, headers={"Accept-Encoding": "identity"})
+            with urllib.request.urlopen(request) as response, open(partial_zip, "wb") as out:
+                total_size = response.length or 0
+                downloaded = 0
+                # Hash while writing so verification doesn't re-read the archive
+                digest = hashlib.sha256()
+                while True:
+                    chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    out.write(chunk)
+                    digest.update(chunk)
+                    downloaded += len(chunk)
+                    if total_size > 0:
+                        percent = min(downloaded * 100 // total_size, 100)
+                        mb_downloaded = downloaded / (1024 * 1024)
+                        mb_total = total_size / (1024 * 1024)
+                        print(f"\r  Progress: {percent}% ({mb_downloaded:.1f}/{mb_total:.1f} MB)", end="", flush=True)
             print()  # New line after progress
             
-            size_mb = self.gradle_zip.stat().st_size / (1024 * 1024)
+            self._downloaded_sha = digest.hexdigest()
+            if expected_sha is not None:
+                actual_sha = self._downloaded_sha
+                if actual_sha != expected_sha:
+                    partial_zip.unlink()
+                    self.log(f"✗ Checksum mismatch for Gradle download: {actual_sha}", level="ERROR")
+                    return False
+            os.replace(partial_zip, self.gradle_zip)
+            
+            size_mb = downloaded / (1024 * 1024)
             self.log(f"✓ Downloaded gradle-{self.gradle_version}-bin.zip ({size_mb:.1f} MB)", level="SUCCESS")
             return True
             
@@ -68,6 +137,30 @@ class AndroidBuilder:
             self.log(f"✗ Failed to download Gradle: {e}", level="ERROR")
             return False
     
+    def prepare_sample(self) -> bool:
+        """Local setup that does not depend on Gradle being downloaded"""
+        self.dist_android.mkdir(parents=True, exist_ok=True)
+        return True
+    
+    def download_and_prepare(self) -> bool:
+        """Download Gradle in the background while preparing the sample project"""
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            download = pool.submit(self.download_gradle)
+            prepared = self.prepare_sample()
+            return download.result() and prepared
+    
+    def ensure_gradle(self) -> bool:
+        """Make Gradle available, short-circuiting on an existing install"""
+        gradle_bin = self.gradle_bin
+        try:
+            os.stat(gradle_bin)
+        except FileNotFoundError:
+            return self.download_and_prepare() and self.extract_gradle() and self.verify_gradle()
+        
+        # Warm path: one stat instead of the per-step existence checks
+        self.log(f"✓ Gradle {self.gradle_version} already installed: {gradle_bin}", level="SUCCESS")
+        return self.prepare_sample()
+    
     def extract_gradle(self) -> bool:
         """Extract Gradle archive"""
         if self.gradle_home.exists():
@@ -84,33 +177,83 @@ class AndroidBuilder:
             extract_path = self.gradle_home.parent
             extract_path.mkdir(parents=True, exist_ok=True)
             
-            with zipfile.ZipFile(self.gradle_zip, 'r') as zip_ref:
-                zip_ref.extractall(extract_path)
+            if libarchive is not None:
+                self._extract_with_libarchive(extract_path)
+            else:
+                with zipfile.ZipFile(self.gradle_zip, 'r') as zip_ref:
+                    self._extract_zip(zip_ref, extract_path)
             
             self.log(f"✓ Gradle extracted successfully", level="SUCCESS")
             
             # Verify extraction
-            gradle_bin = self.gradle_home / "bin" / "gradle.bat"
+            gradle_bin = self.gradle_bin
             if not gradle_bin.exists():
                 self.log(f"✗ Gradle binary not found after extraction", level="ERROR")
                 return False
+            if os.name != "nt":
+                os.chmod(gradle_bin, 0o755)
             
-            # Clean up zip after successful extraction
-            try:
-                self.gradle_zip.unlink()
-                self.log(f"Cleaned up download archive", level="INFO")
-            except:
-                pass
-            
+            # The archive stays in the cache for other clones and later runs
             return True
             
         except Exception as e:
             self.log(f"✗ Failed to extract Gradle: {e}", level="ERROR")
             return False
     
+    def _gradle_env(self) -> dict:
+        """Environment for Gradle invocations"""
+        env = os.environ.copy()
+        env['GRADLE_HOME'] = str(self.gradle_home)
+        return env
+    
+    def _extract_zip(self, zip_ref: zipfile.ZipFile, extract_path: Path) -> None:
+        """Extract all members with large copy buffers, keeping Unix mode bits"""
+        root = extract_path.resolve()
+        for info in zip_ref.infolist():
+            target = (extract_path / info.filename).resolve()
+            if root not in target.parents and target != root:
+                raise ValueError(f"Unsafe path in archive: {info.filename}")
+            
+            if info.is_dir():
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if info.file_size == 0:
+                target.touch()
+            else:
+                with zip_ref.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, min(info.file_size, 1 << 20))
+            
+            mode = (info.external_attr >> 16) & 0o777
+            if mode:
+                os.chmod(target, mode)
+    
+    def _extract_with_libarchive(self, extract_path: Path) -> None:
+        """Extract the Gradle archive through libarchive"""
+        root = extract_path.resolve()
+        with libarchive.file_reader(str(self.gradle_zip)) as archive:
+            for entry in archive:
+                target = (extract_path / entry.pathname).resolve()
+                if root not in target.parents and target != root:
+                    raise ValueError(f"Unsafe path in archive: {entry.pathname}")
+                
+                if entry.isdir:
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+                if not entry.isreg:
+                    continue
+                
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with open(target, "wb") as dst:
+                    for block in entry.get_blocks(1 << 20):
+                        dst.write(block)
+                if entry.perm:
+                    os.chmod(target, entry.perm)
+    
     def verify_gradle(self) -> bool:
         """Verify Gradle installation"""
-        gradle_bin = self.gradle_home / "bin" / "gradle.bat"
+        gradle_bin = self.gradle_bin
         
         if not gradle_bin.exists():
             self.log(f"✗ Gradle binary not found: {gradle_bin}", level="ERROR")
@@ -123,7 +266,7 @@ class AndroidBuilder:
         """Build APK using Gradle"""
         self.log("Building Android APK...")
         
-        gradle_bin = self.gradle_home / "bin" / "gradle.bat"
+        gradle_bin = self.gradle_bin
         
         if not gradle_bin.exists():
             self.log(f"✗ Gradle binary not found", level="ERROR")
@@ -131,47 +274,37 @@ class AndroidBuilder:
         
         try:
             # Set GRADLE_HOME environment variable
-            env = os.environ.copy()
-            env['GRADLE_HOME'] = str(self.gradle_home)
+            env = self._gradle_env()
             
-            self.log(f"Running: {gradle_bin} assembleDebug", level="INFO")
             
-            result = subprocess.run(
-                [str(gradle_bin), "assembleDebug"],
-                cwd=self.sample_project,
-                capture_output=True,
-                text=True,
-                timeout=900,  # 15 minutes
-                env=env
-            )
+            # Daemon reuse skips JVM startup on rebuilds; the rest parallelizes and caches tasks
+            gradle_cmd = [
+                str(gradle_bin), "assembleDebug",
+                "--daemon", "--parallel", "--configure-on-demand", "--build-cache",
+                f"--max-workers={self.cpu_count}",
+            ]
+            if self.dev:
+                # Reuse the configured task graph and watch the file system between builds;
+                # one-shot CI builds would only pay for writing the cache
+                gradle_cmd += ["--configuration-cache", "--watch-fs"]
+            self.log(f"Running: {' '.join(gradle_cmd)}", level="INFO")
             
-            # Print full output for debugging
-            if result.stdout:
-                print(result.stdout)
+            returncode = self._run_streaming(gradle_cmd, cwd=self.sample_project, env=env, timeout=900)  # 15 minutes
             
-            if result.returncode != 0:
-                self.log(f"✗ APK build failed (exit code {result.returncode})", level="ERROR")
-                if result.stderr:
-                    print(result.stderr)
+            if returncode != 0:
+                self.log(f"✗ APK build failed (exit code {returncode})", level="ERROR")
                 return False
             
             self.log("✓ APK build completed", level="SUCCESS")
             
             # Verify APK exists
-            apk_path = self.sample_project / "app" / "build" / "outputs" / "apk" / "debug" / "app-debug.apk"
-            if apk_path.exists():
+            apk_path = self.find_apk()
+            if apk_path is not None:
                 size_mb = apk_path.stat().st_size / (1024 * 1024)
-                self.log(f"✓ APK created: app-debug.apk ({size_mb:.1f} MB)", level="SUCCESS")
+                self.log(f"✓ APK created: {apk_path.name} ({size_mb:.1f} MB)", level="SUCCESS")
                 return True
-            else:
-                self.log(f"✗ APK not found at: {apk_path}", level="WARN")
-                # Check for release APK
-                release_apk = self.sample_project / "app" / "build" / "outputs" / "apk" / "release" / "app-release.apk"
-                if release_apk.exists():
-                    size_mb = release_apk.stat().st_size / (1024 * 1024)
-                    self.log(f"✓ Release APK found instead: app-release.apk ({size_mb:.1f} MB)", level="SUCCESS")
-                    return True
-                return False
+            self.log(f"✗ No APK found under: {self.apk_outputs}", level="WARN")
+            return False
                 
         except subprocess.TimeoutExpired:
             self.log(f"✗ APK build timed out (15 minutes)", level="ERROR")
@@ -180,25 +313,92 @@ class AndroidBuilder:
             self.log(f"✗ APK build failed: {e}", level="ERROR")
             return False
     
+    def find_apk(self):
+        """Return the most recently built APK of any variant, or None"""
+        # One directory listing per variant instead of probing each expected file name
+        apks = list(self.apk_outputs.glob("*/*.apk"))
+        if not apks:
+            return None
+        return max(apks, key=lambda p: p.stat().st_mtime)
+    
+    @staticmethod
+    def _kill_tree(proc: subprocess.Popen) -> None:
+        """Kill proc and everything it started (best effort)."""
+        try:
+            if os.name == "nt":
+                subprocess.run(f"taskkill /T /F /PID {proc.pid}", capture_output=True)
+            else:
+                os.killpg(proc.pid, signal.SIGKILL)
+        except Exception:
+            proc.kill()
+    
+    def _run_streaming(self, cmd: list, cwd: Path, env: dict, timeout: int) -> int:
+        """Run a command, echoing its combined output line by line as it is produced.
+        
+        Nothing is buffered beyond the current line. Raises subprocess.TimeoutExpired
+        if the process is still running after `timeout` seconds. On timeout or any
+        exception (e.g. Ctrl-C) the whole process tree is killed: the JVM started by
+        the gradle launcher holds the output pipe open after the launcher exits.
+        """
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            bufsize=1,
+            env=env,
+            # Own process group so the launcher's children can be killed with it
+            start_new_session=os.name != "nt",
+        )
+        timed_out = threading.Event()
+        
+        def kill():
+            timed_out.set()
+            self._kill_tree(proc)
+        
+        watchdog = threading.Timer(timeout, kill)
+        watchdog.start()
+        try:
+            with proc.stdout:
+                for line in proc.stdout:
+                    sys.stdout.write(line)
+            returncode = proc.wait()
+        except BaseException:
+            self._kill_tree(proc)
+            proc.wait()
+            raise
+        finally:
+            watchdog.cancel()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return returncode
+    
     def copy_apk_to_dist(self) -> bool:
         """Copy APK to distribution directory"""
-        apk_src = self.sample_project / "app" / "build" / "outputs" / "apk" / "debug" / "app-debug.apk"
+        apk_src = self.find_apk()
         
-        # Try release APK if debug doesn't exist
-        if not apk_src.exists():
-            apk_src = self.sample_project / "app" / "build" / "outputs" / "apk" / "release" / "app-release.apk"
-        
-        if not apk_src.exists():
+        if apk_src is None:
             self.log(f"APK not found, skipping distribution copy", level="WARN")
             return True
         
-        dist_android = self.repo_root / "dist-release" / "android"
-        dist_android.mkdir(parents=True, exist_ok=True)
+        self.dist_android.mkdir(parents=True, exist_ok=True)
         
-        apk_dest = dist_android / apk_src.name
+        apk_dest = self.dist_android / apk_src.name
         
         try:
-            shutil.copy2(apk_src, apk_dest)
+            # dist-release is a publish target that is never edited in place, so a
+            # hardlink is enough; across devices copyfile uses the OS fast copy path
+            try:
+                apk_dest.unlink()
+            except FileNotFoundError:
+                pass
+            try:
+                os.link(apk_src, apk_dest)
+            except OSError:
+                shutil.copyfile(apk_src, apk_dest)
             size_mb = apk_dest.stat().st_size / (1024 * 1024)
             self.log(f"✓ APK copied to dist-release/android/ ({size_mb:.1f} MB)", level="SUCCESS")
             return True
@@ -214,9 +414,7 @@ class AndroidBuilder:
         self.log("")
         
         steps = [
-            ("Download Gradle", self.download_gradle),
-            ("Extract Gradle", self.extract_gradle),
-            ("Verify Gradle", self.verify_gradle),
+            ("Set Up Gradle", self.ensure_gradle),
             ("Build APK", self.build_apk),
             ("Copy to Distribution", self.copy_apk_to_dist),
         ]
@@ -259,7 +457,15 @@ class AndroidBuilder:
 
 def main():
     """Main entry point"""
-    builder = AndroidBuilder()
+    parser = argparse.ArgumentParser(description="Build the Aura Android sample APK")
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Enable Gradle configuration cache and file-system watching for fast rebuilds"
+    )
+    args = parser.parse_args()
+    
+    builder = AndroidBuilder(dev=args.dev)
     exit_code = builder.build()
     sys.exit(exit_code)
 
@@ -4,11 +4,69 @@ Aura Android - Complete Setup & Build (Post-Java Installation)
 Run this AFTER installing Java (Android Studio or JDK)
 """
 
+import hashlib
+import json
+import shutil
 import subprocess
 import sys
 import os
 from pathlib import Path
 
+JAVA_PROBE_CACHE = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "aura" / "java_probe.json"
+
+
+def _java_probe_key() -> str:
+    """Identify the Java that `java` resolves to without starting a JVM"""
+    java = shutil.which("java") or ""
+    try:
+        mtime = os.stat(java).st_mtime if java else 0
+    except OSError:
+        mtime = 0
+    raw = "\0".join([os.environ.get("JAVA_HOME", ""), os.environ.get("PATH", ""), java, str(mtime)])
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def load_java_probe():
+    """Return the cached `java -version` output if the environment hasn't changed"""
+    try:
+        cache = json.loads(JAVA_PROBE_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if isinstance(cache, dict) and cache.get("key") == _java_probe_key():
+        return cache.get("version")
+    return None
+
+
+def save_java_probe(version: str):
+    """Remember a successful `java -version` output"""
+    try:
+        JAVA_PROBE_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        JAVA_PROBE_CACHE.write_text(json.dumps({"key": _java_probe_key(), "version": version}), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def probe_java_version():
+    """Return `java -version` output, or None if java exits with an error.
+    
+    Raises FileNotFoundError when java is not on PATH.
+    """
+    version = load_java_probe()
+    if version is not None:
+        return version
+    
+    result = subprocess.run(
+        ["java", "-version"],
+        capture_output=True,
+        text=True,
+        timeout=10
+    )
+    if result.returncode != 0:
+        return None
+    save_java_probe(result.stderr)
+    return result.stderr
+
+
 def main():
     print("=" * 80)
     print("Aura Android - APK Build Pipeline")
@@ -18,15 +76,10 @@ def main():
     # Check Java is installed
     print("[*] Checking Java installation...")
     try:
-        result = subprocess.run(
-            ["java", "-version"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result.returncode == 0:
+        version = probe_java_version()
+        if version is not None:
             print("[OK] Java found:")
-            for line in result.stderr.split('\n')[:2]:
+            for line in version.split('\n')[:2]:
                 if line.strip():
                     print(f"     {line}")
         else:
@@ -43,15 +96,17 @@ def main():
     print("[*] Building complete release package...")
     print()
     
-    # Run build_release.py
-    script_path = Path(__file__).parent / "build_release.py"
+    # Run build_release.py in this interpreter rather than spawning a second one
+    from build_release import main as build_release_main
     
-    result = subprocess.run(
-        [sys.executable, str(script_path)],
-        cwd=Path(__file__).parent
-    )
+    previous_cwd = os.getcwd()
+    os.chdir(Path(__file__).parent)
+    try:
+        returncode = build_release_main([])
+    finally:
+        os.chdir(previous_cwd)
     
-    if result.returncode == 0:
+    if returncode == 0:
         print()
         print("=" * 80)
         print("[OK] Build completed successfully!")
@@ -68,11 +123,12 @@ def main():
             print(f"  - SDK: dist-release/sdk/")
             print(f"  - Documentation: dist-release/docs/")
             if (dist / "android").exists():
-                apk_files = list((dist / "android").glob("*.apk"))
-                if apk_files:
-                    for apk in apk_files:
-                        size_mb = apk.stat().st_size / (1024 * 1024)
-                        print(f"  - APK: dist-release/android/{apk.name} ({size_mb:.1f} MB)")
+                # DirEntry.stat() reuses data from the directory listing where the OS provides it
+                with os.scandir(dist / "android") as entries:
+                    apk_files = [(e.name, e.stat().st_size) for e in entries if e.name.endswith(".apk") and e.is_file()]
+                for name, size in apk_files:
+                    size_mb = size / (1024 * 1024)
+                    print(f"  - APK: dist-release/android/{name} ({size_mb:.1f} MB)")
         print()
         return 0
     else:
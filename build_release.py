@@ -18,10 +18,288 @@ import json
 import urllib.request
 import zipfile
 import re
+import signal
+import tempfile
+import time
 import argparse
+import hashlib
+import platform
+import threading
+from collections import defaultdict, deque
+from itertools import chain
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Tuple
+from typing import Any, Callable, Dict, Optional, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+DOWNLOAD_HEADERS = {
+    # Some CDNs block requests without a UA.
+    "User-Agent": "AuraBuild/1.0 (+https://example.invalid)",
+    "Accept": "*/*",
+}
+# Large toolchain archives are fetched as this many parallel byte ranges.
+DOWNLOAD_PARTS = 8
+MIN_RANGED_DOWNLOAD = 16 * 1024 * 1024
+# Many small copies are latency-bound; keep this many in flight at once.
+COPY_QUEUE_DEPTH = 32
+# Cap for the summary-parsing pool (keeps HDD-backed runners from thrashing).
+SUMMARY_WORKERS = 8
+# run_command keeps only this many trailing output lines for error reports.
+OUTPUT_TAIL_LINES = 200
+
+def _dump_json(obj: Any, pretty: bool = True) -> bytes:
+    """Serialize obj as JSON (indented unless pretty=False), using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# Android SDK bootstrap (mirrors the defaults of sdk/android/setup-android.ps1).
+ANDROID_CMDLINE_TOOLS_URL = "https://dl.google.com/android/repository/commandlinetools-win-11076708_latest.zip"
+ANDROID_NDK_VERSION = "26.1.10909125"
+ANDROID_SDK_PACKAGES = (
+    "platform-tools",
+    "platforms;android-34",
+    "build-tools;34.0.0",
+    f"ndk;{ANDROID_NDK_VERSION}",
+    "cmake;3.22.1",
+)
+
+APK_VARIANTS = frozenset({"debug", "release"})
+
+# Ordering constraints between step keys. A dependency only applies when both
+# steps are selected; everything else is free to run concurrently.
+STEP_DEPS: Dict[str, Tuple[str, ...]] = {
+    "apk": ("android",),
+    "apk-package": ("apk",),
+    "verify": ("core",),
+    "dist": ("core", "sentinel", "apk-package"),
+    "manifest": ("dist", "docs"),
+    "docs": ("reorg-root",),
+    "roadmap": ("reorg-root", "docs"),
+}
+
+
+# Dependency/build/output dirs never searched for markdown (very important on this repo).
+MD_EXCLUDED_DIRS = frozenset({
+    ".git",
+    ".github",
+    ".vscode",
+    ".tools",
+    "target",
+    "target-alt",
+    "target-lsp-test",
+    "target-lsp-tests",
+    "node_modules",
+    "dist",
+    "dist-release",
+    "dist-complete",
+    "build",
+    "vendor",
+    ".gradle",
+})
+
+# Markdown aggregation heuristics. Name patterns are matched against
+# upper-cased file names, so they need no IGNORECASE.
+UPDATE_KEYWORDS_RE = re.compile(r"(UPDATE|STATUS|REPORT|SUMMARY|COMPLETE|COMPLETION|RELEASE|ANNOUNCEMENT)")
+SUMMARY_NAME_RE = re.compile(
+    r"(SUMMARY|REPORT|STATUS|COMPLETE|COMPLETION|FINAL|RELEASE|DELIVERY|ANNOUNCEMENT|INDEX|GUIDE|CHECKLIST|DASHBOARD)"
+)
+YYYY_MM_DD_RE = re.compile(r"(20\d{2})[_-](\d{2})[_-](\d{2})")
+MONTH_YEAR_RE = re.compile(
+    r"(JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER)[-_ ](20\d{2})"
+)
+DATE_RE = re.compile(r"\*\*Date\*\*\s*:\s*(.+)$", re.IGNORECASE | re.MULTILINE)
+CREATED_RE = re.compile(r"\*\*Created\*\*\s*:\s*(.+)$", re.IGNORECASE | re.MULTILINE)
+STATUS_RE = re.compile(r"\*\*Status\*\*\s*:\s*(.+)$", re.IGNORECASE | re.MULTILINE)
+NEXT_RE = re.compile(r"\*\*Next\*\*\s*:\s*(.+)$", re.IGNORECASE | re.MULTILINE)
+META_RE = re.compile(r"\*\*(Date|Status|Next|Created)\*\*\s*:", re.IGNORECASE)
+
+# ROADMAP.md summary block markers.
+ROADMAP_MARKER_START = "<!-- ROADMAP_SUMMARY:START -->"
+ROADMAP_MARKER_END = "<!-- ROADMAP_SUMMARY:END -->"
+ROADMAP_SUMMARY_RE = re.compile(
+    re.escape(ROADMAP_MARKER_START) + r".*?" + re.escape(ROADMAP_MARKER_END) + r"\s*",
+    re.DOTALL,
+)
+# [ \t] rather than \s: \s would swallow the blank lines after the rule, so every
+# rewrite would move the insertion point and add another blank line.
+HR_RE = re.compile(r"^[ \t]*---[ \t]*$", re.MULTILINE)
+WS_RE = re.compile(r"\s*")
+# Inserted after the roadmap's Legend section; built once at import.
+ROADMAP_SUMMARY_BLOCK = "\n".join([
+    ROADMAP_MARKER_START,
+    '## Aura v1.0 ("Reliability") — Certainty without Sacrifice',
+    "",
+    "### Mission (מטרה)",
+    "",
+    "Aura exists to make **formal verification the default UX**: proofs stream in real time (target: sub-200ms feedback), failures are explainable, and trust boundaries are explicit.",
+    "",
+    "Aura is the “Third Way”: ",
+    "- C/Zig-level control and performance",
+    "- Rust-level safety with simpler day-to-day ergonomics (Region + Linear Types)",
+    "- Dafny/Lean-level certainty, without leaving production tooling behind",
+    "",
+    "### Feature Missions (Next) (משימות)",
+    "",
+    "- [ ] Z3 Gate proof streaming: keep verifier feedback under interactive latency (p95 < 200ms)",
+    "- [ ] High-speed Merkle caching: statement/function-level incremental proofs with stable keys",
+    "- [ ] Memory Model Option B: regions + linear ownership states (Owned / Borrowed / Consumed) codified end-to-end (typechecker + stdlib)",
+    "- [ ] Trusted Core boundary: generate + surface a Trusted Core Report (\"דוח ליבה מהימנה\") on every build",
+    "- [ ] Explain Engine (\"הסבר\"): unsat-core driven explanation + variable trace + concrete counterexample rendered in-editor",
+    "- [ ] Race-free concurrency: static happens-before + protection mapping to prevent data races and deadlocks by construction",
+    "- [ ] Differential backend testing: CI Trust Gate keeping Dev-VM and native backends behaviorally aligned",
+    "",
+    "### Past Accomplishments (הישגים)",
+    "",
+    "- [x] Explainable verification UX: typed counterexamples, variable traces, logic traces",
+    "- [x] Package Manager: aura-pkg v1.0 complete and production-tested",
+    "- [x] Deterministic release packaging and artifact manifests",
+    "",
+    "### Specs & Indices",
+    "",
+    "- v1.0 Reliability spec: [docs/v1.0-reliability.md](docs/v1.0-reliability.md)",
+    "- Release summaries overview: [dist-release/docs/SUMMARIES_OVERVIEW.md](dist-release/docs/SUMMARIES_OVERVIEW.md)",
+    "",
+    ROADMAP_MARKER_END,
+    "",
+])
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy file contents without a Python-level buffer, keeping the mtime.
+
+    Windows uses CopyFileW; Linux tries copy_file_range (a reflink on
+    filesystems that support it) and otherwise shutil.copyfile, which already
+    uses sendfile/fcopyfile where available.
+    """
+    if os.name == "nt":
+        import ctypes
+
+        if not ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            raise ctypes.WinError()
+        return  # CopyFileW preserves timestamps itself
+
+    st = os.stat(src)
+    copied = False
+    if hasattr(os, "copy_file_range") and st.st_size:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            try:
+                remaining = st.st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+                copied = remaining == 0
+            except OSError:
+                fdst.truncate(0)
+    if not copied:
+        shutil.copyfile(src, dst)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _move_tree(src: Path, dst: Path) -> None:
+    """Rename src to dst (a single metadata op on one volume), copying only across devices."""
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(str(src), str(dst))
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink src to dst, falling back to a copy (e.g. across devices)."""
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        _fast_copy(src, dst)
+
+
+def _kill_process_tree(proc: subprocess.Popen) -> None:
+    """Kill proc and every process it started (best effort).
+
+    POSIX children must have been started with start_new_session=True so the
+    whole group can be signalled; Windows uses taskkill /T.
+    """
+    try:
+        if os.name == "nt":
+            subprocess.run(f"taskkill /T /F /PID {proc.pid}", capture_output=True)
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except Exception:
+        proc.kill()
+
+
+def _scan_files(root: str):
+    """Yield a DirEntry for every file under root, in os.walk's top-down order.
+
+    Symlinked directories are skipped: os.walk neither descends into them nor
+    yields them as files. DirEntry.stat() reuses the data the directory scan
+    already fetched where the platform provides it.
+    """
+    subdirs: List[str] = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir() and not entry.is_symlink():
+                subdirs.append(entry.path)
+            elif not entry.is_dir():
+                yield entry
+    for sub in subdirs:
+        yield from _scan_files(sub)
+
+
+def _iter_markdown(root: Path, excluded: frozenset) -> List[str]:
+    """Return repo-relative POSIX paths of *.md files under root.
+
+    Excluded directory names are pruned before descending, and top-level
+    dot-entries (.git, .tools, ...) are skipped entirely.
+    """
+    found: List[str] = []
+    stack: List[Tuple[str, str]] = [(str(root), "")]
+    while stack:
+        path, rel_dir = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                if not rel_dir and name.startswith("."):
+                    continue
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                # Only build relative paths for entries that are kept.
+                if is_dir:
+                    if name not in excluded:
+                        stack.append((entry.path, f"{rel_dir}/{name}" if rel_dir else name))
+                elif os.path.normcase(name).endswith(".md"):
+                    found.append(f"{rel_dir}/{name}" if rel_dir else name)
+    return found
+
+
+@dataclass
+class Step:
+    key: str
+    name: str
+    func: Callable[[], bool]
+    deps: Tuple[str, ...] = ()
+
 
 class AuraBuilder:
     def __init__(self):
@@ -29,37 +307,74 @@ class AuraBuilder:
         self.build_log = []
         self.start_time = datetime.now()
         self.failed_steps = []
+        # log() reformats the clock at most once per second.
+        self._ts_second = -1
+        self._ts_text = ""
+        # Steps may run on worker threads; keep log lines and failures whole.
+        self._lock = threading.RLock()
         self.tools_root = self.repo_root / ".tools"
         self.tools_root.mkdir(parents=True, exist_ok=True)
 
         # Toolchain state (populated by ensure_* helpers)
         self.java_home: Optional[Path] = None
         self.android_sdk_root: Optional[Path] = None
+        # Resolved toolchain paths from earlier runs (.tools/manifest.json)
+        self.tools_manifest = self.tools_root / "manifest.json"
+        self._tool_manifest: Optional[dict] = None
+        # dist-release file sizes (relative path -> bytes) from the manifest scan
+        self._size_cache: Optional[Dict[str, int]] = None
+        # One long-lived PowerShell host for .ps1 steps (started on first use)
+        self._pwsh: Optional[subprocess.Popen] = None
+        self._pwsh_lock = threading.Lock()
+        # Set once setup_android_toolchain has succeeded in this run
+        self._toolchain_ready = False
+        # Step table (key, display name, method), bound once per builder
+        self._step_table: Tuple[Tuple[str, str, Callable[[], bool]], ...] = (
+            ("core", "Aura Core", self.build_aura_core),
+            ("sentinel", "Sentinel IDE", self.build_sentinel_ide),
+            ("android", "Android Setup", self.setup_android_toolchain),
+            ("apk", "Android APK", self.build_android_apk),
+            ("apk-package", "APK Packaging", self.copy_android_apk_to_dist),
+            ("verify", "Binary Verification", self.verify_binaries),
+            ("dist", "Distribution Creation", self.create_distribution),
+            ("manifest", "Manifest Generation", self.generate_manifest),
+            ("docs", "Docs Aggregate", self.collect_markdown_docs),
+            ("roadmap", "Roadmap Restructure", self.rearrange_roadmap_summary),
+            ("reorg-root", "Reorg Root", self.reorg_repo_root),
+        )
+        self._step_by_key: Dict[str, Tuple[str, Callable[[], bool]]] = {
+            key: (name, func) for key, name, func in self._step_table
+        }
         
     def log(self, message: str, level: str = "INFO"):
         """Log a message with timestamp"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        prefix = f"[{timestamp}] [{level}]"
-        log_entry = f"{prefix} {message}"
-        # Encode for Windows console compatibility
-        try:
-            print(log_entry)
-        except UnicodeEncodeError:
-            # Replace Unicode characters with ASCII equivalents
-            safe_entry = log_entry.replace("✓", "[OK]").replace("✗", "[FAIL]")
-            print(safe_entry)
-        self.build_log.append(log_entry)
+        with self._lock:
+            now = int(time.time())
+            if now != self._ts_second:
+                self._ts_second = now
+                self._ts_text = time.strftime("%H:%M:%S", time.localtime(now))
+            log_entry = f"[{self._ts_text}] [{level}] {message}"
+            # Encode for Windows console compatibility
+            try:
+                print(log_entry)
+            except UnicodeEncodeError:
+                # Replace Unicode characters with ASCII equivalents
+                safe_entry = log_entry.replace("✓", "[OK]").replace("✗", "[FAIL]")
+                print(safe_entry)
+            self.build_log.append(log_entry)
         
     def log_section(self, title: str):
         """Log a major section header"""
         separator = "=" * 70
-        self.log("")
-        self.log(separator)
-        self.log(f"  {title}")
-        self.log(separator)
+        with self._lock:
+            self.log("")
+            self.log(separator)
+            self.log(f"  {title}")
+            self.log(separator)
         
     def _step_failed(self, step_name: str, error: str):
-        self.failed_steps.append((step_name, error))
+        with self._lock:
+            self.failed_steps.append((step_name, error))
 
     def run_command(
         self,
@@ -68,12 +383,16 @@ class AuraBuilder:
         description: str = "",
         env: Optional[dict] = None,
         timeout_sec: int = 300,
+        input_text: Optional[str] = None,
     ) -> Tuple[bool, str]:
         """Run a shell command and return success status and output.
 
         Notes:
         - Uses shell=True for Windows compatibility with .bat/.ps1.
         - Accepts optional env overrides (merged with current env).
+        - Combined stdout/stderr is logged line by line as it is produced;
+          only the last OUTPUT_TAIL_LINES lines are kept and returned.
+        - input_text, if given, is written to the command's stdin.
         """
         if cwd is None:
             cwd = self.repo_root
@@ -88,38 +407,205 @@ class AuraBuilder:
             merged_env.update({k: str(v) for k, v in env.items() if v is not None})
 
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 display_cmd,
                 cwd=cwd,
-                capture_output=True,
+                stdin=subprocess.PIPE if input_text is not None else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=timeout_sec,
+                errors="replace",
+                bufsize=1,
                 shell=True,
                 env=merged_env,
+                # Own process group so a timeout kills the shell's children too.
+                start_new_session=os.name != "nt",
             )
-            
-            if result.returncode != 0:
-                error_msg = result.stderr if result.stderr else result.stdout
-                self.log(f"FAILED: {error_msg}", level="ERROR")
-                self.failed_steps.append((description or display_cmd, error_msg))
+            timed_out = threading.Event()
+
+            def kill():
+                timed_out.set()
+                _kill_process_tree(proc)
+
+            if input_text is not None:
+                try:
+                    proc.stdin.write(input_text)
+                    proc.stdin.close()
+                except OSError:
+                    pass  # child exited or stopped reading early
+
+            tail: deque = deque(maxlen=OUTPUT_TAIL_LINES)
+            watchdog = threading.Timer(timeout_sec, kill)
+            watchdog.start()
+            try:
+                with proc.stdout:
+                    for line in proc.stdout:
+                        line = line.rstrip("\r\n")
+                        tail.append(line)
+                        self.log(f"  {line}")
+                returncode = proc.wait()
+            except BaseException:
+                # The child has its own session, so e.g. Ctrl-C never reached it.
+                _kill_process_tree(proc)
+                proc.wait()
+                raise
+            finally:
+                watchdog.cancel()
+
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(display_cmd, timeout_sec)
+
+            output = "\n".join(tail)
+            if returncode != 0:
+                error_msg = output or f"exit code {returncode}"
+                self.log(f"FAILED (exit code {returncode})", level="ERROR")
+                self._step_failed(description or display_cmd, error_msg)
                 return False, error_msg
-            
-            output = result.stdout
-            if output:
-                self.log(f"Output: {output[:200]}")
+
             return True, output
             
         except subprocess.TimeoutExpired:
             error_msg = f"Command timed out ({timeout_sec} seconds)"
             self.log(error_msg, level="ERROR")
-            self.failed_steps.append((description or display_cmd, error_msg))
+            self._step_failed(description or display_cmd, error_msg)
             return False, error_msg
         except Exception as e:
             error_msg = str(e)
             self.log(error_msg, level="ERROR")
-            self.failed_steps.append((description or display_cmd, error_msg))
+            self._step_failed(description or display_cmd, error_msg)
             return False, error_msg
 
+    def run_ps_script(
+        self,
+        script: Path,
+        args: Dict[str, Optional[str]],
+        description: str = "",
+        env: Optional[dict] = None,
+        timeout_sec: int = 300,
+    ) -> Tuple[bool, str]:
+        """Run a .ps1 script in the shared PowerShell host.
+
+        Saves a PowerShell start per script. args maps parameter names to
+        values (None for a switch). Falls back to a fresh
+        `powershell -File` process if the host cannot be started.
+        """
+        def ps_quote(value: str) -> str:
+            return "'" + value.replace("'", "''") + "'"
+
+        arg_text = " ".join(
+            f"-{name}" if value is None else f"-{name} {ps_quote(value)}"
+            for name, value in args.items()
+        )
+        with self._pwsh_lock:
+            if self._pwsh is None or self._pwsh.poll() is not None:
+                try:
+                    self._pwsh = subprocess.Popen(
+                        ["powershell", "-NoProfile", "-NoLogo", "-NonInteractive",
+                         "-ExecutionPolicy", "Bypass", "-Command", "-"],
+                        cwd=self.repo_root,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.STDOUT,
+                        text=True,
+                        errors="replace",
+                        bufsize=1,
+                        # Own process group so a timeout can kill the scripts' children too.
+                        start_new_session=os.name != "nt",
+                    )
+                except OSError:
+                    self._pwsh = None
+            if self._pwsh is None:
+                cli_args = " ".join(
+                    f"-{name}" if value is None else f'-{name} "{value}"' for name, value in args.items()
+                )
+                return self.run_command(
+                    f'powershell -ExecutionPolicy Bypass -File "{script}" {cli_args}',
+                    cwd=self.repo_root,
+                    description=description,
+                    env=env,
+                    timeout_sec=timeout_sec,
+                )
+
+            label = description or script.name
+            self.log(f"Running (pwsh): {script} {arg_text}")
+            if description:
+                self.log(f"  ({description})")
+
+            # Everything on one line: the host reads stdin statement by statement.
+            # The process environment is snapshotted first and restored in the
+            # finally block, so neither the env overrides nor anything the script
+            # sets leak into later scripts, as with one process per script.
+            env_text = "".join(
+                f"$env:{k} = {ps_quote(str(v))}; " for k, v in (env or {}).items() if v is not None
+            )
+            done = "__AURA_PS_DONE__"
+            restore_env = (
+                "foreach ($k in @([Environment]::GetEnvironmentVariables().Keys)) "
+                "{ if (-not $__auraEnv.Contains($k)) { [Environment]::SetEnvironmentVariable($k, $null) } }; "
+                "foreach ($k in $__auraEnv.Keys) { [Environment]::SetEnvironmentVariable($k, $__auraEnv[$k]) }"
+            )
+            line = (
+                f"Set-Location -LiteralPath {ps_quote(str(self.repo_root))}; "
+                f"$__auraEnv = [Environment]::GetEnvironmentVariables(); "
+                f"$global:LASTEXITCODE = 0; "
+                f"try {{ {env_text}& {ps_quote(str(script))} {arg_text}; $c = $LASTEXITCODE }} "
+                f"catch {{ Write-Output $_; $c = 1 }} "
+                f"finally {{ {restore_env} }}; "
+                f'Write-Output "{done}:$c"\n'
+            )
+            pwsh = self._pwsh
+            # Kill the whole tree: gradle/java/sdkmanager started by the script
+            # inherit the host's stdout, so killing only the host would leave the
+            # read below blocked.
+            watchdog = threading.Timer(timeout_sec, lambda: _kill_process_tree(pwsh))
+            watchdog.start()
+            tail: deque = deque(maxlen=OUTPUT_TAIL_LINES)
+            returncode: Optional[int] = None
+            try:
+                pwsh.stdin.write(line)
+                pwsh.stdin.flush()
+                for out in pwsh.stdout:
+                    out = out.rstrip("\r\n")
+                    if out.startswith(done + ":"):
+                        returncode = int(out.split(":", 1)[1] or 0)
+                        break
+                    tail.append(out)
+                    self.log(f"  {out}")
+            except (OSError, ValueError) as e:
+                tail.append(str(e))
+            except BaseException:
+                _kill_process_tree(pwsh)
+                self._pwsh = None
+                raise
+            finally:
+                watchdog.cancel()
+
+            output = "\n".join(tail)
+            if returncode is None:
+                # Host died (or was killed by the watchdog); start a new one next time.
+                self._pwsh = None
+                error_msg = f"PowerShell host exited or timed out ({timeout_sec} seconds)"
+                self.log(error_msg, level="ERROR")
+                self._step_failed(label, error_msg)
+                return False, error_msg
+            if returncode != 0:
+                self.log(f"FAILED (exit code {returncode})", level="ERROR")
+                self._step_failed(label, output or f"exit code {returncode}")
+                return False, output
+            return True, output
+
+    def _close_pwsh(self) -> None:
+        with self._pwsh_lock:
+            pwsh, self._pwsh = self._pwsh, None
+        if pwsh is None:
+            return
+        try:
+            pwsh.stdin.write("exit\n")
+            pwsh.stdin.close()
+            pwsh.wait(timeout=10)
+        except Exception:
+            pwsh.kill()
+
     def _which(self, exe_name: str) -> Optional[str]:
         return shutil.which(exe_name)
 
@@ -127,21 +613,187 @@ class AuraBuilder:
         dest.parent.mkdir(parents=True, exist_ok=True)
         self.log(f"Downloading: {url}")
         self.log(f"  -> {dest}")
-        req = urllib.request.Request(
-            url,
-            headers={
-                # Some CDNs block requests without a UA.
-                "User-Agent": "AuraBuild/1.0 (+https://example.invalid)",
-                "Accept": "*/*",
-            },
-        )
+
+        # Resolve redirects once and find out whether the server serves ranges.
+        final_url, total = url, 0
+        try:
+            head = urllib.request.Request(url, headers=DOWNLOAD_HEADERS, method="HEAD")
+            with urllib.request.urlopen(head) as r:
+                final_url = r.geturl()
+                if r.headers.get("Accept-Ranges", "").lower() == "bytes":
+                    total = int(r.headers.get("Content-Length") or 0)
+        except Exception:
+            pass
+
+        if total >= MIN_RANGED_DOWNLOAD:
+            try:
+                self._download_ranges(final_url, dest, total)
+                return
+            except Exception as e:
+                self.log(f"Ranged download failed ({e}); retrying as a single stream", level="WARN")
+
+        req = urllib.request.Request(final_url, headers=DOWNLOAD_HEADERS)
         with urllib.request.urlopen(req) as r, open(dest, "wb") as f:
-            shutil.copyfileobj(r, f)
+            shutil.copyfileobj(r, f, 1024 * 1024)
+
+    def _download_ranges(self, url: str, dest: Path, total: int) -> None:
+        """Fetch url into dest as DOWNLOAD_PARTS concurrent HTTP Range requests."""
+        part = -(-total // DOWNLOAD_PARTS)
+        with open(dest, "wb") as f:
+            f.truncate(total)
+
+        def fetch(lo: int) -> None:
+            hi = min(lo + part, total) - 1
+            headers = dict(DOWNLOAD_HEADERS, Range=f"bytes={lo}-{hi}")
+            req = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(req) as r, open(dest, "r+b") as f:
+                if r.status != 206:
+                    raise RuntimeError(f"server ignored Range (HTTP {r.status})")
+                f.seek(lo)
+                shutil.copyfileobj(r, f, 1024 * 1024)
+                if f.tell() != hi + 1:
+                    raise RuntimeError(f"short read for bytes {lo}-{hi}")
+
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_PARTS) as pool:
+            # list() re-raises the first failure from any part.
+            list(pool.map(fetch, range(0, total, part)))
+
+    def _copy_many(
+        self,
+        pairs: List[Tuple[Path, Path]],
+        copy: Callable[[Path, Path], None] = _fast_copy,
+    ) -> List[Optional[Exception]]:
+        """Copy (src, dest) pairs concurrently; returns the error (or None) per pair, in order."""
+        def copy_one(pair: Tuple[Path, Path]) -> Optional[Exception]:
+            try:
+                copy(*pair)
+                return None
+            except Exception as e:
+                return e
 
-    def _extract_zip(self, zip_path: Path, dest_dir: Path) -> None:
+        if len(pairs) < 2:
+            return [copy_one(p) for p in pairs]
+        with ThreadPoolExecutor(max_workers=min(COPY_QUEUE_DEPTH, len(pairs))) as pool:
+            return list(pool.map(copy_one, pairs))
+
+    def _copy_trees(self, pairs: List[Tuple[Path, Path]]) -> None:
+        """Replace each dest with a copy of src, copying files from all trees concurrently.
+
+        copytree walks the trees and creates directories; the per-file copies
+        it would make are handed to a shared thread pool instead.
+        """
+        with ThreadPoolExecutor(max_workers=COPY_QUEUE_DEPTH) as pool:
+            futures = []
+
+            def submit_copy(src: str, dst: str) -> str:
+                # Content + permission bits; timestamps are irrelevant for release output.
+                futures.append(pool.submit(shutil.copy, src, dst))
+                return dst
+
+            for src, dest in pairs:
+                if dest.exists():
+                    shutil.rmtree(dest)
+                shutil.copytree(src, dest, copy_function=submit_copy)
+            for fut in futures:
+                fut.result()
+
+    def _extract_zip(self, zip_path: Path, dest_dir: Path, strip_top: bool = False) -> Optional[str]:
+        """Extract zip_path into dest_dir, decompressing members on a thread pool.
+
+        With strip_top, a single top-level folder shared by every member
+        (jdk-17.x/, gradle-8.6/) is dropped so its contents land directly in
+        dest_dir. Returns the stripped folder name, or None if nothing was stripped.
+        """
         dest_dir.mkdir(parents=True, exist_ok=True)
+        root = dest_dir.resolve()
         with zipfile.ZipFile(zip_path, "r") as z:
-            z.extractall(dest_dir)
+            infos = z.infolist()
+            top: Optional[str] = None
+            if strip_top and infos:
+                first = infos[0].filename.split("/", 1)[0]
+                if all(i.filename.startswith(first + "/") for i in infos):
+                    top = first
+
+            files: List[Tuple[zipfile.ZipInfo, Path]] = []
+            for info in infos:
+                name = info.filename[len(top) + 1:] if top else info.filename
+                if not name:
+                    continue
+                target = (root / name).resolve()
+                if root not in target.parents:
+                    raise ValueError(f"Unsafe path in archive: {info.filename}")
+                if info.is_dir():
+                    target.mkdir(parents=True, exist_ok=True)
+                else:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    files.append((info, target))
+
+            def extract_one(member: Tuple[zipfile.ZipInfo, Path]) -> None:
+                info, target = member
+                with z.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, max(1, min(info.file_size, 1 << 20)))
+                mode = (info.external_attr >> 16) & 0o777
+                if mode and os.name != "nt":
+                    os.chmod(target, mode)
+
+            # ZipFile serializes reads of the shared handle; decompression and
+            # the writes overlap across workers.
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+                list(pool.map(extract_one, files))
+        return top
+
+    def _load_manifest(self) -> dict:
+        if self._tool_manifest is None:
+            try:
+                raw = self.tools_manifest.read_bytes()
+                self._tool_manifest = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except (OSError, ValueError):
+                self._tool_manifest = {}
+        return self._tool_manifest
+
+    def _save_manifest(self, manifest: dict) -> None:
+        tmp = self.tools_manifest.with_suffix(".tmp")
+        try:
+            tmp.write_bytes(_dump_json(manifest))
+            os.replace(tmp, self.tools_manifest)
+        except OSError as e:
+            self.log(f"Could not write {self.tools_manifest.name}: {e}", level="WARN")
+
+    def _tool_key(self, *env_names: str) -> str:
+        """Identify the inputs a cached toolchain entry was resolved from."""
+        parts = [sys.platform, platform.release()]
+        parts += [os.environ.get(name, "") for name in env_names]
+        return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cached_tool(self, name: str, key: str) -> Optional[dict]:
+        """Return the manifest entry for name if its key and marker mtime still match."""
+        if os.environ.get("AURA_FORCE_REBOOTSTRAP") == "1":
+            return None
+        with self._lock:
+            entry = self._load_manifest().get(name)
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        try:
+            if os.stat(entry["marker"]).st_mtime_ns != entry["mtime_ns"]:
+                return None
+        except (OSError, KeyError, TypeError):
+            return None
+        return entry
+
+    def _remember_tool(self, name: str, key: str, marker: Path, path: Optional[Path]) -> None:
+        try:
+            mtime_ns = os.stat(marker).st_mtime_ns
+        except OSError:
+            return
+        with self._lock:
+            manifest = self._load_manifest()
+            manifest[name] = {
+                "key": key,
+                "path": str(path) if path else None,
+                "marker": str(marker),
+                "mtime_ns": mtime_ns,
+            }
+            self._save_manifest(manifest)
 
     def ensure_jdk(self) -> bool:
         """Ensure a working JDK is available for Gradle/Android builds.
@@ -151,15 +803,25 @@ class AuraBuilder:
         """
         self.log_section("ANDROID DEP: Java (JDK)")
 
+        cache_key = self._tool_key("JAVA_HOME", "PATH", "AURA_JDK_URL")
+        cached = self._cached_tool("jdk", cache_key)
+        if cached:
+            self.java_home = Path(cached["path"]) if cached["path"] else None
+            self.log(f"✓ Using cached JDK: {self.java_home or cached['marker']}", level="SUCCESS")
+            return True
+
         java_home_env = os.environ.get("JAVA_HOME")
         if java_home_env:
             java_bin = Path(java_home_env) / "bin" / ("java.exe" if os.name == "nt" else "java")
             if java_bin.exists():
                 self.java_home = Path(java_home_env)
+                self._remember_tool("jdk", cache_key, java_bin, self.java_home)
                 self.log(f"✓ Using JAVA_HOME: {self.java_home}", level="SUCCESS")
                 return True
 
-        if self._which("java"):
+        path_java = self._which("java")
+        if path_java:
+            self._remember_tool("jdk", cache_key, Path(path_java), None)
             self.log("✓ Using java from PATH", level="SUCCESS")
             return True
 
@@ -212,28 +874,30 @@ class AuraBuilder:
                     raise last_err
 
             if not jdk_root.exists():
-                tmp = self.tools_root / "_tmp_jdk_extract"
-                if tmp.exists():
-                    shutil.rmtree(tmp)
-                self._extract_zip(jdk_zip, tmp)
-
-                # Find the top-level extracted folder (jdk-17.*)
-                candidates = [p for p in tmp.iterdir() if p.is_dir()]
-                if len(candidates) != 1:
-                    # pick first directory if layout is unexpected
-                    candidates = sorted(candidates, key=lambda p: p.name)
-                if not candidates:
-                    raise RuntimeError("Unexpected JDK zip layout (no directory found)")
-
-                extracted_home = candidates[0]
-                shutil.move(str(extracted_home), str(jdk_root))
-                shutil.rmtree(tmp, ignore_errors=True)
+                # A private temp dir next to jdk_root: an interrupted extract never
+                # leaves a partial jdk_root, and the final rename stays on one volume.
+                with tempfile.TemporaryDirectory(dir=self.tools_root, prefix="_jdk_") as tmp_str:
+                    tmp = Path(tmp_str) / "jdk"
+                    # The top-level jdk-17.* folder is stripped, so tmp is the JDK home.
+                    if self._extract_zip(jdk_zip, tmp, strip_top=True):
+                        extracted_home = tmp
+                    else:
+                        candidates = [p for p in tmp.iterdir() if p.is_dir()]
+                        if len(candidates) != 1:
+                            # pick first directory if layout is unexpected
+                            candidates = sorted(candidates, key=lambda p: p.name)
+                        if not candidates:
+                            raise RuntimeError("Unexpected JDK zip layout (no directory found)")
+                        extracted_home = candidates[0]
+
+                    _move_tree(extracted_home, jdk_root)
 
             java_bin = jdk_root / "bin" / "java.exe"
             if not java_bin.exists():
                 raise RuntimeError(f"Downloaded JDK missing java.exe: {java_bin}")
 
             self.java_home = jdk_root
+            self._remember_tool("jdk", cache_key, java_bin, jdk_root)
             self.log(f"✓ Bootstrapped JDK: {self.java_home}", level="SUCCESS")
             return True
         except Exception as e:
@@ -265,6 +929,13 @@ class AuraBuilder:
         sdk_root = Path(override_root).resolve() if override_root else (self.tools_root / "android-sdk")
         sdkmanager = sdk_root / "cmdline-tools" / "latest" / "bin" / "sdkmanager.bat"
 
+        cache_key = self._tool_key("ANDROID_SDK_ROOT", "ANDROID_HOME", "AURA_ANDROID_SDK_ROOT")
+        cached = self._cached_tool("android-sdk", cache_key)
+        if cached:
+            self.android_sdk_root = Path(cached["path"])
+            self.log(f"✓ Using cached Android SDK: {self.android_sdk_root}", level="SUCCESS")
+            return True
+
         # Accept an existing SDK if user set it.
         existing = os.environ.get("ANDROID_SDK_ROOT") or os.environ.get("ANDROID_HOME")
         if existing:
@@ -272,47 +943,102 @@ class AuraBuilder:
             existing_sdkmanager = existing_root / "cmdline-tools" / "latest" / "bin" / "sdkmanager.bat"
             if existing_sdkmanager.exists():
                 self.android_sdk_root = existing_root
+                self._remember_tool("android-sdk", cache_key, existing_sdkmanager, existing_root)
                 self.log(f"✓ Using existing Android SDK: {self.android_sdk_root}", level="SUCCESS")
                 return True
 
         # If already installed in our tools dir, use it.
         if sdkmanager.exists():
             self.android_sdk_root = sdk_root
+            self._remember_tool("android-sdk", cache_key, sdkmanager, sdk_root)
             self.log(f"✓ Android SDK present: {self.android_sdk_root}", level="SUCCESS")
             return True
 
-        # Bootstrap via the repo PowerShell script.
-        setup_ps1 = self.repo_root / "sdk" / "android" / "setup-android.ps1"
-        if not setup_ps1.exists():
-            self.log(f"Missing setup script: {setup_ps1}", level="ERROR")
-            return False
-
         if not self.ensure_jdk():
             return False
 
         self.log(f"Installing Android SDK into: {sdk_root}")
-        cmd = (
-            f'powershell -ExecutionPolicy Bypass -File "{setup_ps1}" '
-            f'-InstallRoot "{sdk_root}" -AcceptLicenses'
-        )
-        success, _ = self.run_command(
-            cmd,
-            cwd=self.repo_root,
-            description="Install Android SDK via setup-android.ps1",
-            env=self._android_env(),
-            timeout_sec=3600,
-        )
-        if not success:
-            return False
+        if not self._install_android_sdk(sdk_root, sdkmanager):
+            # Fall back to the repo PowerShell script.
+            setup_ps1 = self.repo_root / "sdk" / "android" / "setup-android.ps1"
+            if not setup_ps1.exists():
+                self.log(f"Missing setup script: {setup_ps1}", level="ERROR")
+                return False
+
+            self.log("Direct SDK install failed; falling back to setup-android.ps1", level="WARN")
+            success, _ = self.run_ps_script(
+                setup_ps1,
+                {"InstallRoot": str(sdk_root), "AcceptLicenses": None},
+                description="Install Android SDK via setup-android.ps1",
+                env=self._android_env(),
+                timeout_sec=3600,
+            )
+            if not success:
+                return False
 
         if not sdkmanager.exists():
             self.log(f"Android SDK install completed but sdkmanager not found: {sdkmanager}", level="ERROR")
             return False
 
         self.android_sdk_root = sdk_root
+        self._remember_tool("android-sdk", cache_key, sdkmanager, sdk_root)
         self.log("✓ Android SDK installed", level="SUCCESS")
         return True
 
+    def _install_android_sdk(self, sdk_root: Path, sdkmanager: Path) -> bool:
+        """Install cmdline-tools, then accept licenses and install all packages
+        with one sdkmanager run each (every run pays a JVM start)."""
+        url = os.environ.get("AURA_CMDLINE_TOOLS_URL", ANDROID_CMDLINE_TOOLS_URL)
+        tools_zip = self.tools_root / "cache" / url.rsplit("/", 1)[-1]
+        latest = sdk_root / "cmdline-tools" / "latest"
+        try:
+            if not tools_zip.exists():
+                self._download_file(url, tools_zip)
+            latest.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.TemporaryDirectory(dir=latest.parent, prefix="_tmp_") as tmp_str:
+                tmp = Path(tmp_str) / "latest"
+                # The zip contains 'cmdline-tools/'; its contents go under cmdline-tools/latest.
+                if self._extract_zip(tools_zip, tmp, strip_top=True) != "cmdline-tools":
+                    raise RuntimeError("Unexpected command-line tools zip layout")
+                if latest.exists():
+                    shutil.rmtree(latest)
+                _move_tree(tmp, latest)
+        except Exception as e:
+            self.log(f"Failed to install Android command-line tools: {e}", level="WARN")
+            return False
+
+        env = self._android_env()
+        ok, _ = self.run_command(
+            f'"{sdkmanager}" --sdk_root="{sdk_root}" --licenses',
+            description="Accept Android SDK licenses",
+            env=env,
+            timeout_sec=300,
+            input_text="y\n" * 200,
+        )
+        if not ok:
+            return False
+
+        packages = " ".join(f'"{pkg}"' for pkg in ANDROID_SDK_PACKAGES)
+        ok, _ = self.run_command(
+            f'"{sdkmanager}" --sdk_root="{sdk_root}" {packages}',
+            description="Install Android SDK packages",
+            env=env,
+            timeout_sec=3600,
+        )
+        if not ok:
+            return False
+
+        # Same env helper setup-android.ps1 writes; build-apk.ps1 dot-sources it.
+        ndk_home = sdk_root / "ndk" / ANDROID_NDK_VERSION
+        (sdk_root / "aura-android-env.ps1").write_text(
+            f"$env:ANDROID_SDK_ROOT = '{sdk_root}'\n"
+            f"$env:ANDROID_HOME = '{sdk_root}'\n"
+            f"$env:ANDROID_NDK_HOME = '{ndk_home}'\n"
+            f"$env:ANDROID_NDK_ROOT = '{ndk_home}'\n",
+            encoding="utf-8-sig",
+        )
+        return True
+
     def ensure_gradle_distribution(self) -> Optional[Path]:
         """Ensure a Gradle distribution exists under gradle/gradle-8.6/.
 
@@ -337,22 +1063,19 @@ class AuraBuilder:
 
             gradle_parent = self.repo_root / "gradle"
             gradle_parent.mkdir(parents=True, exist_ok=True)
-            tmp = self.tools_root / "_tmp_gradle_extract"
-            if tmp.exists():
-                shutil.rmtree(tmp)
-            self._extract_zip(gradle_zip, tmp)
-
-            extracted = tmp / "gradle-8.6"
-            if not extracted.exists():
-                # Some zips include version folder; if not, pick the only folder.
-                candidates = [p for p in tmp.iterdir() if p.is_dir()]
-                if candidates:
-                    extracted = candidates[0]
-
-            if gradle_home.exists():
-                shutil.rmtree(gradle_home)
-            shutil.move(str(extracted), str(gradle_home))
-            shutil.rmtree(tmp, ignore_errors=True)
+            with tempfile.TemporaryDirectory(dir=gradle_parent, prefix="_tmp_") as tmp_str:
+                tmp = Path(tmp_str) / "gradle"
+                # The gradle-8.6/ folder is stripped, so tmp is the Gradle home.
+                extracted = tmp
+                if not self._extract_zip(gradle_zip, tmp, strip_top=True):
+                    # Unexpected layout; if there is a folder, pick the first one.
+                    candidates = [p for p in tmp.iterdir() if p.is_dir()]
+                    if candidates:
+                        extracted = candidates[0]
+
+                if gradle_home.exists():
+                    shutil.rmtree(gradle_home)
+                _move_tree(extracted, gradle_home)
 
             if gradle_bat.exists():
                 self.log("✓ Gradle 8.6 ready", level="SUCCESS")
@@ -470,18 +1193,9 @@ class AuraBuilder:
             "## Moved markdown",
             "",
         ]
-        if moved_md:
-            for src, dest in moved_md:
-                lines.append(f"- `{src}` → `{dest}`")
-        else:
-            lines.append("- (none)")
-
+        lines += [f"- `{src}` → `{dest}`" for src, dest in moved_md] or ["- (none)"]
         lines += ["", "## Moved Aura samples", ""]
-        if moved_aura:
-            for src, dest in moved_aura:
-                lines.append(f"- `{src}` → `{dest}`")
-        else:
-            lines.append("- (none)")
+        lines += [f"- `{src}` → `{dest}`" for src, dest in moved_aura] or ["- (none)"]
 
         if not dry_run:
             index.write_text("\n".join(lines) + "\n", encoding="utf-8")
@@ -513,16 +1227,39 @@ class AuraBuilder:
         
         sentinel_app = self.repo_root / "editors" / "sentinel-app"
         
-        # Install dependencies
-        self.log("Installing Node dependencies...")
-        success, _ = self.run_command(
-            ["npm", "install"],
-            cwd=sentinel_app,
-            description="Install npm packages"
-        )
-        
-        if not success:
-            return False
+        # Install dependencies, unless node_modules was installed from this exact lockfile.
+        lockfile = sentinel_app / "package-lock.json"
+        stamp = sentinel_app / "node_modules" / ".aura-lockhash"
+        lock_hash = None
+        if lockfile.exists():
+            h = hashlib.blake2b(digest_size=16)
+            h.update((sentinel_app / "package.json").read_bytes())
+            h.update(lockfile.read_bytes())
+            lock_hash = h.hexdigest()
+
+        try:
+            installed_hash = stamp.read_text(encoding="utf-8").strip()
+        except OSError:
+            installed_hash = None
+
+        if lock_hash and installed_hash == lock_hash:
+            self.log("✓ node_modules matches package-lock.json; skipping npm install", level="SUCCESS")
+        else:
+            self.log("Installing Node dependencies...")
+            if lock_hash:
+                cmd = ["npm", "ci", "--prefer-offline", "--no-audit", "--no-fund"]
+            else:
+                cmd = ["npm", "install", "--no-audit", "--no-fund"]
+            success, _ = self.run_command(
+                cmd,
+                cwd=sentinel_app,
+                description="Install npm packages"
+            )
+            
+            if not success:
+                return False
+            if lock_hash:
+                stamp.write_text(lock_hash + "\n", encoding="utf-8")
         
         # Build with Vite
         success, output = self.run_command(
@@ -553,35 +1290,9 @@ class AuraBuilder:
         all_md_dir = dist_docs / "all-md"
         all_md_dir.mkdir(parents=True, exist_ok=True)
 
-        # Exclude dependency/build/output dirs (very important on this repo)
-        excluded_dir_names = {
-            ".git",
-            ".github",
-            ".vscode",
-            ".tools",
-            "target",
-            "target-alt",
-            "target-lsp-test",
-            "target-lsp-tests",
-            "node_modules",
-            "dist",
-            "dist-release",
-            "dist-complete",
-            "build",
-            "vendor",
-            ".gradle",
-        }
-
-        md_sources: List[Path] = []
-        for md in self.repo_root.rglob("*.md"):
-            rel = md.relative_to(self.repo_root)
-            # Skip anything under excluded dirs
-            if any(part in excluded_dir_names for part in rel.parts):
-                continue
-            # Skip extremely deep Android SDK/JDK docs if user ran toolchain setup
-            if rel.parts and rel.parts[0].startswith("."):
-                continue
-            md_sources.append(md)
+        # Prunes MD_EXCLUDED_DIRS while walking; top-level dot dirs are skipped too
+        # (extremely deep Android SDK/JDK docs live there if the user ran toolchain setup).
+        md_sources = _iter_markdown(self.repo_root, MD_EXCLUDED_DIRS)
 
         if not md_sources:
             self.log("No markdown files found to aggregate", level="WARN")
@@ -589,15 +1300,16 @@ class AuraBuilder:
 
         # Copy into one folder with flattened names to avoid collisions.
         copied: List[tuple[str, str]] = []
-        for src in sorted(md_sources, key=lambda p: str(p.relative_to(self.repo_root)).lower()):
-            rel = src.relative_to(self.repo_root).as_posix()
-            flat_name = rel.replace("/", "__")
-            dest = all_md_dir / flat_name
-            try:
-                shutil.copy2(src, dest)
+        rels = sorted(md_sources, key=str.lower)
+        flat_names = [rel.replace("/", "__") for rel in rels]
+        errors = self._copy_many(
+            [(self.repo_root / rel, all_md_dir / flat) for rel, flat in zip(rels, flat_names)]
+        )
+        for rel, flat_name, err in zip(rels, flat_names, errors):
+            if err is None:
                 copied.append((rel, f"docs/all-md/{flat_name}"))
-            except Exception as e:
-                self.log(f"Failed to copy {rel}: {e}", level="WARN")
+            else:
+                self.log(f"Failed to copy {rel}: {err}", level="WARN")
 
         # Generate index
         index_path = dist_docs / "ALL_MARKDOWN_INDEX.md"
@@ -611,28 +1323,26 @@ class AuraBuilder:
             "## Files",
             "",
         ]
-        for rel, dest_rel in copied:
-            lines.append(f"- `{rel}` → `{dest_rel}`")
+        lines += [f"- `{rel}` → `{dest_rel}`" for rel, dest_rel in copied]
 
         index_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
         self.log(f"✓ Wrote {index_path.relative_to(self.repo_root)}", level="SUCCESS")
 
         # Generate updates list (heuristic)
-        update_keywords = re.compile(r"(UPDATE|STATUS|REPORT|SUMMARY|COMPLETE|COMPLETION|RELEASE|ANNOUNCEMENT)", re.IGNORECASE)
         update_files = [
             (rel, dest_rel)
             for (rel, dest_rel) in copied
-            if update_keywords.search(Path(rel).name)
+            if UPDATE_KEYWORDS_RE.search(Path(rel).name.upper())
         ]
 
         def sort_key(item: tuple[str, str]):
             name = Path(item[0]).name
             # Prefer YYYY_MM_DD patterns
-            m = re.search(r"(20\d{2})[_-](\d{2})[_-](\d{2})", name)
+            m = YYYY_MM_DD_RE.search(name)
             if m:
                 return (0, m.group(1), m.group(2), m.group(3), name.lower())
             # Then month-year patterns like JANUARY-2026
-            m2 = re.search(r"(JANUARY|FEBRUARY|MARCH|APRIL|MAY|JUNE|JULY|AUGUST|SEPTEMBER|OCTOBER|NOVEMBER|DECEMBER)[-_ ](20\d{2})", name, re.IGNORECASE)
+            m2 = MONTH_YEAR_RE.search(name.upper())
             if m2:
                 return (1, m2.group(2), m2.group(1).lower(), name.lower())
             return (2, name.lower())
@@ -646,8 +1356,7 @@ class AuraBuilder:
             "## Entries",
             "",
         ]
-        for rel, dest_rel in sorted(update_files, key=sort_key):
-            u_lines.append(f"- `{rel}` → `{dest_rel}`")
+        u_lines += [f"- `{rel}` → `{dest_rel}`" for rel, dest_rel in sorted(update_files, key=sort_key)]
         updates_path.write_text("\n".join(u_lines) + "\n", encoding="utf-8")
         self.log(f"✓ Wrote {updates_path.relative_to(self.repo_root)}", level="SUCCESS")
 
@@ -655,77 +1364,90 @@ class AuraBuilder:
         summaries_dir = dist_docs / "summaries"
         summaries_dir.mkdir(parents=True, exist_ok=True)
 
-        summary_name_re = re.compile(
-            r"(SUMMARY|REPORT|STATUS|COMPLETE|COMPLETION|FINAL|RELEASE|DELIVERY|ANNOUNCEMENT|INDEX|GUIDE|CHECKLIST|DASHBOARD)",
-            re.IGNORECASE,
-        )
-
         # Prefer repo-root summaries and phase summaries; exclude generic docs like reference/book chapters.
         summary_candidates: List[tuple[str, str]] = []
         for rel, dest_rel in copied:
             name = Path(rel).name
             if name.lower() in {"readme.md", "license.md", "code_of_conduct.md", "contributing.md"}:
                 continue
-            if summary_name_re.search(name) or rel.startswith("PHASE_") or rel.startswith("WEEK_"):
+            if SUMMARY_NAME_RE.search(name.upper()) or rel.startswith("PHASE_") or rel.startswith("WEEK_"):
                 summary_candidates.append((rel, dest_rel))
 
         # Copy summaries into summaries/
         summary_map: List[tuple[str, str]] = []
-        for rel, _ in summary_candidates:
-            flat_name = rel.replace("/", "__")
-            dest = summaries_dir / flat_name
-            try:
-                shutil.copy2(self.repo_root / rel, dest)
+        flat_names = [rel.replace("/", "__") for rel, _ in summary_candidates]
+        # Every candidate already has a flattened copy in all-md/; link to it
+        # instead of reading the original again.
+        errors = self._copy_many(
+            [(all_md_dir / flat, summaries_dir / flat) for flat in flat_names],
+            copy=_link_or_copy,
+        )
+        for (rel, _), flat_name, err in zip(summary_candidates, flat_names, errors):
+            if err is None:
                 summary_map.append((rel, f"docs/summaries/{flat_name}"))
-            except Exception as e:
-                self.log(f"Failed to copy summary {rel}: {e}", level="WARN")
+            else:
+                self.log(f"Failed to copy summary {rel}: {err}", level="WARN")
 
         def extract_md_summary(src_path: Path) -> dict:
-            content = src_path.read_text(encoding="utf-8", errors="replace")
-            title = "(untitled)"
-            for line in content.splitlines():
-                if line.startswith("#"):
-                    title = line.lstrip("#").strip()
-                    break
-
-            def find_field(pattern: str) -> Optional[str]:
-                m = re.search(pattern, content, flags=re.IGNORECASE | re.MULTILINE)
-                if m:
-                    return m.group(1).strip()
-                return None
-
-            date = find_field(r"\*\*Date\*\*\s*:\s*(.+)$") or find_field(r"\*\*Created\*\*\s*:\s*(.+)$")
-            status = find_field(r"\*\*Status\*\*\s*:\s*(.+)$")
-            nxt = find_field(r"\*\*Next\*\*\s*:\s*(.+)$")
-
-            # First paragraph (best-effort)
+            # Single pass over the file; stops reading once the title, all
+            # metadata fields and the first paragraph have been seen.
+            title: Optional[str] = None
+            date: Optional[str] = None
+            created: Optional[str] = None
+            status: Optional[str] = None
+            nxt: Optional[str] = None
             para_lines: List[str] = []
             in_para = False
-            for line in content.splitlines():
-                stripped = line.strip()
-                if stripped.startswith("#"):
-                    continue
-                if not stripped:
-                    if in_para:
+            para_done = False
+
+            def field(pattern: "re.Pattern[str]", line: str) -> Optional[str]:
+                m = pattern.search(line)
+                return m.group(1).strip() if m else None
+
+            with open(src_path, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    if title is None and line.startswith("#"):
+                        title = line.lstrip("#").strip()
+
+                    if "**" in line:
+                        if date is None:
+                            date = field(DATE_RE, line)
+                        if created is None:
+                            created = field(CREATED_RE, line)
+                        if status is None:
+                            status = field(STATUS_RE, line)
+                        if nxt is None:
+                            nxt = field(NEXT_RE, line)
+
+                    # First paragraph (best-effort)
+                    if not para_done:
+                        stripped = line.strip()
+                        if not stripped:
+                            para_done = in_para
+                        elif stripped.startswith(("#", "---")):
+                            pass
+                        # Skip obvious metadata lines
+                        elif META_RE.match(stripped):
+                            pass
+                        elif stripped.startswith("-"):
+                            # Stop before long bullet sections
+                            para_done = in_para
+                        else:
+                            in_para = True
+                            para_lines.append(stripped)
+                            para_done = len(para_lines) >= 3
+
+                    if para_done and title is not None and date and status is not None and nxt is not None:
                         break
-                    continue
-                if stripped.startswith("---"):
-                    continue
-                # Skip obvious metadata lines
-                if re.match(r"\*\*(Date|Status|Next|Created)\*\*\s*:", stripped, flags=re.IGNORECASE):
-                    continue
-                if stripped.startswith("-"):
-                    # Stop before long bullet sections
-                    if in_para:
-                        break
-                    continue
-                in_para = True
-                para_lines.append(stripped)
-                if len(para_lines) >= 3:
-                    break
 
             intro = " ".join(para_lines).strip() if para_lines else ""
-            return {"title": title, "date": date, "status": status, "next": nxt, "intro": intro}
+            return {
+                "title": "(untitled)" if title is None else title,
+                "date": date or created,
+                "status": status,
+                "next": nxt,
+                "intro": intro,
+            }
 
         summary_index = dist_docs / "SUMMARY_INDEX.md"
         idx_lines = [
@@ -738,8 +1460,8 @@ class AuraBuilder:
             "## Files",
             "",
         ]
-        for rel, dest_rel in sorted(summary_map, key=lambda x: x[0].lower()):
-            idx_lines.append(f"- `{rel}` → `{dest_rel}`")
+        sorted_summaries = sorted(summary_map, key=lambda x: x[0].lower())
+        idx_lines += [f"- `{rel}` → `{dest_rel}`" for rel, dest_rel in sorted_summaries]
         summary_index.write_text("\n".join(idx_lines) + "\n", encoding="utf-8")
         self.log(f"✓ Wrote {summary_index.relative_to(self.repo_root)}", level="SUCCESS")
 
@@ -752,22 +1474,26 @@ class AuraBuilder:
             "This file provides a quick, human-readable overview of the key summary documents.",
             "",
         ]
-        for rel, dest_rel in sorted(summary_map, key=lambda x: x[0].lower()):
-            meta = extract_md_summary(self.repo_root / rel)
-            ov_lines.append(f"## {meta['title']}")
-            ov_lines.append("")
-            ov_lines.append(f"- Source: `{rel}`")
-            ov_lines.append(f"- Copy: `{dest_rel}`")
+        workers = max(1, min(SUMMARY_WORKERS, os.cpu_count() or 1, len(sorted_summaries)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            metas = list(pool.map(lambda rd: extract_md_summary(self.repo_root / rd[0]), sorted_summaries))
+
+        def overview_block(rel: str, dest_rel: str, meta: dict) -> List[str]:
+            block = [f"## {meta['title']}", "", f"- Source: `{rel}`", f"- Copy: `{dest_rel}`"]
             if meta.get("date"):
-                ov_lines.append(f"- Date: {meta['date']}")
+                block.append(f"- Date: {meta['date']}")
             if meta.get("status"):
-                ov_lines.append(f"- Status: {meta['status']}")
+                block.append(f"- Status: {meta['status']}")
             if meta.get("next"):
-                ov_lines.append(f"- Next: {meta['next']}")
+                block.append(f"- Next: {meta['next']}")
             if meta.get("intro"):
-                ov_lines.append("")
-                ov_lines.append(meta["intro"])
-            ov_lines.append("")
+                block += ["", meta["intro"]]
+            block.append("")
+            return block
+
+        ov_lines += chain.from_iterable(
+            overview_block(rel, dest_rel, meta) for (rel, dest_rel), meta in zip(sorted_summaries, metas)
+        )
 
         overview.write_text("\n".join(ov_lines) + "\n", encoding="utf-8")
         self.log(f"✓ Wrote {overview.relative_to(self.repo_root)}", level="SUCCESS")
@@ -787,67 +1513,37 @@ class AuraBuilder:
             self.log("ROADMAP.md not found; skipping", level="WARN")
             return True
 
-        text = roadmap.read_text(encoding="utf-8", errors="replace")
-        marker_start = "<!-- ROADMAP_SUMMARY:START -->"
-        marker_end = "<!-- ROADMAP_SUMMARY:END -->"
-
+        original = text = roadmap.read_text(encoding="utf-8", errors="replace")
         # Remove ALL existing summary blocks (including accidental duplicates), then re-insert exactly one.
-        summary_pattern = re.escape(marker_start) + r".*?" + re.escape(marker_end) + r"\s*"
-        text = re.sub(summary_pattern, "", text, flags=re.DOTALL)
+        text = ROADMAP_SUMMARY_RE.sub("", text)
 
-        summary_lines = [
-            marker_start,
-            '## Aura v1.0 ("Reliability") — Certainty without Sacrifice',
-            "",
-            "### Mission (מטרה)",
-            "",
-            "Aura exists to make **formal verification the default UX**: proofs stream in real time (target: sub-200ms feedback), failures are explainable, and trust boundaries are explicit.",
-            "",
-            "Aura is the “Third Way”: ",
-            "- C/Zig-level control and performance",
-            "- Rust-level safety with simpler day-to-day ergonomics (Region + Linear Types)",
-            "- Dafny/Lean-level certainty, without leaving production tooling behind",
-            "",
-            "### Feature Missions (Next) (משימות)",
-            "",
-            "- [ ] Z3 Gate proof streaming: keep verifier feedback under interactive latency (p95 < 200ms)",
-            "- [ ] High-speed Merkle caching: statement/function-level incremental proofs with stable keys",
-            "- [ ] Memory Model Option B: regions + linear ownership states (Owned / Borrowed / Consumed) codified end-to-end (typechecker + stdlib)",
-            "- [ ] Trusted Core boundary: generate + surface a Trusted Core Report (\"דוח ליבה מהימנה\") on every build",
-            "- [ ] Explain Engine (\"הסבר\"): unsat-core driven explanation + variable trace + concrete counterexample rendered in-editor",
-            "- [ ] Race-free concurrency: static happens-before + protection mapping to prevent data races and deadlocks by construction",
-            "- [ ] Differential backend testing: CI Trust Gate keeping Dev-VM and native backends behaviorally aligned",
-            "",
-            "### Past Accomplishments (הישגים)",
-            "",
-            "- [x] Explainable verification UX: typed counterexamples, variable traces, logic traces",
-            "- [x] Package Manager: aura-pkg v1.0 complete and production-tested",
-            "- [x] Deterministic release packaging and artifact manifests",
-            "",
-            "### Specs & Indices",
-            "",
-            "- v1.0 Reliability spec: [docs/v1.0-reliability.md](docs/v1.0-reliability.md)",
-            "- Release summaries overview: [dist-release/docs/SUMMARIES_OVERVIEW.md](dist-release/docs/SUMMARIES_OVERVIEW.md)",
-            "",
-            marker_end,
-            "",
-        ]
-        summary_block = "\n".join(summary_lines)
+        summary_block = ROADMAP_SUMMARY_BLOCK
 
         # Insert after Legend section (after the first horizontal rule line).
-        hr = re.search(r"(?m)^\s*---\s*$", text)
+        hr = HR_RE.search(text)
         if hr:
             insert_at = hr.end()
-            text = text[:insert_at] + "\n\n" + summary_block + text[insert_at:].lstrip()
+            # Skip the whitespace after the rule in place instead of slicing + lstrip.
+            tail_start = WS_RE.match(text, insert_at).end()
+            text = "".join((text[:insert_at], "\n\n", summary_block, text[tail_start:]))
         else:
             text = summary_block + "\n" + text
 
+        if text == original:
+            # Leave the mtime alone so downstream caches stay valid.
+            self.log("✓ ROADMAP.md summary already up to date", level="SUCCESS")
+            return True
+
         roadmap.write_text(text, encoding="utf-8")
         self.log("✓ Updated ROADMAP.md with summary structure", level="SUCCESS")
         return True
     
     def setup_android_toolchain(self) -> bool:
         """Bootstrap Android build prerequisites (JDK, Android SDK, Gradle wrapper)."""
+        if self._toolchain_ready:
+            # build_android_apk calls this again right after the "android" step.
+            return True
+
         self.log_section("STEP 3: Bootstrapping Android Toolchain")
 
         if os.environ.get("AURA_SKIP_ANDROID") == "1":
@@ -863,6 +1559,7 @@ class AuraBuilder:
         if not self.ensure_gradle_wrapper():
             return False
 
+        self._toolchain_ready = True
         return True
     
     def build_android_apk(self) -> bool:
@@ -891,18 +1588,14 @@ class AuraBuilder:
 
         ok_all = True
         for variant in variants:
-            if variant not in {"debug", "release"}:
+            if variant not in APK_VARIANTS:
                 self.log(f"Unknown Android variant: {variant} (use debug,release)", level="ERROR")
                 ok_all = False
                 continue
 
-            cmd = (
-                f'powershell -ExecutionPolicy Bypass -File "{build_ps1}" '
-                f'-SdkRoot "{sdk_root}" -BuildType "{variant}"'
-            )
-            success, _ = self.run_command(
-                cmd,
-                cwd=self.repo_root,
+            success, _ = self.run_ps_script(
+                build_ps1,
+                {"SdkRoot": str(sdk_root), "BuildType": variant},
                 description=f"Build APK ({variant}) via sdk/android/build-apk.ps1",
                 env=self._android_env(),
                 timeout_sec=3600,
@@ -931,7 +1624,7 @@ class AuraBuilder:
         
         apk_dest = dist_android / "AuraSentinelSample-debug.apk"
         try:
-            shutil.copy2(apk_src, apk_dest)
+            shutil.copyfile(apk_src, apk_dest)
             self.log(f"✓ APK copied to dist/android/", level="SUCCESS")
             return True
         except Exception as e:
@@ -950,13 +1643,13 @@ class AuraBuilder:
         
         all_exist = True
         for binary in binaries:
-            binary_path = self.repo_root / binary
-            if binary_path.exists():
-                size_mb = binary_path.stat().st_size / (1024 * 1024)
-                self.log(f"✓ {binary} ({size_mb:.1f} MB)", level="SUCCESS")
-            else:
+            try:
+                size_mb = os.stat(self.repo_root / binary).st_size / (1024 * 1024)
+            except OSError:
                 self.log(f"✗ {binary} NOT FOUND", level="ERROR")
                 all_exist = False
+                continue
+            self.log(f"✓ {binary} ({size_mb:.1f} MB)", level="SUCCESS")
         
         return all_exist
     
@@ -991,37 +1684,31 @@ class AuraBuilder:
             src = self.repo_root / src_rel
             if src.exists():
                 dest = dist_root / dest_dir / src.name
-                shutil.copy2(src, dest)
+                shutil.copy(src, dest)
                 self.log(f"Copied {src.name}")
         
-        # Copy Sentinel IDE build
-        sentinel_dist = self.repo_root / "editors" / "sentinel-app" / "dist"
-        if sentinel_dist.exists():
-            sentinel_app_dest = dist_root / "apps" / "sentinel"
-            if sentinel_app_dest.exists():
-                shutil.rmtree(sentinel_app_dest)
-            shutil.copytree(sentinel_dist, sentinel_app_dest)
-            self.log("Copied Sentinel IDE")
-        
-        # Copy SDK
-        sdk_src = self.repo_root / "sdk"
-        if sdk_src.exists():
-            sdk_dest = dist_root / "sdk"
-            if sdk_dest.exists():
-                shutil.rmtree(sdk_dest)
-            shutil.copytree(sdk_src, sdk_dest)
-            self.log("Copied SDK")
+        # Copy Sentinel IDE build and SDK
+        trees = [
+            ("Sentinel IDE", self.repo_root / "editors" / "sentinel-app" / "dist", dist_root / "apps" / "sentinel"),
+            ("SDK", self.repo_root / "sdk", dist_root / "sdk"),
+        ]
+        trees = [(label, src, dest) for label, src, dest in trees if src.exists()]
+        self._copy_trees([(src, dest) for _, src, dest in trees])
+        for label, _, _ in trees:
+            self.log(f"Copied {label}")
         
         # Copy docs
         docs_files = list((self.repo_root / "docs").glob("*.md")) if (self.repo_root / "docs").exists() else []
-        for doc in docs_files:
-            shutil.copy2(doc, dist_root / "docs" / doc.name)
+        errors = self._copy_many([(doc, dist_root / "docs" / doc.name) for doc in docs_files], copy=shutil.copyfile)
+        for doc, err in zip(docs_files, errors):
+            if err is not None:
+                raise err
             self.log(f"Copied {doc.name}")
         
         # Copy APK if it exists
         apk = self.repo_root / "dist" / "android" / "AuraSentinelSample-debug.apk"
         if apk.exists():
-            shutil.copy2(apk, dist_root / "android" / apk.name)
+            shutil.copyfile(apk, dist_root / "android" / apk.name)
             self.log("Copied Android APK")
         
         self.log(f"✓ Distribution created in {dist_root}", level="SUCCESS")
@@ -1039,26 +1726,32 @@ class AuraBuilder:
         }
         
         # Collect file information
-        for root, dirs, files in os.walk(dist_root):
-            for file in files:
-                file_path = Path(root) / file
-                rel_path = file_path.relative_to(dist_root)
-                size = file_path.stat().st_size
-                
-                category = rel_path.parts[0] if rel_path.parts else "root"
-                if category not in manifest["components"]:
-                    manifest["components"][category] = []
-                
-                manifest["components"][category].append({
-                    "file": str(rel_path).replace("\\", "/"),
-                    "size_bytes": size,
-                    "size_mb": round(size / (1024 * 1024), 2)
-                })
+        # Plain string slicing: entry paths all start with the root we scan from.
+        sizes: Dict[str, int] = {}
+        components: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        root_str = str(dist_root)
+        prefix_len = len(os.path.join(root_str, ""))
+        for entry in _scan_files(root_str):
+            rel_native = entry.path[prefix_len:]
+            rel = rel_native.replace("\\", "/")
+            size = entry.stat().st_size
+            sizes[rel] = size
+            
+            category = rel_native.split(os.sep, 1)[0] or "root"
+            components[category].append({
+                "file": rel,
+                "size_bytes": size,
+                "size_mb": round(size / (1024 * 1024), 2)
+            })
+        manifest["components"] = dict(components)
         
-        # Write manifest
+        # Write manifest (compact; AURA_PRETTY_MANIFEST=1 for an indented one)
         manifest_file = dist_root / "MANIFEST.json"
-        with open(manifest_file, "w") as f:
-            json.dump(manifest, f, indent=2)
+        pretty = os.environ.get("AURA_PRETTY_MANIFEST") == "1"
+        manifest_file.write_bytes(_dump_json(manifest, pretty=pretty))
+        sizes[manifest_file.name] = manifest_file.stat().st_size
+        # Nothing writes to dist-release after the manifest; print_summary reuses this.
+        self._size_cache = sizes
         
         self.log(f"✓ Manifest generated: {manifest_file.name}", level="SUCCESS")
         return True
@@ -1083,15 +1776,18 @@ class AuraBuilder:
         
         dist_root = self.repo_root / "dist-release"
         if dist_root.exists():
-            total_size = sum(f.stat().st_size for f in dist_root.rglob("*") if f.is_file())
+            if self._size_cache is not None:
+                total_size = sum(self._size_cache.values())
+            else:
+                total_size = sum(entry.stat().st_size for entry in _scan_files(str(dist_root)))
             self.log(f"Release package size: {total_size / (1024*1024):.1f} MB")
             self.log(f"Location: {dist_root}")
     
     def save_build_log(self):
         """Save build log to file"""
         log_file = self.repo_root / "build-release.log"
-        with open(log_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(self.build_log))
+        with open(log_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(line + "\n" for line in self.build_log)
         self.log(f"Build log saved: {log_file}")
     
     def build_all(self) -> int:
@@ -1099,82 +1795,95 @@ class AuraBuilder:
         self.log("Aura v1.0 Complete Release Build")
         self.log(f"Repository: {self.repo_root}")
         self.log(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        steps = [
-            ("Aura Core", self.build_aura_core),
-            ("Sentinel IDE", self.build_sentinel_ide),
-            ("Android Setup", self.setup_android_toolchain),
-            ("Android APK", self.build_android_apk),
-            ("APK Packaging", self.copy_android_apk_to_dist),
-            ("Binary Verification", self.verify_binaries),
-            ("Distribution Creation", self.create_distribution),
-            ("Manifest Generation", self.generate_manifest),
-        ]
-        
-        failed_count = 0
-        for step_name, step_func in steps:
-            try:
-                if not step_func():
-                    self.log(f"✗ {step_name} failed", level="ERROR")
-                    # Some failures happen without a subprocess (e.g., missing deps).
-                    self.failed_steps.append((step_name, "Step returned False"))
-                    failed_count += 1
-            except Exception as e:
-                self.log(f"✗ {step_name} raised exception: {e}", level="ERROR")
-                self.failed_steps.append((step_name, str(e)))
-                failed_count += 1
-        
+
+        failed_count = self._run_steps(
+            ["core", "sentinel", "android", "apk", "apk-package", "verify", "dist", "manifest"]
+        )
+
         self.print_summary()
         self.save_build_log()
-        
+
         return 0 if failed_count == 0 else 1
 
-    def run_selected_steps(self, selected: List[str]) -> int:
-        """Run a selected subset of steps by name."""
-        self.log("Aura v1.0 CI Build")
-        self.log(f"Repository: {self.repo_root}")
-        self.log(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    def _run_step(self, step: Step) -> bool:
+        try:
+            if step.func():
+                return True
+            self.log(f"✗ {step.name} failed", level="ERROR")
+            # Some failures happen without a subprocess (e.g., missing deps).
+            self._step_failed(step.name, "Step returned False")
+        except Exception as e:
+            self.log(f"✗ {step.name} raised exception: {e}", level="ERROR")
+            self._step_failed(step.name, str(e))
+        return False
 
-        step_map = {
-            "core": ("Aura Core", self.build_aura_core),
-            "sentinel": ("Sentinel IDE", self.build_sentinel_ide),
-            "android": ("Android Setup", self.setup_android_toolchain),
-            "apk": ("Android APK", self.build_android_apk),
-            "apk-package": ("APK Packaging", self.copy_android_apk_to_dist),
-            "verify": ("Binary Verification", self.verify_binaries),
-            "dist": ("Distribution Creation", self.create_distribution),
-            "manifest": ("Manifest Generation", self.generate_manifest),
-            "docs": ("Docs Aggregate", self.collect_markdown_docs),
-            "roadmap": ("Roadmap Restructure", self.rearrange_roadmap_summary),
-            "reorg-root": ("Reorg Root", self.reorg_repo_root),
-        }
+    def _run_steps(self, selected: List[str], jobs: Optional[int] = None) -> int:
+        """Run steps by key, in parallel where STEP_DEPS allows.
 
-        ordered: List[tuple[str, callable]] = []
+        A step starts once every selected step it depends on has finished
+        (successfully or not, matching the old serial behaviour). Ready steps
+        are dispatched in selection order. Returns the number of failed steps.
+        """
+        step_map = self._step_by_key
+        steps: Dict[str, Step] = {}
+        failed_count = 0
         for key in selected:
             if key not in step_map:
                 self.log(f"Unknown step: {key}", level="ERROR")
                 self._step_failed("args", f"Unknown step: {key}")
                 continue
-            ordered.append(step_map[key])
+            name, func = step_map[key]
+            steps[key] = Step(key, name, func)
+        for step in steps.values():
+            step.deps = tuple(d for d in STEP_DEPS.get(step.key, ()) if d in steps)
+
+        pending = list(steps.values())
+        done: set = set()
+        workers = max(1, jobs or len(pending))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="step") as pool:
+            running = {}
+            while pending or running:
+                ready = [st for st in pending if all(d in done for d in st.deps)]
+                for st in ready:
+                    pending.remove(st)
+                    running[pool.submit(self._run_step, st)] = st
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    st = running.pop(fut)
+                    done.add(st.key)
+                    if not fut.result():
+                        failed_count += 1
+
+        self._close_pwsh()
+        return failed_count
+
+    def run_selected_steps(self, selected: List[str], jobs: Optional[int] = None) -> int:
+        """Run a selected subset of steps by name."""
+        self.log("Aura v1.0 CI Build")
+        self.log(f"Repository: {self.repo_root}")
+        self.log(f"Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
-        failed_count = 0
-        for step_name, step_func in ordered:
-            try:
-                if not step_func():
-                    self.log(f"✗ {step_name} failed", level="ERROR")
-                    self._step_failed(step_name, "Step returned False")
-                    failed_count += 1
-            except Exception as e:
-                self.log(f"✗ {step_name} raised exception: {e}", level="ERROR")
-                self._step_failed(step_name, str(e))
-                failed_count += 1
+        failed_count = self._run_steps(selected, jobs=jobs)
 
-        # Always ensure docs step can run after dist if requested
         self.print_summary()
         self.save_build_log()
         return 0 if failed_count == 0 else 1
 
 
+# Step keys for interactive menu choices 1-8 (9 is the free-form prompt)
+_MENU: Tuple[Tuple[str, ...], ...] = (
+    ("core", "sentinel", "android", "apk", "apk-package", "verify", "dist", "manifest", "docs"),
+    ("core", "verify"),
+    ("sentinel",),
+    ("android", "apk", "apk-package"),
+    ("verify", "dist", "manifest"),
+    ("docs",),
+    ("roadmap",),
+    ("reorg-root", "docs", "roadmap"),
+)
+_MENU_DEFAULT: Tuple[str, ...] = ("core", "sentinel", "verify", "dist", "manifest", "docs")
+
+
 def _interactive_select() -> List[str]:
     print("\nAura CI Menu")
     print("1) Build everything (core + sentinel + android + dist + manifest + docs)")
@@ -1188,22 +1897,6 @@ def _interactive_select() -> List[str]:
     print("9) Custom (type step keys)")
     choice = input("Select: ").strip()
 
-    if choice == "1":
-        return ["core", "sentinel", "android", "apk", "apk-package", "verify", "dist", "manifest", "docs"]
-    if choice == "2":
-        return ["core", "verify"]
-    if choice == "3":
-        return ["sentinel"]
-    if choice == "4":
-        return ["android", "apk", "apk-package"]
-    if choice == "5":
-        return ["verify", "dist", "manifest"]
-    if choice == "6":
-        return ["docs"]
-    if choice == "7":
-        return ["roadmap"]
-    if choice == "8":
-        return ["reorg-root", "docs", "roadmap"]
     if choice == "9":
         print("Available step keys:")
         print("  core, sentinel, android, apk, apk-package, verify, dist, manifest, docs, roadmap")
@@ -1211,11 +1904,18 @@ def _interactive_select() -> List[str]:
         raw = input("Enter comma-separated keys: ").strip()
         return [s.strip() for s in raw.split(",") if s.strip()]
 
+    try:
+        index = int(choice) - 1
+    except ValueError:
+        index = -1
+    if 0 <= index < len(_MENU):
+        return list(_MENU[index])
+
     # Default
-    return ["core", "sentinel", "verify", "dist", "manifest", "docs"]
+    return list(_MENU_DEFAULT)
 
 
-def main():
+def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Aura CI main script")
     parser.add_argument(
@@ -1231,7 +1931,13 @@ def main():
         action="store_true",
         help="Skip Android steps (equivalent to AURA_SKIP_ANDROID=1).",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Maximum number of steps to run at once (default: all independent steps; 1 = serial).",
+    )
+    args = parser.parse_args(argv)
 
     if args.skip_android:
         os.environ["AURA_SKIP_ANDROID"] = "1"
@@ -1239,13 +1945,13 @@ def main():
     builder = AuraBuilder()
     if args.steps:
         selected = [s.strip() for s in args.steps.split(",") if s.strip()]
-        exit_code = builder.run_selected_steps(selected)
+        exit_code = builder.run_selected_steps(selected, jobs=args.jobs)
     else:
         selected = _interactive_select()
-        exit_code = builder.run_selected_steps(selected)
+        exit_code = builder.run_selected_steps(selected, jobs=args.jobs)
 
-    sys.exit(exit_code)
+    return exit_code
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
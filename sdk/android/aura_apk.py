@@ -14,19 +14,23 @@ Usage:
 """
 
 import argparse
+import functools
 import os
 import subprocess
 import sys
 import time
 import shutil
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
+
+
+_DEFAULT_SDK_ROOT = Path.home() / ".aura" / "android-sdk"
 
 
 class AuraApkBuilder:
     def __init__(self, sdk_root: Optional[str] = None, avd_name: str = "AuraEmulator"):
         self.repo_root = Path(__file__).parent.parent.parent
-        self.sdk_root = Path(sdk_root) if sdk_root else Path.home() / ".aura" / "android-sdk"
+        self.sdk_root = Path(sdk_root) if sdk_root else _DEFAULT_SDK_ROOT
         self.avd_name = avd_name
         self.dist_dir = self.repo_root / "dist" / "android"
         self.sample_project = self.repo_root / "samples" / "android" / "AuraSentinelSample"
@@ -38,16 +42,32 @@ class AuraApkBuilder:
         self.emulator = self.sdk_root / "emulator" / "emulator.exe"
         self.sdkmanager = self.sdk_root / "cmdline-tools" / "latest" / "bin" / "sdkmanager.bat"
         self.avdmanager = self.sdk_root / "cmdline-tools" / "latest" / "bin" / "avdmanager.bat"
+        
+        # String forms used on every command line
+        self._sdk_root_s = str(self.sdk_root)
+        self._adb_s = str(self.adb)
+        self._ps_script_s = str(Path(__file__).parent / "aura-apk-emulator.ps1")
     
-    def _run(self, cmd: List[str], description: str = "") -> bool:
-        """Run command and report result."""
+    @functools.cached_property
+    def _adb_env(self) -> Dict[str, str]:
+        """Child-process environment pointing at this SDK (os.environ is left alone)."""
+        env = os.environ.copy()
+        env["ANDROID_SDK_ROOT"] = self._sdk_root_s
+        env["ANDROID_HOME"] = self._sdk_root_s
+        env["PATH"] = f"{self.sdk_root / 'platform-tools'}{os.pathsep}{env.get('PATH', '')}"
+        return env
+    
+    def _run(self, cmd: List[str], description: str = "", verbose: bool = True,
+             env: Optional[Dict[str, str]] = None) -> bool:
+        """Run command and report result (echo the command line when verbose)."""
         if description:
             self._print_title(description)
         
-        print(f"$ {' '.join(cmd)}\n")
+        if verbose:
+            print(f"$ {' '.join(cmd)}\n")
         
         try:
-            result = subprocess.run(cmd, capture_output=False, text=True)
+            result = subprocess.run(cmd, capture_output=False, text=True, env=env)
             if result.returncode != 0:
                 self._print_error(f"Command failed with exit code {result.returncode}")
                 return False
@@ -100,14 +120,12 @@ class AuraApkBuilder:
             return False
         
         # This delegates to PowerShell script
-        ps_script = Path(__file__).parent / "aura-apk-emulator.ps1"
-        
         cmd = [
             "powershell",
             "-ExecutionPolicy", "Bypass",
-            "-File", str(ps_script),
+            "-File", self._ps_script_s,
             "-Mode", "setup",
-            "-SdkRoot", str(self.sdk_root),
+            "-SdkRoot", self._sdk_root_s,
             "-AcceptLicenses"
         ]
         
@@ -120,37 +138,29 @@ class AuraApkBuilder:
             self._print_error(f"Source file not found: {source}")
             return False
         
-        ps_script = Path(__file__).parent / "aura-apk-emulator.ps1"
-        
         cmd = [
             "powershell",
             "-ExecutionPolicy", "Bypass",
-            "-File", str(ps_script),
+            "-File", self._ps_script_s,
             "-Mode", "build",
             "-AuraSource", str(source_path.absolute()),
-            "-SdkRoot", str(self.sdk_root)
+            "-SdkRoot", self._sdk_root_s
         ]
         
         return self._run(cmd, "Building APK from Aura source")
     
     def run_emulator(self) -> bool:
         """Start emulator and deploy APK."""
-        # Set environment
-        os.environ["ANDROID_SDK_ROOT"] = str(self.sdk_root)
-        os.environ["ANDROID_HOME"] = str(self.sdk_root)
-        
-        ps_script = Path(__file__).parent / "aura-apk-emulator.ps1"
-        
         cmd = [
             "powershell",
             "-ExecutionPolicy", "Bypass",
-            "-File", str(ps_script),
+            "-File", self._ps_script_s,
             "-Mode", "run",
-            "-SdkRoot", str(self.sdk_root),
+            "-SdkRoot", self._sdk_root_s,
             "-AvdName", self.avd_name
         ]
         
-        return self._run(cmd, "Starting emulator and deploying APK")
+        return self._run(cmd, "Starting emulator and deploying APK", env=self._adb_env)
     
     def list_devices(self) -> bool:
         """List connected devices."""
@@ -158,11 +168,8 @@ class AuraApkBuilder:
             self._print_error("adb not found. Run setup first.")
             return False
         
-        os.environ["ANDROID_SDK_ROOT"] = str(self.sdk_root)
-        os.environ["PATH"] = f"{self.sdk_root / 'platform-tools'};{os.environ.get('PATH', '')}"
-        
-        cmd = [str(self.adb), "devices", "-l"]
-        return self._run(cmd, "Connected Devices")
+        cmd = [self._adb_s, "devices", "-l"]
+        return self._run(cmd, "Connected Devices", verbose=False, env=self._adb_env)
     
     def logcat(self) -> bool:
         """Show device logs."""
@@ -170,22 +177,16 @@ class AuraApkBuilder:
             self._print_error("adb not found. Run setup first.")
             return False
         
-        os.environ["ANDROID_SDK_ROOT"] = str(self.sdk_root)
-        os.environ["PATH"] = f"{self.sdk_root / 'platform-tools'};{os.environ.get('PATH', '')}"
-        
-        cmd = [str(self.adb), "logcat", "*:V"]
-        return self._run(cmd, "Device Logcat (Ctrl+C to exit)")
+        cmd = [self._adb_s, "logcat", "*:V"]
+        return self._run(cmd, "Device Logcat (Ctrl+C to exit)", verbose=False, env=self._adb_env)
     
     def clean(self) -> bool:
         """Stop emulator and clean up."""
         if not self.adb.exists():
             return True
         
-        os.environ["ANDROID_SDK_ROOT"] = str(self.sdk_root)
-        os.environ["PATH"] = f"{self.sdk_root / 'platform-tools'};{os.environ.get('PATH', '')}"
-        
-        cmd = [str(self.adb), "emu", "kill"]
-        return self._run(cmd, "Stopping Emulator")
+        cmd = [self._adb_s, "emu", "kill"]
+        return self._run(cmd, "Stopping Emulator", verbose=False, env=self._adb_env)
     
     def full(self, source: str) -> bool:
         """Complete pipeline: setup + build + run."""
@@ -224,7 +225,7 @@ def main():
     
     parser.add_argument(
         "--sdk-root",
-        default=str(Path.home() / ".aura" / "android-sdk"),
+        default=str(_DEFAULT_SDK_ROOT),
         help="Android SDK root directory"
     )
     
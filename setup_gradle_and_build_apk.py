@@ -3,14 +3,75 @@
 Gradle Setup Script - Downloads and configures Gradle wrapper for Android builds
 """
 
+import bisect
+import argparse
+import hashlib
+import logging
 import os
+import re
+import signal
 import sys
 import subprocess
 import shutil
+import tempfile
+import threading
+import time
 import zipfile
 import urllib.request
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("setup_gradle")
+
+# self.log() level names -> logging levels (SUCCESS sits between INFO and WARNING)
+SUCCESS = 25
+logging.addLevelName(SUCCESS, "SUCCESS")
+LOG_LEVELS = {"INFO": logging.INFO, "SUCCESS": SUCCESS, "WARN": logging.WARNING, "ERROR": logging.ERROR}
+
+# Ranged downloads: number of concurrent parts, and the smallest file worth splitting
+DOWNLOAD_PARTS = 8
+MIN_RANGED_DOWNLOAD = 16 * 1024 * 1024
+# A single-stream download is held in memory up to this size before spilling to a temp file
+SPOOL_MAX_BYTES = 256 * 1024 * 1024
+# Minimum seconds between download progress redraws
+PROGRESS_INTERVAL = 0.1
+
+# Steps that must finish (successfully or not) before each step starts
+STEP_DEPS: Dict[str, Tuple[str, ...]] = {
+    "wrapper": ("gradle",),
+    "verify": ("wrapper",),
+    "build": ("verify",),
+    "copy": ("build", "dist-dir"),
+}
+# A failure here stops every step that has not started yet
+FATAL_STEPS = frozenset({"build"})
+
+# SHA-256 digest as published next to each Gradle distribution (<url>.sha256)
+SHA256_RE = re.compile(r"[0-9a-f]{64}")
+
+# gradle/wrapper/gradle-wrapper.properties as `gradle wrapper` writes it
+WRAPPER_PROPERTIES = """\
+distributionBase=GRADLE_USER_HOME
+distributionPath=wrapper/dists
+distributionUrl=https\\://services.gradle.org/distributions/gradle-{version}-bin.zip
+networkTimeout=10000
+validateDistributionUrl=true
+zipStoreBase=GRADLE_USER_HOME
+zipStorePath=wrapper/dists
+"""
+
+# Gradle version in gradle-wrapper.properties' distributionUrl
+WRAPPER_VERSION_RE = re.compile(r"gradle-([\d.]+)-(?:bin|all)\.zip")
+
+
+class ChecksumMismatch(ValueError):
+    """The downloaded archive does not match its published SHA-256."""
+
+
+class StepFailed(Exception):
+    """A pipeline step reported failure (returned False)."""
+
 
 class GradleSetup:
     def __init__(self):
@@ -18,73 +79,384 @@ class GradleSetup:
         self.gradle_version = "8.6"
         self.gradle_home = self.repo_root / "gradle" / f"gradle-{self.gradle_version}"
         self.sample_project = self.repo_root / "samples" / "android" / "AuraSentinelSample"
-        self.gradle_zip = self.repo_root / f"gradle-{self.gradle_version}-bin.zip"
+        self.apk_debug = self.sample_project / "app" / "build" / "outputs" / "apk" / "debug" / "app-debug.apk"
+        self.dist_android = self.repo_root / "dist-release" / "android"
         
     def log(self, message: str, level: str = "INFO"):
         """Log a message"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        prefix = f"[{timestamp}] [{level}]"
-        print(f"{prefix} {message}")
+        logger.log(LOG_LEVELS.get(level, logging.INFO), message)
     
-    def download_gradle(self) -> bool:
-        """Download Gradle binary"""
-        if self.gradle_home.exists():
-            self.log(f"✓ Gradle {self.gradle_version} already present", level="SUCCESS")
-            return True
+    def _progress_printer(self, total: int) -> Callable[[int], None]:
+        """Return a thread-safe callback that adds n bytes and prints the percentage.
+
+        The line is redrawn at most every PROGRESS_INTERVAL seconds (and once at 100%).
+        """
+        lock = threading.Lock()
+        state = {"done": 0, "percent": -1, "shown_at": 0.0}
         
-        gradle_url = f"https://services.gradle.org/distributions/gradle-{self.gradle_version}-bin.zip"
-        self.log(f"Downloading Gradle {self.gradle_version} from official sources...")
-        self.log(f"URL: {gradle_url}")
+        def add(n: int) -> None:
+            with lock:
+                state["done"] += n
+                if not total:
+                    return
+                percent = min(state["done"] * 100 // total, 100)
+                if percent == state["percent"]:
+                    return
+                now = time.monotonic()
+                if percent < 100 and now - state["shown_at"] < PROGRESS_INTERVAL:
+                    return
+                state["percent"] = percent
+                state["shown_at"] = now
+                sys.stdout.write(f"\r  Progress: {percent}%")
+                sys.stdout.flush()
         
+        return add
+    
+    def _copy_stream(self, src, dst, progress: Callable[[int], None]) -> int:
+        """Copy a response into an open file in 1 MiB chunks; returns bytes copied."""
+        copied = 0
+        for chunk in iter(lambda: src.read(1024 * 1024), b""):
+            dst.write(chunk)
+            copied += len(chunk)
+            progress(len(chunk))
+        return copied
+    
+    def _probe_download(self, url: str) -> Tuple[str, int]:
+        """HEAD url: return the final URL after redirects, and its size if byte ranges are served (else 0)."""
         try:
-            # Download with progress
-            def download_progress(block_num, block_size, total_size):
-                downloaded = block_num * block_size
-                percent = min(downloaded * 100 // total_size, 100)
-                print(f"\r  Progress: {percent}%", end="", flush=True)
-            
-            urllib.request.urlretrieve(gradle_url, self.gradle_zip, download_progress)
+            head = urllib.request.Request(url, method="HEAD")
+            with urllib.request.urlopen(head) as r:
+                if r.headers.get("Accept-Ranges", "").lower() == "bytes":
+                    return r.geturl(), int(r.headers.get("Content-Length") or 0)
+                return r.geturl(), 0
+        except Exception:
+            return url, 0
+    
+    def _fetch_range(self, url: str, dest: Path, lo: int, hi: int, progress: Callable[[int], None]) -> None:
+        """Download bytes lo..hi of url into the same offsets of dest."""
+        req = urllib.request.Request(url, headers={"Range": f"bytes={lo}-{hi}"})
+        with urllib.request.urlopen(req) as r, open(dest, "r+b") as f:
+            if r.status != 206:
+                raise RuntimeError(f"server ignored Range (HTTP {r.status})")
+            f.seek(lo)
+            if self._copy_stream(r, f, progress) != hi - lo + 1:
+                raise RuntimeError(f"short read for bytes {lo}-{hi}")
+    
+    def _published_sha256(self, url: str) -> Optional[str]:
+        """Fetch the SHA-256 Gradle publishes for url, or None if it is unavailable."""
+        try:
+            with urllib.request.urlopen(url + ".sha256", timeout=30) as r:
+                m = SHA256_RE.search(r.read(1024).decode("ascii", errors="replace").lower())
+        except Exception:
+            return None
+        return m.group(0) if m else None
+    
+    def _check_sha256(self, f, expected: Optional[str]) -> None:
+        """Hash an open binary file from the start in 1 MiB blocks and compare it to expected."""
+        if not expected:
+            return
+        h = hashlib.sha256()
+        f.seek(0)
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+        if h.hexdigest() != expected:
+            raise ChecksumMismatch(f"SHA-256 mismatch: expected {expected}, got {h.hexdigest()}")
+    
+    def _plan_extract(self, zf: zipfile.ZipFile, dest_dir: Path) -> List[Tuple[zipfile.ZipInfo, str]]:
+        """Create the directories of zf under dest_dir; return (member, target) for each file.
+
+        Targets are normalized as strings (no per-member stat), and each
+        distinct directory is created once up front.
+        """
+        root = os.path.realpath(dest_dir)
+        root_prefix = os.path.join(root, "")
+        members: List[Tuple[zipfile.ZipInfo, str]] = []
+        dirs = set()
+        for info in zf.infolist():
+            target = os.path.normpath(os.path.join(root, info.filename))
+            if target != root and not target.startswith(root_prefix):
+                raise ValueError(f"Unsafe path in archive: {info.filename}")
+            if info.is_dir():
+                dirs.add(target)
+            else:
+                dirs.add(os.path.dirname(target))
+                members.append((info, target))
+        for d in dirs:
+            os.makedirs(d, exist_ok=True)
+        return members
+    
+    def _member_extractor(
+        self, open_zip: Callable[[], zipfile.ZipFile]
+    ) -> Tuple[Callable[[Tuple[zipfile.ZipInfo, str]], None], Callable[[], None]]:
+        """Return (extract_one, close) for extracting archive members from worker threads.
+
+        open_zip is called once per worker thread. For an archive on disk each
+        worker then inflates through its own handle, so reads do not serialize
+        on a shared file object; an in-memory archive shares one ZipFile.
+        """
+        local = threading.local()
+        handles: List[zipfile.ZipFile] = []
+        handles_lock = threading.Lock()
+        
+        def extract_one(member: Tuple[zipfile.ZipInfo, str]) -> None:
+            info, target = member
+            zf = getattr(local, "zf", None)
+            if zf is None:
+                zf = local.zf = open_zip()
+                with handles_lock:
+                    handles.append(zf)
+            with zf.open(info) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            # Keep the executable bit on bin/gradle
+            mode = (info.external_attr >> 16) & 0o777
+            if mode and os.name != "nt":
+                os.chmod(target, mode)
+        
+        def close() -> None:
+            for zf in handles:
+                zf.close()
+        
+        return extract_one, close
+    
+    def _extract_archive(self, fileobj, dest_dir: Path) -> None:
+        """Extract the zip in an open, seekable file object into dest_dir on a thread pool."""
+        with zipfile.ZipFile(fileobj, "r") as zf:
+            members = self._plan_extract(zf, dest_dir)
+            extract_one, _ = self._member_extractor(lambda: zf)
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+                # list() re-raises the first failure from any member.
+                list(pool.map(extract_one, members))
+    
+    def _download_and_extract_ranges(self, url: str, total: int, dest_dir: Path, expected: Optional[str]) -> None:
+        """Download url as DOWNLOAD_PARTS concurrent Range requests, extracting as parts land.
+
+        The central directory sits at the end of the archive, so the last part
+        is requested first. Once it is readable, every member whose bytes
+        (local header up to the next member) are fully downloaded is handed
+        to the extraction pool while the remaining parts are still in flight.
+        The checksum can only be verified once every part is in, so a
+        mismatch is raised after extraction.
+        """
+        part = -(-total // DOWNLOAD_PARTS)
+        with tempfile.TemporaryDirectory(dir=dest_dir, prefix="_download_") as tmp:
+            zip_path = Path(tmp) / "gradle.zip"
+            with open(zip_path, "wb") as f:
+                f.truncate(total)
+            self._download_and_extract_parts(url, zip_path, total, part, dest_dir)
+            with open(zip_path, "rb") as f:
+                self._check_sha256(f, expected)
+    
+    def _download_and_extract_stream(self, url: str, dest_dir: Path, expected: Optional[str]) -> None:
+        """Download url as one stream, verify it, then extract it.
+
+        The archive is spooled in memory (spilling to a temp file past
+        SPOOL_MAX_BYTES) rather than written into the repo.
+        """
+        with urllib.request.urlopen(url) as r, \
+             tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as buf:
+            self._copy_stream(r, buf, self._progress_printer(int(r.headers.get("Content-Length") or 0)))
             print()  # New line after progress
-            
-            self.log(f"✓ Downloaded {self.gradle_zip.name}", level="SUCCESS")
-            return True
-            
-        except Exception as e:
-            self.log(f"✗ Failed to download Gradle: {e}", level="ERROR")
-            return False
+            self.log(f"✓ Downloaded gradle-{self.gradle_version}-bin.zip", level="SUCCESS")
+            self._check_sha256(buf, expected)
+            self.log(f"Extracting Gradle to {dest_dir}...")
+            buf.seek(0)
+            self._extract_archive(buf, dest_dir)
+    
+    def _download_and_extract_parts(self, url: str, zip_path: Path, total: int, part: int, dest_dir: Path) -> None:
+        """Fetch url into zip_path (pre-sized to total) part by part, extracting members as they complete."""
+        progress = self._progress_printer(total)
+        extract_one, close = self._member_extractor(lambda: zipfile.ZipFile(zip_path, "r"))
+        
+        have = set()
+        waiting: Optional[List[Tuple[int, int, Tuple[zipfile.ZipInfo, str]]]] = None
+        try:
+            with ThreadPoolExecutor(max_workers=DOWNLOAD_PARTS) as dl, \
+                 ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as ex:
+                fetches = {
+                    dl.submit(self._fetch_range, url, zip_path, lo, min(lo + part, total) - 1, progress): lo // part
+                    for lo in reversed(range(0, total, part))
+                }
+                extracts = []
+                for fut in as_completed(fetches):
+                    fut.result()
+                    have.add(fetches[fut])
+                    
+                    if waiting is None:
+                        try:
+                            with zipfile.ZipFile(zip_path, "r") as zf:
+                                members = self._plan_extract(zf, dest_dir)
+                                ends = sorted(i.header_offset for i, _ in members) + [zf.start_dir]
+                        except zipfile.BadZipFile:
+                            continue  # central directory not fully downloaded yet
+                        waiting = []
+                        for info, target in members:
+                            end = ends[bisect.bisect_right(ends, info.header_offset)]
+                            waiting.append((info.header_offset // part, (end - 1) // part, (info, target)))
+                    
+                    still_waiting = []
+                    for first, last, member in waiting:
+                        if all(p in have for p in range(first, last + 1)):
+                            extracts.append(ex.submit(extract_one, member))
+                        else:
+                            still_waiting.append((first, last, member))
+                    waiting = still_waiting
+                
+                if waiting is None:
+                    raise zipfile.BadZipFile("could not read the archive's central directory")
+                for fut in extracts:
+                    fut.result()
+        finally:
+            close()
+    
+    def _wrapper_cached_gradle(self) -> Optional[Path]:
+        """Find a complete gradle-<ver> unpacked by the Gradle wrapper under GRADLE_USER_HOME."""
+        user_home = Path(os.environ.get("GRADLE_USER_HOME") or Path.home() / ".gradle")
+        dist = f"gradle-{self.gradle_version}-bin"
+        for candidate in sorted((user_home / "wrapper" / "dists" / dist).glob(f"*/gradle-{self.gradle_version}")):
+            # The wrapper drops <zip>.ok next to the install once unpacking finished
+            if (candidate.parent / f"{dist}.zip.ok").exists() and (candidate / "bin").is_dir():
+                return candidate
+        return None
+    
+    def _reuse_gradle(self, existing: Path) -> None:
+        """Point self.gradle_home at an existing install: symlink, else a hard-linked copy."""
+        self.gradle_home.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.symlink(existing, self.gradle_home, target_is_directory=True)
+            return
+        except OSError:
+            pass  # e.g. Windows without symlink privilege
+        try:
+            shutil.copytree(existing, self.gradle_home, copy_function=os.link)
+        except OSError:
+            shutil.rmtree(self.gradle_home, ignore_errors=True)
+            shutil.copytree(existing, self.gradle_home)
     
-    def extract_gradle(self) -> bool:
-        """Extract Gradle archive"""
+    def download_and_extract(self) -> bool:
+        """Download the Gradle binary distribution and extract it"""
         if self.gradle_home.exists():
-            self.log(f"✓ Gradle already extracted", level="SUCCESS")
+            self.log(f"✓ Gradle {self.gradle_version} already present", level="SUCCESS")
             return True
+        if self.gradle_home.is_symlink():
+            self.gradle_home.unlink()  # dangling link to a removed wrapper install
         
-        if not self.gradle_zip.exists():
-            self.log(f"✗ Gradle zip not found: {self.gradle_zip}", level="ERROR")
-            return False
+        cached = self._wrapper_cached_gradle()
+        if cached is not None:
+            try:
+                self._reuse_gradle(cached)
+                self.log(f"✓ Reusing Gradle {self.gradle_version} from {cached}", level="SUCCESS")
+                return True
+            except OSError as e:
+                self.log(f"Could not reuse {cached} ({e}); downloading instead", level="WARN")
+                shutil.rmtree(self.gradle_home, ignore_errors=True)
         
-        self.log(f"Extracting Gradle to {self.gradle_home.parent}...")
+        gradle_url = f"https://services.gradle.org/distributions/gradle-{self.gradle_version}-bin.zip"
+        self.log(f"Downloading Gradle {self.gradle_version} from official sources...")
+        self.log(f"URL: {gradle_url}")
         
+        extract_path = self.gradle_home.parent
         try:
-            extract_path = self.gradle_home.parent
             extract_path.mkdir(parents=True, exist_ok=True)
+            final_url, total = self._probe_download(gradle_url)
+            expected = self._published_sha256(gradle_url)
+            if not expected:
+                self.log("No published SHA-256 found; skipping checksum verification", level="WARN")
             
-            with zipfile.ZipFile(self.gradle_zip, 'r') as zip_ref:
-                zip_ref.extractall(extract_path)
-            
-            self.log(f"✓ Gradle extracted successfully", level="SUCCESS")
+            done = False
+            if total >= MIN_RANGED_DOWNLOAD:
+                try:
+                    self._download_and_extract_ranges(final_url, total, extract_path, expected)
+                    print()  # New line after progress
+                    done = True
+                except Exception as e:
+                    print()
+                    self.log(f"Ranged download failed ({e}); retrying as a single stream", level="WARN")
+                    shutil.rmtree(self.gradle_home, ignore_errors=True)
             
-            # Clean up zip after extraction
-            try:
-                self.gradle_zip.unlink()
-            except:
-                pass
+            if not done:
+                # A corrupt single-stream download is fetched again once
+                for attempt in (1, 2):
+                    try:
+                        self._download_and_extract_stream(final_url, extract_path, expected)
+                        break
+                    except ChecksumMismatch as e:
+                        if attempt == 2:
+                            raise
+                        self.log(f"{e}; downloading again", level="WARN")
             
-            return True
+            self.log(f"✓ Gradle downloaded and extracted to {extract_path}", level="SUCCESS")
             
         except Exception as e:
-            self.log(f"✗ Failed to extract Gradle: {e}", level="ERROR")
+            self.log(f"✗ Failed to download/extract Gradle: {e}", level="ERROR")
+            # Don't leave a half-extracted tree that the next run would take as installed
+            shutil.rmtree(self.gradle_home, ignore_errors=True)
             return False
+        
+        return True
+    
+    def _run_captured(self, cmd: List[str], timeout: int) -> Tuple[int, str, str]:
+        """Run cmd in the sample project; return (exit code, stdout, stderr).
+
+        Output goes to anonymous temp files rather than pipes, so a chatty
+        child never blocks on a full pipe and nothing drains it while it runs.
+        On timeout, or any other exception such as Ctrl-C (which no longer
+        reaches the child's own session), the whole process tree (gradlew and
+        its JVMs) is killed before the exception is re-raised.
+        """
+        with tempfile.TemporaryFile() as out_f, tempfile.TemporaryFile() as err_f:
+            proc = subprocess.Popen(
+                cmd, cwd=self.sample_project,
+                stdout=out_f, stderr=err_f,
+                # Own process group so a timeout kills the wrapper's children too
+                start_new_session=os.name != "nt",
+            )
+            try:
+                returncode = proc.wait(timeout=timeout)
+            except BaseException:
+                try:
+                    if os.name == "nt":
+                        subprocess.run(f"taskkill /T /F /PID {proc.pid}", capture_output=True)
+                    else:
+                        os.killpg(proc.pid, signal.SIGKILL)
+                except Exception:
+                    proc.kill()
+                proc.wait()
+                raise
+            out_f.seek(0)
+            err_f.seek(0)
+            return (
+                returncode,
+                out_f.read().decode(errors="replace"),
+                err_f.read().decode(errors="replace"),
+            )
+    
+    def _find_wrapper_jar(self) -> Optional[Path]:
+        """Locate the wrapper jar inside the local Gradle distribution (None if not found)."""
+        for pattern in ("lib/gradle-wrapper*.jar", "lib/plugins/gradle-wrapper*.jar"):
+            for jar in sorted(self.gradle_home.glob(pattern)):
+                try:
+                    with zipfile.ZipFile(jar) as zf:
+                        zf.getinfo("org/gradle/wrapper/GradleWrapperMain.class")
+                except (OSError, KeyError, zipfile.BadZipFile):
+                    continue
+                return jar
+        return None
+    
+    def _write_wrapper_files(self) -> bool:
+        """Write gradle-wrapper.jar/.properties next to existing gradlew scripts without starting a JVM."""
+        if not ((self.sample_project / "gradlew").exists() and (self.sample_project / "gradlew.bat").exists()):
+            return False
+        jar = self._find_wrapper_jar()
+        if jar is None:
+            return False
+        
+        wrapper_dir = self.sample_project / "gradle" / "wrapper"
+        wrapper_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(jar, wrapper_dir / "gradle-wrapper.jar")
+        (wrapper_dir / "gradle-wrapper.properties").write_text(
+            WRAPPER_PROPERTIES.format(version=self.gradle_version), encoding="utf-8"
+        )
+        return True
     
     def setup_gradle_wrapper(self) -> bool:
         """Generate Gradle wrapper files in sample project"""
@@ -94,12 +466,23 @@ class GradleSetup:
         
         # Check if wrapper already exists
         gradlew = self.sample_project / "gradlew.bat"
-        if gradlew.exists():
+        wrapper_dir = self.sample_project / "gradle" / "wrapper"
+        if all(p.exists() for p in (gradlew, wrapper_dir / "gradle-wrapper.jar", wrapper_dir / "gradle-wrapper.properties")):
             self.log(f"✓ Gradle wrapper already exists", level="SUCCESS")
             return True
         
         self.log(f"Generating Gradle wrapper in sample project...")
         
+        # The gradlew scripts are committed; when only the jar/properties are
+        # missing, write them directly instead of booting Gradle for `gradle wrapper`
+        try:
+            if self._write_wrapper_files():
+                self.log(f"✓ Gradle wrapper files written", level="SUCCESS")
+                self.log(f"  Location: {self.sample_project}", level="INFO")
+                return True
+        except OSError as e:
+            self.log(f"Could not write wrapper files directly ({e}); running gradle wrapper", level="WARN")
+        
         try:
             # Use gradle wrapper command
             gradle_bin = self.gradle_home / "bin" / "gradle"
@@ -110,16 +493,13 @@ class GradleSetup:
                 return False
             
             # Run gradle wrapper
-            result = subprocess.run(
+            returncode, _, stderr = self._run_captured(
                 [gradle_cmd, "wrapper", "--gradle-version", self.gradle_version],
-                cwd=self.sample_project,
-                capture_output=True,
-                text=True,
                 timeout=60
             )
             
-            if result.returncode != 0:
-                self.log(f"✗ Gradle wrapper generation failed: {result.stderr}", level="ERROR")
+            if returncode != 0:
+                self.log(f"✗ Gradle wrapper generation failed: {stderr}", level="ERROR")
                 return False
             
             # Verify wrapper was created
@@ -139,21 +519,32 @@ class GradleSetup:
     def verify_wrapper(self) -> bool:
         """Verify all wrapper files exist"""
         required_files = [
-            self.sample_project / "gradlew.bat",
-            self.sample_project / "gradlew",
-            self.sample_project / "gradle" / "wrapper" / "gradle-wrapper.jar",
-            self.sample_project / "gradle" / "wrapper" / "gradle-wrapper.properties",
+            "gradlew.bat",
+            "gradlew",
+            "gradle/wrapper/gradle-wrapper.jar",
+            "gradle/wrapper/gradle-wrapper.properties",
         ]
         
-        all_exist = True
-        for file in required_files:
-            if file.exists():
-                self.log(f"✓ {file.relative_to(self.sample_project)}", level="SUCCESS")
-            else:
-                self.log(f"✗ {file.relative_to(self.sample_project)} - NOT FOUND", level="WARN")
-                all_exist = False
+        # One directory listing per folder instead of a stat per file
+        present = set()
+        for folder in ("", "gradle/wrapper"):
+            try:
+                with os.scandir(self.sample_project / folder) as it:
+                    present.update(f"{folder}/{e.name}".lstrip("/") for e in it)
+            except OSError:
+                pass
+        
+        missing = [name for name in required_files if name not in present]
+        if logger.isEnabledFor(logging.DEBUG):
+            for name in required_files:
+                if name in present:
+                    logger.debug(f"✓ {Path(name)}")
         
-        return all_exist
+        if missing:
+            self.log(f"✗ Wrapper files NOT FOUND: {', '.join(str(Path(n)) for n in missing)}", level="WARN")
+            return False
+        self.log(f"✓ Wrapper files present ({len(required_files)}/{len(required_files)})", level="SUCCESS")
+        return True
     
     def build_apk(self) -> bool:
         """Build APK using gradle wrapper"""
@@ -166,23 +557,27 @@ class GradleSetup:
             return False
         
         try:
-            result = subprocess.run(
-                [str(gradlew), "assembleDebug"],
-                cwd=self.sample_project,
-                capture_output=True,
-                text=True,
+            returncode, stdout, stderr = self._run_captured(
+                [
+                    str(gradlew),
+                    "--parallel",
+                    "--build-cache",
+                    "--configure-on-demand",
+                    f"--max-workers={os.cpu_count() or 1}",
+                    "assembleDebug",
+                ],
                 timeout=600  # 10 minutes
             )
             
-            if result.returncode != 0:
-                self.log(f"Build output:\n{result.stdout}", level="INFO")
-                self.log(f"Build error:\n{result.stderr}", level="ERROR")
+            if returncode != 0:
+                self.log(f"Build output:\n{stdout}", level="INFO")
+                self.log(f"Build error:\n{stderr}", level="ERROR")
                 return False
             
             self.log("✓ APK built successfully", level="SUCCESS")
             
             # Verify APK exists
-            apk_path = self.sample_project / "app" / "build" / "outputs" / "apk" / "debug" / "app-debug.apk"
+            apk_path = self.apk_debug
             if apk_path.exists():
                 size_mb = apk_path.stat().st_size / (1024 * 1024)
                 self.log(f"✓ APK created: {apk_path.name} ({size_mb:.1f} MB)", level="SUCCESS")
@@ -198,21 +593,25 @@ class GradleSetup:
             self.log(f"✗ APK build failed: {e}", level="ERROR")
             return False
     
+    def prepare_dist_dir(self) -> bool:
+        """Create the distribution directory for the APK"""
+        self.dist_android.mkdir(parents=True, exist_ok=True)
+        return True
+    
     def copy_apk_to_dist(self) -> bool:
         """Copy APK to distribution directory"""
-        apk_src = self.sample_project / "app" / "build" / "outputs" / "apk" / "debug" / "app-debug.apk"
+        apk_src = self.apk_debug
         
         if not apk_src.exists():
             self.log(f"APK not found, skipping distribution copy", level="WARN")
             return True
         
-        dist_android = self.repo_root / "dist-release" / "android"
-        dist_android.mkdir(parents=True, exist_ok=True)
-        
-        apk_dest = dist_android / "AuraSentinelSample-debug.apk"
+        apk_dest = self.dist_android / "AuraSentinelSample-debug.apk"
         
         try:
-            shutil.copy2(apk_src, apk_dest)
+            # Contents only: the dist copy needs no timestamps/permissions, and
+            # copyfile takes the sendfile/CopyFile fast paths
+            shutil.copyfile(apk_src, apk_dest)
             size_mb = apk_dest.stat().st_size / (1024 * 1024)
             self.log(f"✓ APK copied to dist-release/android/ ({size_mb:.1f} MB)", level="SUCCESS")
             return True
@@ -220,6 +619,55 @@ class GradleSetup:
             self.log(f"✗ Failed to copy APK: {e}", level="ERROR")
             return False
     
+    def _already_provisioned(self) -> bool:
+        """True if the sample project already has a wrapper for self.gradle_version."""
+        props = self.sample_project / "gradle" / "wrapper" / "gradle-wrapper.properties"
+        try:
+            data = props.read_text(encoding="utf-8")
+        except OSError:
+            return False
+        m = WRAPPER_VERSION_RE.search(data)
+        return bool(m and m.group(1) == self.gradle_version and (self.sample_project / "gradlew.bat").exists())
+    
+    def _run_step(self, name: str, func: Callable[[], bool]) -> None:
+        self.log("")
+        self.log(f"[STEP] {name}...")
+        self.log("-" * 70)
+        if not func():
+            raise StepFailed(f"{name} failed")
+    
+    def _run_steps(self, steps: List[Tuple[str, str, Callable[[], bool]]]) -> Dict[str, BaseException]:
+        """Run (key, name, func) steps on a thread pool as soon as their STEP_DEPS have finished.
+
+        Returns the error of each failed step by key.
+        """
+        keys = {key for key, _, _ in steps}
+        pending = list(steps)
+        done = set()
+        errors: Dict[str, BaseException] = {}
+        with ThreadPoolExecutor(max_workers=len(steps)) as pool:
+            running = {}
+            while pending or running:
+                ready = [st for st in pending if all(d in done for d in STEP_DEPS.get(st[0], ()) if d in keys)]
+                for st in ready:
+                    pending.remove(st)
+                    running[pool.submit(self._run_step, st[1], st[2])] = st
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    key, name, _ = running.pop(fut)
+                    done.add(key)
+                    error = fut.exception()
+                    if error is None:
+                        continue
+                    errors[key] = error
+                    if isinstance(error, StepFailed):
+                        self.log(f"✗ {error}", level="ERROR")
+                    else:
+                        self.log(f"✗ {name} raised exception: {error}", level="ERROR")
+                    if key in FATAL_STEPS:
+                        pending.clear()  # Stop on APK build failure
+        return errors
+    
     def setup_and_build(self) -> int:
         """Execute complete setup and build pipeline"""
         self.log("=" * 70)
@@ -227,35 +675,21 @@ class GradleSetup:
         self.log("=" * 70)
         
         steps = [
-            ("Download Gradle", self.download_gradle),
-            ("Extract Gradle", self.extract_gradle),
-            ("Generate Wrapper", self.setup_gradle_wrapper),
-            ("Verify Wrapper", self.verify_wrapper),
-            ("Build APK", self.build_apk),
-            ("Copy to Distribution", self.copy_apk_to_dist),
+            ("gradle", "Download & Extract Gradle", self.download_and_extract),
+            ("wrapper", "Generate Wrapper", self.setup_gradle_wrapper),
+            ("verify", "Verify Wrapper", self.verify_wrapper),
+            ("dist-dir", "Prepare Distribution", self.prepare_dist_dir),
+            ("build", "Build APK", self.build_apk),
+            ("copy", "Copy to Distribution", self.copy_apk_to_dist),
         ]
+        if self._already_provisioned():
+            # The wrapper fetches its own distribution; the local Gradle is only
+            # needed to generate the wrapper, so go straight to the build
+            self.log(f"✓ Gradle {self.gradle_version} wrapper already set up", level="SUCCESS")
+            steps = steps[-3:]
         
-        failed_steps = 0
-        
-        for step_name, step_func in steps:
-            self.log("")
-            self.log(f"[STEP] {step_name}...")
-            self.log("-" * 70)
-            
-            try:
-                if not step_func():
-                    self.log(f"✗ {step_name} failed", level="ERROR")
-                    failed_steps += 1
-                    # Continue to next step for some non-critical failures
-                    if step_name not in ["Build APK"]:
-                        continue
-                    else:
-                        break  # Stop on APK build failure
-            except Exception as e:
-                self.log(f"✗ {step_name} raised exception: {e}", level="ERROR")
-                failed_steps += 1
-                if step_name == "Build APK":
-                    break
+        errors = self._run_steps(steps)
+        failed_steps = len(errors)
         
         self.log("")
         self.log("=" * 70)
@@ -273,6 +707,19 @@ class GradleSetup:
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Set up Gradle and build the Aura sample APK")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only log warnings and errors.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Also log per-file checks.")
+    args = parser.parse_args()
+    
+    logging.addLevelName(logging.WARNING, "WARN")
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING if args.quiet else logging.INFO,
+        format="[%(asctime)s] [%(levelname)s] %(message)s",
+        datefmt="%H:%M:%S",
+        stream=sys.stdout,
+    )
+    
     builder = GradleSetup()
     exit_code = builder.setup_and_build()
     sys.exit(exit_code)
@@ -11,16 +11,48 @@ This is intentionally lightweight and works without external Python deps.
 from __future__ import annotations
 
 import argparse
+import copy
+import functools
 import os
 import platform
 import shutil
+import stat
 import subprocess
 import sys
+import time
 import hashlib
 import json
+import mmap
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# Optional accelerated DEFLATE (zlib-ng, then ISA-L). Their streams are valid
+# but not byte-identical to stock zlib, so compression only switches over when
+# AURA_FAST_ZLIB=1.
+try:
+    from zlib_ng import zlib_ng as _fast_zlib
+except ImportError:
+    try:
+        from isal import isal_zlib as _fast_zlib
+    except ImportError:
+        _fast_zlib = None
+
+_deflate_zlib = zlib
+if _fast_zlib is not None and os.environ.get("AURA_FAST_ZLIB") == "1":
+    _deflate_zlib = _fast_zlib
+    # Also covers repack_zip_deterministic, which goes through zipfile.
+    zipfile.zlib = _fast_zlib
+
 
 def safe_replace_existing(path: Path) -> None:
     """Best-effort removal of an existing artifact.
@@ -52,6 +84,22 @@ def safe_replace_existing(path: Path) -> None:
 REPO_ROOT = Path(__file__).resolve().parents[2]
 DIST_DIR = REPO_ROOT / "dist"
 SDK_STAGING = DIST_DIR / "AuraSDK"
+ANDROID_TARGET_DIR = REPO_ROOT / "target" / "android"
+
+# Z3 and the VC++ runtime it needs, bundled on Windows so aura/aura-lsp run on clean machines.
+Z3_WIN_BIN = REPO_ROOT / "tools" / "z3" / "dist" / "z3-4.15.4-x64-win" / "bin"
+Z3_WIN_DLLS = (
+    "libz3.dll",
+    "vcruntime140.dll",
+    "vcruntime140_1.dll",
+    "msvcp140.dll",
+    "msvcp140_1.dll",
+    "msvcp140_2.dll",
+    "vcomp140.dll",
+    "msvcp140_atomic_wait.dll",
+    "msvcp140_codecvt_ids.dll",
+    "vcruntime140_threads.dll",
+)
 
 
 def run(cmd: list[str], cwd: Path | None = None, env: dict[str, str] | None = None) -> None:
@@ -59,13 +107,17 @@ def run(cmd: list[str], cwd: Path | None = None, env: dict[str, str] | None = No
     subprocess.check_call(cmd, cwd=str(cwd or REPO_ROOT), env=env)
 
 
-def maybe_sign_windows(path: Path, enabled: bool, env: dict[str, str]) -> None:
+def maybe_sign_windows(paths: list[Path], enabled: bool, env: dict[str, str]) -> None:
+    """Sign all paths with a single signtool invocation (one TSA round-trip)."""
+
     if not enabled:
         return
     if os.name != "nt":
-        print(f"(skip signing; not Windows) {path}")
+        for path in paths:
+            print(f"(skip signing; not Windows) {path}")
         return
-    if not path.exists():
+    paths = [p for p in paths if p.exists()]
+    if not paths:
         return
 
     signtool = env.get("AURA_SIGNTOOL", "signtool")
@@ -87,7 +139,7 @@ def maybe_sign_windows(path: Path, enabled: bool, env: dict[str, str]) -> None:
             timestamp_url,
             "/td",
             "sha256",
-            str(path),
+            *map(str, paths),
         ]
     elif pfx:
         if pfx_pw is None:
@@ -105,7 +157,7 @@ def maybe_sign_windows(path: Path, enabled: bool, env: dict[str, str]) -> None:
             timestamp_url,
             "/td",
             "sha256",
-            str(path),
+            *map(str, paths),
         ]
     else:
         raise SystemExit(
@@ -116,17 +168,19 @@ def maybe_sign_windows(path: Path, enabled: bool, env: dict[str, str]) -> None:
 
 
 def read_version() -> str:
-    # Workspace package version.
-    cargo_toml = (REPO_ROOT / "Cargo.toml").read_text(encoding="utf-8")
-    for line in cargo_toml.splitlines():
-        if line.strip().startswith("version") and "workspace.package" in cargo_toml:
-            break
-    # Fall back to aura crate version.
     aura_toml = (REPO_ROOT / "aura" / "Cargo.toml").read_text(encoding="utf-8")
-    for line in aura_toml.splitlines():
-        if line.strip().startswith("version"):
-            return line.split("=", 1)[1].strip().strip('"')
-    return "0.1.0"
+    if tomllib is None:
+        for line in aura_toml.splitlines():
+            if line.strip().startswith("version"):
+                return line.split("=", 1)[1].strip().strip('"')
+        return "0.1.0"
+
+    version = tomllib.loads(aura_toml).get("package", {}).get("version", "0.1.0")
+    if isinstance(version, dict):
+        # version.workspace = true: inherit from [workspace.package].
+        workspace = tomllib.loads((REPO_ROOT / "Cargo.toml").read_text(encoding="utf-8"))
+        version = workspace.get("workspace", {}).get("package", {}).get("version", "0.1.0")
+    return version
 
 
 def host_tag() -> str:
@@ -139,47 +193,332 @@ def host_tag() -> str:
     return f"linux-{arch}"
 
 
+def _copy_file(src: str, dst: str) -> None:
+    """Copy one file without bouncing the bytes through Python.
+
+    copy_file_range keeps the copy in the kernel (and reflinks on CoW
+    filesystems); elsewhere shutil.copy2 already uses sendfile/fcopyfile/CopyFile.
+    """
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    shutil.copy2(src, dst)
+
+
 def copy_tree(src: Path, dst: Path) -> None:
     if dst.exists():
         shutil.rmtree(dst)
-    shutil.copytree(src, dst)
+    pairs: list[tuple[str, str]] = []
+    for dirpath, _, filenames in os.walk(src, followlinks=True):
+        out_dir = os.path.join(dst, os.path.relpath(dirpath, src))
+        os.makedirs(out_dir, exist_ok=True)
+        pairs.extend((os.path.join(dirpath, fn), os.path.join(out_dir, fn)) for fn in filenames)
+    # Pure I/O: overlap the per-file copies.
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as ex:
+        list(ex.map(lambda pair: _copy_file(*pair), pairs))
 
 
-def zip_write_deterministic(z: zipfile.ZipFile, src: Path, arcname: str) -> None:
-    """Write a file to a zip with deterministic metadata.
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device, unsupported filesystem, or link limit reached.
+        _copy_file(src, dst)
 
-    zipfile.ZipFile.write() captures filesystem mtimes and can vary across runs.
-    For reproducible artifacts, we fix timestamps and permissions.
+
+def link_tree(src: Path, dst: Path) -> None:
+    """Mirror an already-staged tree using hardlinks (copies where linking fails).
+
+    Zips only read file content and mode, so linked entries produce the same
+    archive as copied ones without duplicating the bytes on disk.
     """
 
-    data = src.read_bytes()
-    info = zipfile.ZipInfo(filename=arcname)
-    # Earliest representable DOS timestamp in zip.
-    info.date_time = (1980, 1, 1, 0, 0, 0)
+    if dst.exists():
+        shutil.rmtree(dst)
+    for dirpath, _, filenames in os.walk(src):
+        out_dir = os.path.join(dst, os.path.relpath(dirpath, src))
+        os.makedirs(out_dir, exist_ok=True)
+        for fn in filenames:
+            _link_or_copy(os.path.join(dirpath, fn), os.path.join(out_dir, fn))
+
+
+# Already-compressed formats: deflating them again burns CPU for nothing.
+# Native code (.dll/.so/.dylib) is deliberately absent; it still deflates well.
+_INCOMPRESSIBLE_EXT = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".webp", ".woff", ".woff2", ".gz", ".tgz", ".xz", ".zst", ".bz2", ".zip", ".jar", ".aar", ".apk", ".vsix"}
+)
+_COMPRESS_SAMPLE = 64 * 1024
+
+
+def _compress_type_for(arcname: str, head: bytes) -> int:
+    """ZIP_STORED for entries that will not shrink, judged by extension or a quick trial on head.
+
+    The trial always uses stock zlib so the choice depends only on content.
+    """
+
+    if os.path.splitext(arcname)[1].lower() in _INCOMPRESSIBLE_EXT:
+        return zipfile.ZIP_STORED
+    if len(head) >= 4096 and len(zlib.compress(head, 1)) > 0.97 * len(head):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+# 1980-01-01T00:00:00Z, the earliest timestamp a zip entry can hold.
+_DOS_EPOCH = 315532800
+
+
+@functools.lru_cache(maxsize=1)
+def zip_date_time() -> tuple[int, int, int, int, int, int]:
+    """Entry timestamp for reproducible zips: SOURCE_DATE_EPOCH if set, else 1980-01-01.
+
+    Clamped to the DOS range (1980..2107) and rounded down to even seconds,
+    which is all the format can store.
+    """
 
-    # Preserve basic executable bit on Unix; otherwise default to 0644.
-    is_exe = False
     try:
-        is_exe = bool(src.stat().st_mode & 0o111)
-    except Exception:
-        is_exe = False
-    perm = 0o755 if is_exe else 0o644
+        epoch = int(os.environ.get("SOURCE_DATE_EPOCH", _DOS_EPOCH))
+    except ValueError:
+        raise SystemExit("SOURCE_DATE_EPOCH must be an integer (seconds since 1970-01-01 UTC)")
+    y, mo, d, h, mi, sec = time.gmtime(max(epoch, _DOS_EPOCH))[:6]
+    if y > 2107:
+        return (2107, 12, 31, 23, 59, 58)
+    return (y, mo, d, h, mi, sec - sec % 2)
+
+
+@functools.lru_cache(maxsize=None)
+def _zipinfo_template(perm: int) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo()
+    info.date_time = zip_date_time()
     info.external_attr = (perm & 0xFFFF) << 16
+    info.compress_type = zipfile.ZIP_DEFLATED
+    return info
+
+
+def _deterministic_zipinfo(arcname: str, perm: int) -> zipfile.ZipInfo:
+    # Shallow-copy a per-mode template; only the name differs between entries.
+    info = copy.copy(_zipinfo_template(perm))
+    info.filename = info.orig_filename = arcname
+    return info
+
+
+def iter_files(root: Path):
+    """Yield every non-directory under root; one readdir per directory, no per-entry Path probing."""
 
-    z.writestr(info, data, compress_type=zipfile.ZIP_DEFLATED)
+    for dirpath, _, filenames in os.walk(root):
+        dp = Path(dirpath)
+        for fn in filenames:
+            yield dp / fn
+
+
+def zip_entries(root: Path) -> list[tuple[Path, str, int]]:
+    """(path, arcname, perm) for every file under root, sorted by arcname.
+
+    Arcnames are relative to dist/. Each file is stat'ed once: the same result
+    skips anything that is not a regular file and decides the mode, which keeps the basic
+    executable bit on Unix and is otherwise 0644.
+    """
+
+    entries: list[tuple[Path, str, int]] = []
+    for p in iter_files(root):
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            continue
+        perm = 0o755 if st.st_mode & 0o111 else 0o644
+        entries.append((p, p.relative_to(DIST_DIR).as_posix(), perm))
+    entries.sort(key=lambda e: e[1])
+    return entries
+
+
+def zip_write_deterministic(z: zipfile.ZipFile, src: Path, arcname: str, perm: int) -> None:
+    """Write a file to a zip with deterministic metadata.
+
+    zipfile.ZipFile.write() captures filesystem mtimes and can vary across runs.
+    For reproducible artifacts, we fix timestamps and take permissions from the
+    caller (see zip_entries).
+    """
+
+    info = _deterministic_zipinfo(arcname, perm)
+
+    # Stream in 1 MiB chunks so large binaries are never held in memory whole.
+    with src.open("rb") as sf:
+        # Lets zipfile decide up front whether the entry needs zip64 headers.
+        info.file_size = os.fstat(sf.fileno()).st_size
+        head = sf.read(_COMPRESS_SAMPLE)
+        info.compress_type = _compress_type_for(arcname, head)
+        with z.open(info, "w") as zf:
+            zf.write(head)
+            shutil.copyfileobj(sf, zf, length=1 << 20)
 
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        while True:
-            chunk = f.read(1024 * 1024)
-            if not chunk:
-                break
-            h.update(chunk)
+        if hasattr(hashlib, "file_digest"):
+            # Hashes in C with the GIL released, so attestation threads overlap.
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        # mmap cannot map an empty file.
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+        return h.hexdigest()
+
+
+class _HashingWriter:
+    """Write-only file wrapper that feeds every byte into a running SHA-256.
+
+    It deliberately has no seek(): zipfile then streams entries with data
+    descriptors instead of rewinding to patch local headers, so the digest
+    covers exactly the bytes that end up on disk.
+    """
+
+    def __init__(self, fp) -> None:
+        self.fp = fp
+        self.h = hashlib.sha256()
+        self._pos = 0
+
+    def write(self, b) -> int:
+        self.h.update(b)
+        self._pos += len(b)
+        return self.fp.write(b)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def flush(self) -> None:
+        self.fp.flush()
+
+    def close(self) -> None:
+        self.fp.close()
+
+
+# Bump whenever the bytes write_staging_zip produces for the same inputs change.
+_ZIP_CACHE_VERSION = 2
+# Complete zip cache entries kept after each store (each is a full SDK zip);
+# a release writes two (SDK + Android), so this covers the last few builds.
+_ZIP_CACHE_KEEP = 6
+# Zips without a digest file are leftovers of interrupted stores once this old.
+_ZIP_CACHE_ORPHAN_AGE = 24 * 3600
+
+
+def _zip_cache_key(entries: list[tuple[Path, str, int]], digests: list[str]) -> str:
+    h = hashlib.sha256()
+    # Everything besides the entries that affects the output bytes.
+    h.update(
+        repr(
+            (
+                _ZIP_CACHE_VERSION,
+                zip_date_time(),
+                _deflate_zlib.__name__,
+                zlib.ZLIB_RUNTIME_VERSION,
+                sys.version_info[:2],
+            )
+        ).encode()
+    )
+    for (_, arcname, perm), digest in zip(entries, digests):
+        h.update(f"{arcname}\0{perm:o}\0{digest}\0".encode())
     return h.hexdigest()
 
 
+def _prune_zip_cache(cache_dir: Path) -> None:
+    """Evict all but the _ZIP_CACHE_KEEP most recently used zip cache entries.
+
+    An entry's .sha256 file is its recency marker (touched on every hit), so
+    the cached zip itself, which is hardlinked into dist/, keeps its mtime.
+    """
+
+    try:
+        digests = sorted(cache_dir.glob("*.zip.sha256"), key=lambda p: p.stat().st_mtime, reverse=True)
+        orphans = [
+            z
+            for z in cache_dir.glob("*.zip")
+            if not z.with_name(z.name + ".sha256").exists() and time.time() - z.stat().st_mtime > _ZIP_CACHE_ORPHAN_AGE
+        ]
+    except OSError:
+        return
+    stale = [d.with_name(d.name[: -len(".sha256")]) for d in digests[_ZIP_CACHE_KEEP:]]
+    # Digest first: an entry without one is never treated as a hit.
+    for p in [*digests[_ZIP_CACHE_KEEP:], *stale, *orphans]:
+        try:
+            p.unlink()
+        except OSError:
+            pass
+
+
+def write_staging_zip(
+    out_zip: Path,
+    staging: Path,
+    file_hashes: dict[str, str] | None = None,
+    cache_dir: Path | None = None,
+) -> str:
+    """Zip a staging dir (arcnames relative to dist/) and return the zip's sha256.
+
+    If file_hashes is given, it is filled with {arcname: sha256} of every entry.
+    With a cache_dir, zips are kept there keyed by their inputs; a hit is
+    linked into place and compression is skipped entirely. Only the
+    _ZIP_CACHE_KEEP most recently used entries are kept.
+    """
+
+    entries = zip_entries(staging)
+    cached: Path | None = None
+    if cache_dir is not None or file_hashes is not None:
+        # hashlib releases the GIL, so entry digests are taken in parallel.
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as ex:
+            digests = list(ex.map(lambda e: sha256_file(e[0]), entries))
+        if file_hashes is not None:
+            file_hashes.update((arcname, d) for (_, arcname, _), d in zip(entries, digests))
+    if cache_dir is not None:
+        cached = cache_dir / f"{_zip_cache_key(entries, digests)}.zip"
+        cached_sha = cached.with_name(cached.name + ".sha256")
+        try:
+            cached_digest = cached_sha.read_text(encoding="utf-8").strip() if cached.is_file() else ""
+        except OSError:
+            cached_digest = ""
+        if cached_digest:
+            publish(cached, out_zip)
+            try:
+                os.utime(cached_sha)
+            except OSError:
+                pass
+            print(f"(zip cache hit) {cached}")
+            return cached_digest
+
+    safe_replace_existing(out_zip)
+    with out_zip.open("wb") as f:
+        w = _HashingWriter(f)
+        with zipfile.ZipFile(w, "w", compression=zipfile.ZIP_DEFLATED, strict_timestamps=False) as z:
+            for src, arcname, perm in entries:
+                zip_write_deterministic(z, src, arcname, perm)
+    sha256 = w.h.hexdigest()
+
+    if cached is not None:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            publish(out_zip, cached)
+            # Written last (atomically): its presence marks the entry complete.
+            tmp_sha = cached_sha.with_name(f"{cached_sha.name}.{os.getpid()}.tmp")
+            tmp_sha.write_text(sha256, encoding="utf-8")
+            os.replace(tmp_sha, cached_sha)
+        except OSError as e:
+            print(f"(zip cache not updated: {e})")
+        _prune_zip_cache(cache_dir)
+    return sha256
+
+
 def repack_zip_deterministic(src_zip: Path, dst_zip: Path) -> None:
     """Repack a zip-like archive deterministically.
 
@@ -192,35 +531,115 @@ def repack_zip_deterministic(src_zip: Path, dst_zip: Path) -> None:
     with zipfile.ZipFile(src_zip, "r") as zin:
         infos = list(zin.infolist())
         infos.sort(key=lambda i: i.filename)
-        with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as zout:
+        with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED, strict_timestamps=False) as zout:
             for i in infos:
                 if i.is_dir():
                     continue
-                data = zin.read(i.filename)
                 out_i = zipfile.ZipInfo(filename=i.filename)
-                out_i.date_time = (1980, 1, 1, 0, 0, 0)
+                out_i.date_time = zip_date_time()
                 out_i.external_attr = i.external_attr
-                zout.writestr(out_i, data, compress_type=zipfile.ZIP_DEFLATED)
+                out_i.compress_type = zipfile.ZIP_DEFLATED
+                # Known up front so zipfile only emits zip64 headers when needed.
+                out_i.file_size = i.file_size
+                with zin.open(i) as ri, zout.open(out_i, "w") as ro:
+                    shutil.copyfileobj(ri, ro, length=1 << 20)
 
     safe_replace_existing(dst_zip)
     tmp.rename(dst_zip)
 
 
-def write_attestation(path: Path, meta: dict) -> None:
+def write_attestation(
+    path: Path, meta: dict, sha256: str | None = None, files: dict[str, str] | None = None
+) -> None:
     out = path.with_suffix(path.suffix + ".attestation.json")
+    if sha256 is None and path.exists():
+        sha256 = sha256_file(path)
     payload = {
         "schema": "aura.attestation.v1",
         "artifact": str(path.as_posix()),
-        "sha256": sha256_file(path) if path.exists() else None,
+        "sha256": sha256,
         "meta": meta,
     }
+    if files:
+        # Per-entry digests of archive contents, keyed by arcname.
+        payload["files"] = files
     out.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
 
 
-def newest_file(paths: list[Path]) -> Path | None:
-    if not paths:
+def publish(src: Path, dst: Path) -> None:
+    """Place an identical copy of src at dst: a hardlink when possible, else a real copy.
+
+    Safe because artifacts are always replaced (unlink + rewrite), never
+    modified in place after publishing.
+    """
+
+    safe_replace_existing(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def newest_file(dirs: list[Path], suffix: str) -> Path | None:
+    """Most recently modified file named *suffix across dirs (missing dirs are skipped).
+
+    One scandir per dir; DirEntry carries the stat data, so candidates are not
+    stat'ed again.
+    """
+
+    suffix = os.path.normcase(suffix)
+    best: tuple[float, str] | None = None
+    for d in dirs:
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue
+        with it:
+            for de in it:
+                if not os.path.normcase(de.name).endswith(suffix) or not de.is_file():
+                    continue
+                mtime = de.stat().st_mtime
+                if best is None or mtime > best[0]:
+                    best = (mtime, de.path)
+    return Path(best[1]) if best is not None else None
+
+
+@functools.lru_cache(maxsize=None)
+def stage_z3_dlls_once(cache_dir: Path) -> Path:
+    """Copy the Windows Z3/VC runtime DLLs into cache_dir (once per run) and return it."""
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    if Z3_WIN_BIN.is_dir():
+        for name in Z3_WIN_DLLS:
+            p = Z3_WIN_BIN / name
+            if p.exists():
+                safe_replace_existing(cache_dir / name)
+                shutil.copy2(p, cache_dir / name)
+    return cache_dir
+
+
+def stage_z3_dlls(dst_dir: Path) -> None:
+    """Hardlink the staged Z3 DLLs into dst_dir; they are never modified after staging."""
+
+    cached = stage_z3_dlls_once(DIST_DIR / ".z3-dlls")
+    for name in Z3_WIN_DLLS:
+        p = cached / name
+        if p.exists():
+            publish(p, dst_dir / name)
+
+
+@functools.lru_cache(maxsize=1)
+def host_target_triple() -> str | None:
+    """Rust host triple from `rustc -vV` (spawned once per run)."""
+
+    try:
+        out = subprocess.check_output(["rustc", "-vV"], cwd=str(REPO_ROOT)).decode("utf-8", "replace")
+    except Exception:
         return None
-    return max(paths, key=lambda p: p.stat().st_mtime)
+    for line in out.splitlines():
+        if line.startswith("host:"):
+            return line.split(":", 1)[1].strip()
+    return None
 
 
 def stage_sentinel_sidecar(sentinel_app_dir: Path, lsp_bin: Path, env: dict[str, str]) -> None:
@@ -236,16 +655,7 @@ def stage_sentinel_sidecar(sentinel_app_dir: Path, lsp_bin: Path, env: dict[str,
 
     exe = ".exe" if os.name == "nt" else ""
     # Tauri expects sidecars to be suffixed by the target triple at build time.
-    target_triple = None
-    try:
-        out = subprocess.check_output(["rustc", "-vV"], cwd=str(REPO_ROOT)).decode("utf-8", "replace")
-        for line in out.splitlines():
-            if line.startswith("host:"):
-                target_triple = line.split(":", 1)[1].strip()
-                break
-    except Exception:
-        target_triple = None
-
+    target_triple = host_target_triple()
     if target_triple:
         shutil.copy2(lsp_bin, bin_dir / f"aura-lsp-{target_triple}{exe}")
 
@@ -254,23 +664,7 @@ def stage_sentinel_sidecar(sentinel_app_dir: Path, lsp_bin: Path, env: dict[str,
 
     # Bundle Z3 DLLs on Windows so the sidecar runs on clean machines.
     if os.name == "nt":
-        z3_bin = REPO_ROOT / "tools" / "z3" / "dist" / "z3-4.15.4-x64-win" / "bin"
-        if z3_bin.is_dir():
-            for name in [
-                "libz3.dll",
-                "vcruntime140.dll",
-                "vcruntime140_1.dll",
-                "msvcp140.dll",
-                "msvcp140_1.dll",
-                "msvcp140_2.dll",
-                "vcomp140.dll",
-                "msvcp140_atomic_wait.dll",
-                "msvcp140_codecvt_ids.dll",
-                "vcruntime140_threads.dll",
-            ]:
-                p = z3_bin / name
-                if p.exists():
-                    shutil.copy2(p, bin_dir / name)
+        stage_z3_dlls(bin_dir)
 
 
 def sentinel_candidate_release_dirs(sentinel_app_dir: Path, env: dict[str, str]) -> list[Path]:
@@ -281,13 +675,17 @@ def sentinel_candidate_release_dirs(sentinel_app_dir: Path, env: dict[str, str])
       editors/sentinel-app/src-tauri/<target-dir>/release/
     """
 
+    return list(_sentinel_candidate_release_dirs(sentinel_app_dir, env.get("CARGO_TARGET_DIR")))
+
+
+@functools.lru_cache(maxsize=None)
+def _sentinel_candidate_release_dirs(sentinel_app_dir: Path, cargo_target_dir: str | None) -> tuple[Path, ...]:
     src_tauri = sentinel_app_dir / "src-tauri"
     candidates: list[Path] = [
         src_tauri / "target" / "release",
         src_tauri / "target-lsp-test" / "release",
     ]
 
-    cargo_target_dir = env.get("CARGO_TARGET_DIR")
     if cargo_target_dir:
         p = Path(cargo_target_dir)
         if p.is_absolute():
@@ -297,20 +695,21 @@ def sentinel_candidate_release_dirs(sentinel_app_dir: Path, env: dict[str, str])
             candidates.insert(0, src_tauri / p / "release")
 
     # Deduplicate while preserving order.
-    seen: set[Path] = set()
-    out: list[Path] = []
-    for d in candidates:
-        if d in seen:
-            continue
-        seen.add(d)
-        out.append(d)
-    return out
+    return tuple(dict.fromkeys(candidates))
 
 
 def main() -> int:
-    ap = argparse.ArgumentParser()
+    ap = argparse.ArgumentParser(
+        epilog="Zip entries are stamped with SOURCE_DATE_EPOCH when set (default: 1980-01-01T00:00:00Z)."
+    )
     ap.add_argument("--features", default="z3,lumina-raylib", help="Cargo features for aura build")
     ap.add_argument("--no-build", action="store_true", help="Skip cargo builds")
+    ap.add_argument(
+        "--no-zip-cache",
+        action="store_true",
+        help="Always re-zip SDK staging instead of reusing a cached zip with identical inputs "
+        "(cache: $AURA_RELEASE_CACHE or ~/.cache/aura-release).",
+    )
     ap.add_argument(
         "--android-arm64",
         action="store_true",
@@ -350,36 +749,70 @@ def main() -> int:
 
     env = os.environ.copy()
 
-    npm = "npm.cmd" if os.name == "nt" else "npm"
+    # Attestations are hashed together once every artifact is on disk; zips we
+    # write ourselves are hashed on the way out and recorded here.
+    pending_attest: list[tuple[Path, dict]] = []
+    known_sha256: dict[Path, str] = {}
+    known_files: dict[Path, dict[str, str]] = {}
 
-    if not args.no_build:
-        run(["cargo", "build", "-p", "aura", "--release", "--locked", "--features", args.features])
-        run(["cargo", "build", "-p", "aura-lsp", "--release", "--locked"])
+    zip_cache: Path | None = None
+    if not args.no_zip_cache:
+        zip_cache = Path(env.get("AURA_RELEASE_CACHE") or Path.home() / ".cache" / "aura-release")
 
-        if args.android_arm64:
-            ndk_home = env.get("ANDROID_NDK_HOME") or env.get("ANDROID_NDK_ROOT")
-            if not ndk_home:
-                raise SystemExit("--android-arm64 requires ANDROID_NDK_HOME (or ANDROID_NDK_ROOT)")
+    npm = "npm.cmd" if os.name == "nt" else "npm"
 
-            # Ensure the target is installed.
-            run(["rustup", "target", "add", "aarch64-linux-android"], env=env)
+    if not args.no_build:
+        # One cargo invocation for both host packages: a single build graph and
+        # one pass over the shared workspace deps. Features are qualified because
+        # they belong to `aura` (they unify onto deps aura-lsp shares with it).
+        aura_features = ",".join(f if "/" in f else f"aura/{f}" for f in args.features.split(",") if f)
+
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            android_build = None
+            if args.android_arm64:
+                ndk_home = env.get("ANDROID_NDK_HOME") or env.get("ANDROID_NDK_ROOT")
+                if not ndk_home:
+                    raise SystemExit("--android-arm64 requires ANDROID_NDK_HOME (or ANDROID_NDK_ROOT)")
+
+                # Ensure the target is installed.
+                run(["rustup", "target", "add", "aarch64-linux-android"], env=env)
+
+                # Build the SDK binary for Android alongside the host build. It
+                # gets its own target dir so the two cargo processes don't wait
+                # on each other's build-directory lock.
+                android_build = ex.submit(
+                    run,
+                    [
+                        "cargo",
+                        "build",
+                        "-p",
+                        "aura",
+                        "--release",
+                        "--locked",
+                        "--features",
+                        args.features,
+                        "--target",
+                        "aarch64-linux-android",
+                    ],
+                    env={**env, "CARGO_TARGET_DIR": str(ANDROID_TARGET_DIR)},
+                )
 
-            # Build the SDK binary for Android.
             run(
                 [
                     "cargo",
                     "build",
                     "-p",
                     "aura",
+                    "-p",
+                    "aura-lsp",
                     "--release",
                     "--locked",
                     "--features",
-                    args.features,
-                    "--target",
-                    "aarch64-linux-android",
-                ],
-                env=env,
+                    aura_features,
+                ]
             )
+            if android_build is not None:
+                android_build.result()
 
     exe = ".exe" if os.name == "nt" else ""
     aura_bin = REPO_ROOT / "target" / "release" / f"aura{exe}"
@@ -406,44 +839,24 @@ def main() -> int:
 
     # Bundle Z3 DLLs on Windows for a "no missing DLL" experience.
     if os.name == "nt":
-        z3_bin = REPO_ROOT / "tools" / "z3" / "dist" / "z3-4.15.4-x64-win" / "bin"
-        if z3_bin.is_dir():
-            for name in [
-                "libz3.dll",
-                "vcruntime140.dll",
-                "vcruntime140_1.dll",
-                "msvcp140.dll",
-                "msvcp140_1.dll",
-                "msvcp140_2.dll",
-                "vcomp140.dll",
-                "msvcp140_atomic_wait.dll",
-                "msvcp140_codecvt_ids.dll",
-                "vcruntime140_threads.dll",
-            ]:
-                p = z3_bin / name
-                if p.exists():
-                    shutil.copy2(p, SDK_STAGING / "bin" / name)
+        stage_z3_dlls(SDK_STAGING / "bin")
 
     out_zip = DIST_DIR / f"aura-sdk-v{version}-{tag}.zip"
-    safe_replace_existing(out_zip)
-
-    with zipfile.ZipFile(out_zip, "w", compression=zipfile.ZIP_DEFLATED) as z:
-        files = [p for p in SDK_STAGING.rglob("*") if p.is_file()]
-        files.sort(key=lambda p: p.relative_to(DIST_DIR).as_posix())
-        for p in files:
-            rel = p.relative_to(DIST_DIR).as_posix()
-            zip_write_deterministic(z, p, rel)
-
+    if args.attest:
+        known_files[out_zip] = {}
+    known_sha256[out_zip] = write_staging_zip(out_zip, SDK_STAGING, known_files.get(out_zip), zip_cache)
     print(f"wrote {out_zip}")
 
     if args.attest:
-        write_attestation(
-            out_zip,
-            {
-                "kind": "sdk-zip",
-                "version": version,
-                "platform": tag,
-            },
+        pending_attest.append(
+            (
+                out_zip,
+                {
+                    "kind": "sdk-zip",
+                    "version": version,
+                    "platform": tag,
+                },
+            )
         )
 
     # Optional Android ARM64 SDK zip.
@@ -454,40 +867,41 @@ def main() -> int:
             shutil.rmtree(android_staging)
         (android_staging / "bin").mkdir(parents=True)
 
-        android_aura = REPO_ROOT / "target" / "aarch64-linux-android" / "release" / "aura"
+        android_aura = ANDROID_TARGET_DIR / "aarch64-linux-android" / "release" / "aura"
         if not android_aura.exists():
             raise SystemExit(f"missing Android build output: {android_aura}")
 
         shutil.copy2(android_aura, android_staging / "bin" / "aura")
 
-        copy_tree(REPO_ROOT / "sdk" / "std", android_staging / "std")
-        copy_tree(REPO_ROOT / "sdk" / "docs", android_staging / "docs")
-        copy_tree(REPO_ROOT / "sdk" / "styles", android_staging / "styles")
-        if (REPO_ROOT / "sdk" / "android").is_dir():
-            copy_tree(REPO_ROOT / "sdk" / "android", android_staging / "android")
-        if (REPO_ROOT / "samples" / "android").is_dir():
-            copy_tree(REPO_ROOT / "samples" / "android", android_staging / "samples" / "android")
-        shutil.copy2(REPO_ROOT / "sdk" / "install.ps1", android_staging / "install.ps1")
-        shutil.copy2(REPO_ROOT / "sdk" / "install.sh", android_staging / "install.sh")
+        # Same content as the host SDK; hardlink it from that staging instead of copying.
+        link_tree(SDK_STAGING / "std", android_staging / "std")
+        link_tree(SDK_STAGING / "docs", android_staging / "docs")
+        link_tree(SDK_STAGING / "styles", android_staging / "styles")
+        if (SDK_STAGING / "android").is_dir():
+            link_tree(SDK_STAGING / "android", android_staging / "android")
+        if (SDK_STAGING / "samples" / "android").is_dir():
+            link_tree(SDK_STAGING / "samples" / "android", android_staging / "samples" / "android")
+        _link_or_copy(str(SDK_STAGING / "install.ps1"), str(android_staging / "install.ps1"))
+        _link_or_copy(str(SDK_STAGING / "install.sh"), str(android_staging / "install.sh"))
 
         android_zip = DIST_DIR / f"aura-sdk-v{version}-{android_tag}.zip"
-        safe_replace_existing(android_zip)
-        with zipfile.ZipFile(android_zip, "w", compression=zipfile.ZIP_DEFLATED) as z:
-            files = [p for p in android_staging.rglob("*") if p.is_file()]
-            files.sort(key=lambda p: p.relative_to(DIST_DIR).as_posix())
-            for p in files:
-                rel = p.relative_to(DIST_DIR).as_posix()
-                zip_write_deterministic(z, p, rel)
+        if args.attest:
+            known_files[android_zip] = {}
+        known_sha256[android_zip] = write_staging_zip(
+            android_zip, android_staging, known_files.get(android_zip), zip_cache
+        )
         print(f"wrote {android_zip}")
 
         if args.attest:
-            write_attestation(
-                android_zip,
-                {
-                    "kind": "sdk-zip",
-                    "version": version,
-                    "platform": android_tag,
-                },
+            pending_attest.append(
+                (
+                    android_zip,
+                    {
+                        "kind": "sdk-zip",
+                        "version": version,
+                        "platform": android_tag,
+                    },
+                )
             )
 
     vsix_out = DIST_DIR / f"aura-sentinel-v{version}.vsix"
@@ -516,12 +930,14 @@ def main() -> int:
         print(f"wrote {vsix_out}")
 
         if args.attest:
-            write_attestation(
-                vsix_out,
-                {
-                    "kind": "vsix",
-                    "version": version,
-                },
+            pending_attest.append(
+                (
+                    vsix_out,
+                    {
+                        "kind": "vsix",
+                        "version": version,
+                    },
+                )
             )
 
     if args.sentinel_app:
@@ -530,8 +946,9 @@ def main() -> int:
         run([npm, "ci"], cwd=sentinel_app_dir, env=env)
         run([npm, "run", "tauri:build"], cwd=sentinel_app_dir, env=env)
 
+        release_dirs = sentinel_candidate_release_dirs(sentinel_app_dir, env)
         produced_exe: Path | None = None
-        for release_dir in sentinel_candidate_release_dirs(sentinel_app_dir, env):
+        for release_dir in release_dirs:
             candidate = release_dir / f"aura-sentinel-app{exe}"
             if candidate.exists():
                 produced_exe = candidate
@@ -541,170 +958,179 @@ def main() -> int:
                 "missing Sentinel app output (checked: "
                 + ", ".join(
                     str(d / f"aura-sentinel-app{exe}")
-                    for d in sentinel_candidate_release_dirs(sentinel_app_dir, env)
+                    for d in release_dirs
                 )
                 + ")"
             )
 
+        to_sign: list[Path] = []
+        latest_links: list[tuple[Path, Path]] = []
+
         safe_replace_existing(app_out)
         shutil.copy2(produced_exe, app_out)
         print(f"wrote {app_out}")
 
         if args.attest:
-            write_attestation(
-                app_out,
-                {
-                    "kind": "sentinel-app",
-                    "version": version,
-                    "platform": tag,
-                },
+            pending_attest.append(
+                (
+                    app_out,
+                    {
+                        "kind": "sentinel-app",
+                        "version": version,
+                        "platform": tag,
+                    },
+                )
             )
 
-        maybe_sign_windows(app_out, args.sign, env)
-
-        safe_replace_existing(app_latest)
-        shutil.copy2(produced_exe, app_latest)
-        print(f"wrote {app_latest}")
+        to_sign.append(app_out)
+        # Same bytes as app_out, signature included: linked once signing is done.
+        latest_links.append((app_out, app_latest))
 
         if args.attest:
-            write_attestation(
-                app_latest,
-                {
-                    "kind": "sentinel-app",
-                    "version": version,
-                    "platform": tag,
-                    "channel": "latest",
-                },
+            pending_attest.append(
+                (
+                    app_latest,
+                    {
+                        "kind": "sentinel-app",
+                        "version": version,
+                        "platform": tag,
+                        "channel": "latest",
+                    },
+                )
             )
 
-        maybe_sign_windows(app_latest, args.sign, env)
-
         # If bundling is enabled, Tauri will also produce installers under:
         # src-tauri/<target-dir>/release/bundle/{msi,nsis}/
-        bundle_dirs = [d / "bundle" for d in sentinel_candidate_release_dirs(sentinel_app_dir, env)]
+        bundle_dirs = [d / "bundle" for d in release_dirs]
 
-        msi_candidates: list[Path] = []
-        for bd in bundle_dirs:
-            if bd.exists():
-                msi_candidates.extend(list((bd / "msi").glob("*.msi")))
-
-        msi_src = newest_file(msi_candidates)
+        msi_src = newest_file([bd / "msi" for bd in bundle_dirs], ".msi")
         if msi_src is not None and msi_src.exists():
             safe_replace_existing(msi_out)
             shutil.copy2(msi_src, msi_out)
             print(f"wrote {msi_out}")
 
             if args.attest:
-                write_attestation(
-                    msi_out,
-                    {
-                        "kind": "msi",
-                        "version": version,
-                        "platform": tag,
-                    },
+                pending_attest.append(
+                    (
+                        msi_out,
+                        {
+                            "kind": "msi",
+                            "version": version,
+                            "platform": tag,
+                        },
+                    )
                 )
 
-            maybe_sign_windows(msi_out, args.sign, env)
-
-            safe_replace_existing(msi_latest)
-            shutil.copy2(msi_src, msi_latest)
-            print(f"wrote {msi_latest}")
+            to_sign.append(msi_out)
+            # Same bytes as msi_out, signature included: linked once signing is done.
+            latest_links.append((msi_out, msi_latest))
 
             if args.attest:
-                write_attestation(
-                    msi_latest,
-                    {
-                        "kind": "msi",
-                        "version": version,
-                        "platform": tag,
-                        "channel": "latest",
-                    },
+                pending_attest.append(
+                    (
+                        msi_latest,
+                        {
+                            "kind": "msi",
+                            "version": version,
+                            "platform": tag,
+                            "channel": "latest",
+                        },
+                    )
                 )
 
-            maybe_sign_windows(msi_latest, args.sign, env)
-
-        nsis_candidates: list[Path] = []
-        for bd in bundle_dirs:
-            if bd.exists():
-                nsis_candidates.extend(list((bd / "nsis").glob(f"*{exe}")))
-
-        nsis_src = newest_file(nsis_candidates)
+        nsis_src = newest_file([bd / "nsis" for bd in bundle_dirs], exe)
         if nsis_src is not None and nsis_src.exists():
             safe_replace_existing(nsis_out)
             shutil.copy2(nsis_src, nsis_out)
             print(f"wrote {nsis_out}")
 
             if args.attest:
-                write_attestation(
-                    nsis_out,
-                    {
-                        "kind": "nsis",
-                        "version": version,
-                        "platform": tag,
-                    },
+                pending_attest.append(
+                    (
+                        nsis_out,
+                        {
+                            "kind": "nsis",
+                            "version": version,
+                            "platform": tag,
+                        },
+                    )
                 )
 
-            maybe_sign_windows(nsis_out, args.sign, env)
-
-            safe_replace_existing(nsis_latest)
-            shutil.copy2(nsis_src, nsis_latest)
-            print(f"wrote {nsis_latest}")
+            to_sign.append(nsis_out)
+            # Same bytes as nsis_out, signature included: linked once signing is done.
+            latest_links.append((nsis_out, nsis_latest))
 
             if args.attest:
-                write_attestation(
-                    nsis_latest,
-                    {
-                        "kind": "nsis",
-                        "version": version,
-                        "platform": tag,
-                        "channel": "latest",
-                    },
+                pending_attest.append(
+                    (
+                        nsis_latest,
+                        {
+                            "kind": "nsis",
+                            "version": version,
+                            "platform": tag,
+                            "channel": "latest",
+                        },
+                    )
                 )
 
-            maybe_sign_windows(nsis_latest, args.sign, env)
+        # One signtool run (one timestamp-server round-trip) covers every
+        # artifact; the latest aliases are then linked to the signed files.
+        maybe_sign_windows(to_sign, args.sign, env)
+        for src, dst in latest_links:
+            publish(src, dst)
+            print(f"wrote {dst}")
+
+    if pending_attest:
+        with ThreadPoolExecutor(max_workers=min(8, len(pending_attest))) as ex:
+            list(
+                ex.map(
+                    lambda pm: write_attestation(*pm, known_sha256.get(pm[0]), known_files.get(pm[0])),
+                    pending_attest,
+                )
+            )
 
     if args.website:
         downloads = REPO_ROOT / "website" / "public" / "downloads"
         downloads.mkdir(parents=True, exist_ok=True)
 
         # Versioned artifacts.
-        shutil.copy2(out_zip, downloads / out_zip.name)
+        publish(out_zip, downloads / out_zip.name)
         print(f"copied to {downloads / out_zip.name}")
 
         if vsix_out.exists():
-            shutil.copy2(vsix_out, downloads / vsix_out.name)
+            publish(vsix_out, downloads / vsix_out.name)
             print(f"copied to {downloads / vsix_out.name}")
 
         if app_out.exists():
-            shutil.copy2(app_out, downloads / app_out.name)
+            publish(app_out, downloads / app_out.name)
             print(f"copied to {downloads / app_out.name}")
 
         if msi_out.exists():
-            shutil.copy2(msi_out, downloads / msi_out.name)
+            publish(msi_out, downloads / msi_out.name)
             print(f"copied to {downloads / msi_out.name}")
 
         if nsis_out.exists():
-            shutil.copy2(nsis_out, downloads / nsis_out.name)
+            publish(nsis_out, downloads / nsis_out.name)
             print(f"copied to {downloads / nsis_out.name}")
 
         # Stable 'latest' names expected by the website downloads page.
-        shutil.copy2(out_zip, downloads / "aura-sdk.zip")
+        publish(out_zip, downloads / "aura-sdk.zip")
         print(f"copied to {downloads / 'aura-sdk.zip'}")
 
         if vsix_out.exists():
-            shutil.copy2(vsix_out, downloads / "aura-sentinel.vsix")
+            publish(vsix_out, downloads / "aura-sentinel.vsix")
             print(f"copied to {downloads / 'aura-sentinel.vsix'}")
 
         if app_latest.exists():
-            shutil.copy2(app_latest, downloads / app_latest.name)
+            publish(app_latest, downloads / app_latest.name)
             print(f"copied to {downloads / app_latest.name}")
 
         if msi_latest.exists():
-            shutil.copy2(msi_latest, downloads / msi_latest.name)
+            publish(msi_latest, downloads / msi_latest.name)
             print(f"copied to {downloads / msi_latest.name}")
 
         if nsis_latest.exists():
-            shutil.copy2(nsis_latest, downloads / nsis_latest.name)
+            publish(nsis_latest, downloads / nsis_latest.name)
             print(f"copied to {downloads / nsis_latest.name}")
 
     return 0
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
 import os
 import re
 import subprocess
 import sys
-from dataclasses import dataclass
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -15,13 +20,32 @@ EXAMPLES_DIR = REPO_ROOT / "examples"
 DIST_AURA_EXE = REPO_ROOT / "dist-release" / "bin" / "aura.exe"
 DEBUG_AURA_EXE = REPO_ROOT / "target" / "debug" / "aura.exe"
 
-
+# Compiled once; discovery runs these over every README / .aura file.
+_PS_FENCE_RE = re.compile(r"^```\s*(powershell|pwsh)\s*$", re.IGNORECASE)
+_AURA_RUN_RE = re.compile(r"\baura(\.exe)?\s+run\b")
+# All .aura classifiers in one left-to-right pass over raw bytes (see
+# _classify_aura); group N sets flag bit 1 << (N - 1).
+_AURA_CLASSIFY_RE = re.compile(
+    rb"(?P<main>^\s*cell\s+main\s*\()"
+    rb"|(?P<q>\b(?:forall|exists)\b)"
+    rb"|(?P<hw>\bhw\.(?:open|read_u32|write_u32)\b)",
+    re.MULTILINE,
+)
+# Only plausible plugin identifiers (aura-*) are captured; matched on raw bytes.
+_PLUGIN_NAME_RE = re.compile(rb'\bname\s*=\s*"(aura-[^"]+)"')
+_INT_RE = re.compile(r"\d+")
+_RANGE_RE = re.compile(r"(\d+)-(\d+)")
+
+
+@functools.lru_cache(maxsize=1)
 def _resolve_aura_exe() -> Path:
     """Pick an Aura binary that matches the current source tree.
 
     We prefer a locally built debug binary when available because dist-release
     can easily drift behind the workspace (and then fail on new syntax like
     hex colors in string literals).
+
+    Resolved once per run; every discovered example shares the answer.
     """
 
     env = os.environ.get("AURA_EXE")
@@ -44,6 +68,11 @@ class Example:
     workdir: Path
     kind: str  # "run" | "verify" | "custom"
     command_ps_lines: list[str]
+    # str(workdir), computed once for the PowerShell Push-Location wrapper.
+    cwd_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "cwd_str", str(self.workdir))
 
     @property
     def preview(self) -> str:
@@ -62,34 +91,31 @@ def _read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8", errors="replace")
 
 
-def _find_powershell_code_blocks(md: str) -> list[list[str]]:
-    blocks: list[list[str]] = []
-    lines = md.splitlines()
-    i = 0
-    while i < len(lines):
-        line = lines[i].rstrip("\n")
-        m = re.match(r"^```\s*(powershell|pwsh)\s*$", line.strip(), flags=re.IGNORECASE)
-        if not m:
-            i += 1
+def _iter_powershell_code_blocks(md: str) -> Iterator[list[str]]:
+    """Yield powershell/pwsh fenced blocks lazily so callers can stop at the first hit."""
+
+    # One shared iterator: the inner loop consumes the closing fence itself.
+    it = iter(md.splitlines())
+    for line in it:
+        if not _PS_FENCE_RE.match(line.strip()):
             continue
-        i += 1
         block: list[str] = []
-        while i < len(lines) and not lines[i].strip().startswith("```"):
-            block.append(lines[i].rstrip("\n"))
-            i += 1
-        blocks.append(block)
-        while i < len(lines) and not lines[i].strip().startswith("```"):
-            i += 1
-        if i < len(lines) and lines[i].strip().startswith("```"):
-            i += 1
-    return blocks
+        for inner in it:
+            if inner.lstrip().startswith("```"):
+                break
+            block.append(inner)
+        yield block
 
 
 def _extract_inline_backticked_commands(md: str) -> list[str]:
-    # Captures `...` that look like commands.
+    # Captures `...` that look like commands: odd split() pieces are the
+    # backticked spans. Multi-line spans are fence bodies, not inline commands.
     cmds: list[str] = []
-    for m in re.finditer(r"`([^`]+)`", md):
-        s = m.group(1).strip()
+    parts = md.split("`")
+    for i in range(1, len(parts), 2):
+        if "\n" in parts[i]:
+            continue
+        s = parts[i].strip()
         if "aura " in s or "cargo run -p aura" in s:
             cmds.append(s)
     return cmds
@@ -98,53 +124,77 @@ def _extract_inline_backticked_commands(md: str) -> list[str]:
 def _select_run_block_from_readme(readme: Path) -> Optional[list[str]]:
     md = _read_text(readme)
 
-    blocks = _find_powershell_code_blocks(md)
-    for block in blocks:
-        joined = "\n".join(block)
-        if "cargo run -p aura" in joined or re.search(r"\baura(\.exe)?\s+run\b", joined):
-            return [ln.strip() for ln in block if ln.strip() and not ln.strip().startswith("#")]
+    for block in _iter_powershell_code_blocks(md):
+        # Per-line tests short-circuit on the first hit; no joined block string.
+        if any("cargo run -p aura" in ln or _AURA_RUN_RE.search(ln) for ln in block):
+            return [s for ln in block if (s := ln.strip()) and not s.startswith("#")]
 
     inline_cmds = _extract_inline_backticked_commands(md)
     for cmd in inline_cmds:
-        if "cargo run -p aura" in cmd or re.search(r"\baura(\.exe)?\s+run\b", cmd):
+        if "cargo run -p aura" in cmd or _AURA_RUN_RE.search(cmd):
             return [cmd]
 
     return None
 
 
-def _file_has_main(aura_file: Path) -> bool:
+# _aura_flags() bits (ordered like the _AURA_CLASSIFY_RE groups).
+_HAS_MAIN = 1
+_USES_QUANTIFIERS = 2
+# hw.* are Z3 plugin calls (not AVM runtime), so such files should be verified rather than executed.
+_USES_IOT_HW = 4
+_ALL_FLAGS = _HAS_MAIN | _USES_QUANTIFIERS | _USES_IOT_HW
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_aura(path: str, mtime_ns: int) -> int:
+    """Classify an .aura file in one streaming pass.
+
+    Reads whole lines in ~64 KiB batches (so no match is split across a batch)
+    and stops as soon as every flag is set. The regex only runs on batches
+    containing a substring one of its branches requires. mtime_ns is only part
+    of the cache key: an edited file gets a fresh entry.
+    """
+
+    mask = 0
     try:
-        text = _read_text(aura_file)
+        with open(path, "rb") as f:
+            for lines in iter(lambda: f.readlines(65536), []):
+                buf = b"".join(lines)
+                if b"main" not in buf and b"forall" not in buf and b"exists" not in buf and b"hw." not in buf:
+                    continue
+                for m in _AURA_CLASSIFY_RE.finditer(buf):
+                    mask |= 1 << (m.lastindex - 1)
+                    if mask == _ALL_FLAGS:
+                        return mask
     except OSError:
-        return False
-    return re.search(r"(?m)^\s*cell\s+main\s*\(", text) is not None
+        return 0
+    return mask
 
 
-def _file_uses_quantifiers(aura_file: Path) -> bool:
+def _aura_flags(aura_file: Path) -> int:
     try:
-        text = _read_text(aura_file)
+        st = aura_file.stat()
     except OSError:
-        return False
-    return re.search(r"\b(forall|exists)\b", text) is not None
+        return 0
+    return _classify_aura(str(aura_file), st.st_mtime_ns)
 
 
-def _file_uses_iot_hw_contracts(aura_file: Path) -> bool:
+@functools.lru_cache(maxsize=1024)
+def _requested_plugins(path: str, mtime_ns: int) -> frozenset[str]:
     try:
-        text = _read_text(aura_file)
+        data = Path(path).read_bytes()
     except OSError:
-        return False
-    # These are Z3 plugin calls (not AVM runtime), so they should be verified rather than executed.
-    return re.search(r"\bhw\.(open|read_u32|write_u32)\b", text) is not None
+        return frozenset()
+    # Minimal parsing: collect plugin names like { name = "aura-iot", ... }
+    return frozenset(n.decode("utf-8", errors="replace") for n in _PLUGIN_NAME_RE.findall(data))
 
 
-def _parse_requested_plugins(aura_toml: Path) -> set[str]:
-    if not aura_toml.exists():
-        return set()
-    text = _read_text(aura_toml)
-    # Minimal parsing: collect plugin names like { name = "aura-iot", ... }
-    names = set(re.findall(r"\bname\s*=\s*\"([^\"]+)\"", text))
-    # Only keep plausible plugin identifiers.
-    return {n for n in names if n.startswith("aura-")}
+def _parse_requested_plugins(aura_toml: Path) -> frozenset[str]:
+    try:
+        st = aura_toml.stat()
+    except OSError:
+        return frozenset()
+    return _requested_plugins(str(aura_toml), st.st_mtime_ns)
 
 
 def _needs_z3_plugins(workdir: Path) -> bool:
@@ -153,151 +203,151 @@ def _needs_z3_plugins(workdir: Path) -> bool:
     return any(p in plugins for p in {"aura-iot", "aura-ai"})
 
 
+def _aura_files_in(d: Path) -> list[Path]:
+    """*.aura files directly in d, sorted by name (DirEntry type info, no per-file stat)."""
+
+    try:
+        with os.scandir(d) as it:
+            # Decorate with the DirEntry name so the sort key needs no Path.name.
+            files = sorted((e.name.casefold(), e.path) for e in it if e.name.endswith(".aura") and e.is_file())
+    except OSError:
+        return []
+    return [Path(path) for _, path in files]
+
+
+# Marker files, compared via normcase so the check stays case-insensitive on Windows.
+_EXAMPLE_MARKERS = {os.path.normcase("aura.toml"), os.path.normcase("README.md")}
+
+
 def _discover_example_dirs() -> list[Path]:
-    if not EXAMPLES_DIR.exists():
+    try:
+        top = os.scandir(EXAMPLES_DIR)
+    except OSError:
         return []
-    dirs: list[Path] = []
-    for child in EXAMPLES_DIR.iterdir():
-        if not child.is_dir():
-            continue
-        # Special folders are handled separately.
-        if child.name in {"root-aura", "verification"}:
-            continue
-        if (child / "aura.toml").exists() or (child / "README.md").exists():
-            dirs.append(child)
-    return sorted(dirs, key=lambda p: p.name.lower())
+    dirs: list[tuple[str, str]] = []
+    with top:
+        for child in top:
+            # Special folders are handled separately.
+            if child.name in {"root-aura", "verification"} or not child.is_dir():
+                continue
+            try:
+                with os.scandir(child.path) as it:
+                    names = {os.path.normcase(e.name) for e in it}
+            except OSError:
+                continue
+            if names & _EXAMPLE_MARKERS:
+                dirs.append((child.name.casefold(), child.path))
+    return [Path(path) for _, path in sorted(dirs)]
 
 
 def _discover_standalone_aura_files() -> list[Path]:
-    if not EXAMPLES_DIR.exists():
-        return []
-    files = [p for p in EXAMPLES_DIR.glob("*.aura") if p.is_file()]
-    return sorted(files, key=lambda p: p.name.lower())
+    return _aura_files_in(EXAMPLES_DIR)
+
+
+def _build_example(
+    path: Path, workdir: Path, *, kind: str, cmd_lines: list[str], title: Optional[str] = None
+) -> Example:
+    return Example(
+        id=path.relative_to(REPO_ROOT).as_posix(),
+        title=path.stem if title is None else title,
+        workdir=workdir,
+        kind=kind,
+        command_ps_lines=cmd_lines,
+    )
 
 
 def _default_aura_command_for_file(aura_file: Path, workdir: Path) -> Example:
+    flags = _aura_flags(aura_file)
+    runnable = flags & _HAS_MAIN and not flags & _USES_IOT_HW
+    smt = " --smt-profile thorough" if flags & _USES_QUANTIFIERS else ""
+
     # If the example requests built-in plugins that are gated behind cargo features,
     # run via cargo to ensure the binary includes them.
     if _needs_z3_plugins(workdir):
         # Run from the example folder so it can pick up aura.toml.
-        if _file_has_main(aura_file) and not _file_uses_iot_hw_contracts(aura_file):
+        if runnable:
             cmd = [f'cargo run -p aura --features z3 -- run "{aura_file.name}" --mode avm']
-            return Example(
-                id=str(aura_file.relative_to(REPO_ROOT)).replace("\\", "/"),
-                title=aura_file.stem,
-                workdir=workdir,
-                kind="run",
-                command_ps_lines=cmd,
-            )
-
-        smt = " --smt-profile thorough" if _file_uses_quantifiers(aura_file) else ""
+            return _build_example(aura_file, workdir, kind="run", cmd_lines=cmd)
         cmd = [f'cargo run -p aura --features z3 -- verify "{aura_file.name}"{smt}']
-        return Example(
-            id=str(aura_file.relative_to(REPO_ROOT)).replace("\\", "/"),
-            title=aura_file.stem,
-            workdir=workdir,
-            kind="verify",
-            command_ps_lines=cmd,
-        )
+        return _build_example(aura_file, workdir, kind="verify", cmd_lines=cmd)
 
     aura_exe = _resolve_aura_exe()
 
-    if _file_has_main(aura_file) and not _file_uses_iot_hw_contracts(aura_file):
+    if runnable:
         cmd = [f'& "{aura_exe}" run "{aura_file.name}" --mode avm']
-        return Example(
-            id=str(aura_file.relative_to(REPO_ROOT)).replace("\\", "/"),
-            title=aura_file.stem,
-            workdir=workdir,
-            kind="run",
-            command_ps_lines=cmd,
-        )
+        return _build_example(aura_file, workdir, kind="run", cmd_lines=cmd)
 
-    smt = " --smt-profile thorough" if _file_uses_quantifiers(aura_file) else ""
     cmd = [f'& "{aura_exe}" verify "{aura_file.name}"{smt}']
-    return Example(
-        id=str(aura_file.relative_to(REPO_ROOT)).replace("\\", "/"),
-        title=aura_file.stem,
-        workdir=workdir,
-        kind="verify",
-        command_ps_lines=cmd,
-    )
+    return _build_example(aura_file, workdir, kind="verify", cmd_lines=cmd)
+
+
+def _classify_dir(d: Path) -> Optional[Example]:
+    readme = d / "README.md"
+    aura_files = _aura_files_in(d)
+
+    if readme.exists():
+        cmd_lines = _select_run_block_from_readme(readme)
+        if cmd_lines:
+            # README commands are typically from repo root
+            return _build_example(d, REPO_ROOT, kind="custom", cmd_lines=cmd_lines, title=d.name)
+
+    # No README-derived command: infer a default.
+    entry: Optional[Path] = None
+    if (d / "main.aura").exists():
+        entry = d / "main.aura"
+    elif (d / f"{d.name}.aura").exists():
+        entry = d / f"{d.name}.aura"
+    else:
+        for f in aura_files:
+            if _aura_flags(f) & _HAS_MAIN:
+                entry = f
+                break
+        if entry is None and aura_files:
+            entry = aura_files[0]
 
+    if entry is None:
+        return None
 
-def discover_examples() -> list[Example]:
-    examples: list[Example] = []
-
-    # Project-like directories.
-    for d in _discover_example_dirs():
-        readme = d / "README.md"
-        aura_files = sorted([p for p in d.glob("*.aura") if p.is_file()], key=lambda p: p.name.lower())
-
-        if readme.exists():
-            cmd_lines = _select_run_block_from_readme(readme)
-            if cmd_lines:
-                examples.append(
-                    Example(
-                        id=str(d.relative_to(REPO_ROOT)).replace("\\", "/"),
-                        title=d.name,
-                        workdir=REPO_ROOT,  # README commands are typically from repo root
-                        kind="custom",
-                        command_ps_lines=cmd_lines,
-                    )
-                )
-                continue
+    return _default_aura_command_for_file(entry, workdir=d)
 
-        # No README-derived command: infer a default.
-        entry: Optional[Path] = None
-        if (d / "main.aura").exists():
-            entry = d / "main.aura"
-        elif (d / f"{d.name}.aura").exists():
-            entry = d / f"{d.name}.aura"
-        else:
-            for f in aura_files:
-                if _file_has_main(f):
-                    entry = f
-                    break
-            if entry is None and aura_files:
-                entry = aura_files[0]
 
-        if entry is None:
-            continue
-
-        examples.append(_default_aura_command_for_file(entry, workdir=d))
+def _verification_example(f: Path) -> Example:
+    # Force verify for this folder
+    aura_exe = _resolve_aura_exe()
+    smt = " --smt-profile thorough" if _aura_flags(f) & _USES_QUANTIFIERS else ""
+    cmd = [f'& "{aura_exe}" verify "{f.name}"{smt}']
+    return _build_example(f, f.parent, kind="verify", cmd_lines=cmd, title=f"verification/{f.stem}")
 
-    # Standalone example files in examples/ (excluding special subfolders).
-    for f in _discover_standalone_aura_files():
-        examples.append(_default_aura_command_for_file(f, workdir=EXAMPLES_DIR))
 
-    # root-aura (treat each .aura as its own selectable example)
+def _iter_examples() -> Iterator[Example]:
+    # Discovery is README/.aura/aura.toml reads and stats, so a thread pool
+    # overlaps the I/O. Every sweep is submitted before the first result is
+    # consumed; map() yields each sweep's results in submission order.
+    _resolve_aura_exe()
     root_aura = EXAMPLES_DIR / "root-aura"
-    if root_aura.exists():
-        aura_files = sorted([p for p in root_aura.glob("*.aura") if p.is_file()], key=lambda p: p.name.lower())
-        for f in aura_files:
-            examples.append(_default_aura_command_for_file(f, workdir=root_aura))
-
-    # verification (verify each file)
     verification = EXAMPLES_DIR / "verification"
-    if verification.exists():
-        aura_files = sorted([p for p in verification.glob("*.aura") if p.is_file()], key=lambda p: p.name.lower())
-        for f in aura_files:
-            # Force verify for this folder
-            aura_exe = _resolve_aura_exe()
-            smt = " --smt-profile thorough" if _file_uses_quantifiers(f) else ""
-            examples.append(
-                Example(
-                    id=str(f.relative_to(REPO_ROOT)).replace("\\", "/"),
-                    title=f"verification/{f.stem}",
-                    workdir=verification,
-                    kind="verify",
-                    command_ps_lines=[f'& "{aura_exe}" verify "{f.name}"{smt}'],
-                )
-            )
-
-    # Stable ordering + de-dup (by id).
-    unique: dict[str, Example] = {}
-    for ex in examples:
-        unique[ex.id] = ex
-    return sorted(unique.values(), key=lambda e: (e.title.lower(), e.id.lower()))
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        sweeps = [
+            # Project-like directories (None when nothing runnable was found).
+            pool.map(_classify_dir, _discover_example_dirs()),
+            # Standalone example files in examples/ (excluding special subfolders).
+            pool.map(
+                functools.partial(_default_aura_command_for_file, workdir=EXAMPLES_DIR),
+                _discover_standalone_aura_files(),
+            ),
+            # root-aura (treat each .aura as its own selectable example)
+            pool.map(functools.partial(_default_aura_command_for_file, workdir=root_aura), _aura_files_in(root_aura)),
+            # verification (verify each file)
+            pool.map(_verification_example, _aura_files_in(verification)),
+        ]
+        for sweep in sweeps:
+            yield from (ex for ex in sweep if ex is not None)
+
+
+def discover_examples() -> list[Example]:
+    # De-dup by id (last one wins), then a stable, case-insensitive ordering.
+    unique = {ex.id: ex for ex in _iter_examples()}
+    return sorted(unique.values(), key=lambda e: (e.title.casefold(), e.id.casefold()))
 
 
 def _parse_selection(expr: str, n: int) -> list[int]:
@@ -306,14 +356,14 @@ def _parse_selection(expr: str, n: int) -> list[int]:
         return list(range(1, n + 1))
 
     out: set[int] = set()
-    parts = [p.strip() for p in re.split(r"[\s,]+", expr) if p.strip()]
-    for part in parts:
-        if re.fullmatch(r"\d+", part):
+    # Commas and whitespace both separate tokens; str.split() drops the empties.
+    for part in expr.replace(",", " ").split():
+        if _INT_RE.fullmatch(part):
             idx = int(part)
             if 1 <= idx <= n:
                 out.add(idx)
             continue
-        m = re.fullmatch(r"(\d+)-(\d+)", part)
+        m = _RANGE_RE.fullmatch(part)
         if m:
             a = int(m.group(1))
             b = int(m.group(2))
@@ -327,50 +377,209 @@ def _parse_selection(expr: str, n: int) -> list[int]:
     return sorted(out)
 
 
-def _run_powershell_lines(lines: list[str], cwd: Path) -> int:
+class _PwshSession:
+    """One long-lived PowerShell process that runs examples back to back (--reuse-shell).
+
+    Saves PowerShell start-up per example at the cost of isolation: env changes
+    made by one example stay visible to the next, and commands are fed over
+    stdin, so examples that read stdin must not use it.
+    """
+
+    _SENTINEL = "__AURA_EXAMPLE_EXIT__"
+
+    def __init__(self) -> None:
+        self.proc: Optional[subprocess.Popen[str]] = None
+
+    def _start(self) -> subprocess.Popen[str]:
+        return subprocess.Popen(
+            ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=str(REPO_ROOT),
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+        )
+
+    def run(self, lines: list[str], cwd: str) -> int:
+        if self.proc is None or self.proc.poll() is not None:
+            self.proc = self._start()
+        assert self.proc.stdin is not None and self.proc.stdout is not None
+
+        # Same wrapper as the one-shot path, but it reports the exit code on a
+        # sentinel line instead of exiting. LASTEXITCODE is reset because it
+        # would otherwise leak in from the previous example.
+        joined = " ; ".join(lines)
+        script = (
+            "$ErrorActionPreference = 'Continue' ; $global:LASTEXITCODE = 0 ; "
+            f"try {{ Push-Location -LiteralPath '{cwd}' ; {joined} ; $code = $LASTEXITCODE }} "
+            "catch { Write-Output $_ ; $code = 1 } "
+            f"finally {{ Pop-Location ; Write-Output ('{self._SENTINEL}' + $code) }}"
+        )
+        self.proc.stdin.write(script + "\n")
+        self.proc.stdin.flush()
+
+        for out in self.proc.stdout:
+            # A native command whose output lacks a trailing newline leaves the
+            # sentinel glued to the end of its last line, so search the whole line.
+            head, found, code_text = out.partition(self._SENTINEL)
+            if found:
+                if head:
+                    sys.stdout.write(head + "\n")
+                return int(code_text.strip() or 0)
+            sys.stdout.write(out)
+        # The example ended the shell itself (e.g. `exit`); a new one starts next time.
+        code = self.proc.wait()
+        self.proc = None
+        return code
+
+    def close(self) -> None:
+        if self.proc is None:
+            return
+        try:
+            if self.proc.stdin is not None:
+                self.proc.stdin.write("exit\n")
+                self.proc.stdin.close()
+            self.proc.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            self.proc.kill()
+        self.proc = None
+
+
+# Fixed wrapper run via -File, so PowerShell parses it from a stable file
+# rather than a fresh -Command string per example. The example's lines arrive
+# as $Script and run in the wrapper's scope, so env changes persist within
+# the example.
+_PS_WRAPPER = """\
+param([string]$Cwd, [string]$Script)
+$ErrorActionPreference = 'Continue'
+Push-Location -LiteralPath $Cwd
+Invoke-Expression $Script
+$code = $LASTEXITCODE
+Pop-Location
+exit $code
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _ps_wrapper_path() -> str:
+    path = os.path.join(tempfile.gettempdir(), f"aura_runner_{os.getpid()}.ps1")
+    # Write-then-rename so concurrent --jobs workers never see a partial file.
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8-sig") as f:
+        f.write(_PS_WRAPPER)
+    os.replace(tmp, path)
+    atexit.register(_remove_ps_wrapper, path)
+    return path
+
+
+def _remove_ps_wrapper(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _powershell_argv(lines: list[str], cwd: str) -> list[str]:
+    return [
+        "powershell",
+        "-NoProfile",
+        "-ExecutionPolicy",
+        "Bypass",
+        "-File",
+        _ps_wrapper_path(),
+        "-Cwd",
+        cwd,
+        "-Script",
+        " ; ".join(lines),
+    ]
+
+
+def _run_powershell_lines(lines: list[str], cwd: str, session: Optional[_PwshSession] = None) -> int:
     if not _is_windows():
         raise RuntimeError("This runner currently supports Windows/PowerShell only.")
 
-    # Execute the lines in one PowerShell invocation so env changes persist within the example.
-    joined = " ; ".join(lines)
-    ps_script = (
-        "$ErrorActionPreference = 'Continue' ; "
-        f"Push-Location -LiteralPath '{str(cwd)}' ; "
-        f"{joined} ; "
-        "$code = $LASTEXITCODE ; "
-        "Pop-Location ; "
-        "exit $code"
-    )
+    if session is not None:
+        return session.run(lines, cwd)
+
+    proc = subprocess.run(_powershell_argv(lines, cwd), cwd=str(REPO_ROOT))
+    return int(proc.returncode)
+
+
+def _run_example_captured(ex: Example) -> tuple[int, str]:
+    """Run one example with stdout+stderr captured, for --jobs > 1."""
+    if not _is_windows():
+        raise RuntimeError("This runner currently supports Windows/PowerShell only.")
 
     proc = subprocess.run(
-        [
-            "powershell",
-            "-NoProfile",
-            "-ExecutionPolicy",
-            "Bypass",
-            "-Command",
-            ps_script,
-        ],
+        _powershell_argv(ex.command_ps_lines, ex.cwd_str),
         cwd=str(REPO_ROOT),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
     )
-    return int(proc.returncode)
+    return int(proc.returncode), proc.stdout or ""
 
 
-def run_examples(selected: Iterable[Example], stop_on_fail: bool) -> int:
+def _run_examples_parallel(selected: list[Example], jobs: int) -> list[str]:
+    # Each example's output is captured and printed as one block when it
+    # finishes, so concurrent runs don't interleave on the console.
     failures: list[str] = []
-    for ex in selected:
-        print(f"\n=== [{ex.title}] ({ex.kind}) ===")
-        print(f"Workdir: {ex.workdir}")
-        print(f"Command: {ex.preview}")
-
-        code = _run_powershell_lines(ex.command_ps_lines, cwd=ex.workdir)
-        if code == 0:
-            print(f"PASS: {ex.title}")
-        else:
-            print(f"FAIL: {ex.title} (exit={code})")
-            failures.append(f"{ex.title} (exit={code})")
-            if stop_on_fail:
-                break
+    print_lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(_run_example_captured, ex): ex for ex in selected}
+        for fut in as_completed(futures):
+            ex = futures[fut]
+            code, output = fut.result()
+            with print_lock:
+                print(f"\n=== [{ex.title}] ({ex.kind}) ===")
+                print(f"Workdir: {ex.workdir}")
+                print(f"Command: {ex.preview}")
+                sys.stdout.write(output)
+                if code == 0:
+                    print(f"PASS: {ex.title}")
+                else:
+                    print(f"FAIL: {ex.title} (exit={code})")
+                    failures.append(f"{ex.title} (exit={code})")
+                sys.stdout.flush()
+    return failures
+
+
+def _run_examples_serial(selected: Iterable[Example], stop_on_fail: bool, reuse_shell: bool) -> list[str]:
+    failures: list[str] = []
+    session = _PwshSession() if reuse_shell and _is_windows() else None
+    try:
+        for ex in selected:
+            print(f"\n=== [{ex.title}] ({ex.kind}) ===")
+            print(f"Workdir: {ex.workdir}")
+            print(f"Command: {ex.preview}")
+            sys.stdout.flush()
+
+            code = _run_powershell_lines(ex.command_ps_lines, cwd=ex.cwd_str, session=session)
+            if code == 0:
+                print(f"PASS: {ex.title}")
+            else:
+                print(f"FAIL: {ex.title} (exit={code})")
+                failures.append(f"{ex.title} (exit={code})")
+                if stop_on_fail:
+                    break
+    finally:
+        if session is not None:
+            session.close()
+    return failures
+
+
+def run_examples(selected: Iterable[Example], stop_on_fail: bool, reuse_shell: bool = False, jobs: int = 1) -> int:
+    # --stop-on-fail needs ordered, one-at-a-time runs, and a reused shell is
+    # a single process, so both keep the streaming serial loop.
+    if jobs > 1 and not stop_on_fail and not reuse_shell:
+        failures = _run_examples_parallel(list(selected), jobs)
+    else:
+        failures = _run_examples_serial(selected, stop_on_fail, reuse_shell)
 
     print("\n=== Summary ===")
     if not failures:
@@ -389,6 +598,17 @@ def main(argv: list[str]) -> int:
     ap.add_argument("--example", help="Selection like '3', '1,2,5', '2-6', or 'all'")
     ap.add_argument("--all", action="store_true", help="Run all examples")
     ap.add_argument("--stop-on-fail", action="store_true", help="Stop at first failure")
+    ap.add_argument(
+        "--reuse-shell",
+        action="store_true",
+        help="Run all examples in one PowerShell session (faster; env changes carry over between examples)",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run up to N examples at once; output is printed per example as each finishes (ignored with --stop-on-fail)",
+    )
 
     args = ap.parse_args(argv)
 
@@ -404,7 +624,7 @@ def main(argv: list[str]) -> int:
 
     if args.all:
         selected = examples
-        return run_examples(selected, stop_on_fail=args.stop_on_fail)
+        return run_examples(selected, stop_on_fail=args.stop_on_fail, reuse_shell=args.reuse_shell, jobs=args.jobs)
 
     if args.example:
         try:
@@ -413,7 +633,7 @@ def main(argv: list[str]) -> int:
             print(str(e))
             return 2
         selected = [examples[i - 1] for i in idxs]
-        return run_examples(selected, stop_on_fail=args.stop_on_fail)
+        return run_examples(selected, stop_on_fail=args.stop_on_fail, reuse_shell=args.reuse_shell, jobs=args.jobs)
 
     # Interactive picker
     print("Discovered examples:")
@@ -435,7 +655,7 @@ def main(argv: list[str]) -> int:
         selected = [examples[i - 1] for i in idxs]
         break
 
-    return run_examples(selected, stop_on_fail=args.stop_on_fail)
+    return run_examples(selected, stop_on_fail=args.stop_on_fail, reuse_shell=args.reuse_shell, jobs=args.jobs)
 
 
 if __name__ == "__main__":
@@ -5,16 +5,24 @@ Aura APK System - Verification & Quick Start
 Checks system readiness and provides next steps.
 """
 
+import argparse
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def check_java():
-    """Verify Java installation."""
+def check_java(fast=False):
+    """Verify Java installation (PATH lookup only when fast)."""
+    exe = shutil.which("java")
+    if not exe:
+        return False, "Java not found"
+    if fast:
+        return True, exe
     try:
         result = subprocess.run(
-            ["java", "-version"],
+            [exe, "-version"],
             capture_output=True,
             text=True,
             timeout=5
@@ -23,25 +31,38 @@ def check_java():
             version_line = (result.stderr + result.stdout).split('\n')[0]
             return True, version_line
         return False, "Java found but not working"
-    except FileNotFoundError:
-        return False, "Java not found"
+    except (OSError, subprocess.TimeoutExpired):
+        return False, "Java found but not working"
 
 
-def check_powershell():
-    """Verify PowerShell availability."""
+def check_powershell(fast=False):
+    """Verify PowerShell availability (PATH lookup only when fast)."""
+    exe = shutil.which("powershell") or shutil.which("pwsh")
+    if not exe:
+        return False, "PowerShell not found"
+    if fast:
+        return True, exe
     try:
         result = subprocess.run(
-            ["powershell", "-NoProfile", "-Command", "Write-Host OK"],
+            [exe, "-NoProfile", "-Command", "Write-Host OK"],
             capture_output=True,
             text=True,
             timeout=5
         )
         return result.returncode == 0, "PowerShell 5.1+" if result.returncode == 0 else "PowerShell error"
-    except:
-        return False, "PowerShell not found"
+    except (OSError, subprocess.TimeoutExpired):
+        return False, "PowerShell error"
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Check readiness for building and deploying Aura APKs.")
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Only look up java/powershell on PATH; skip the version probes"
+    )
+    args = parser.parse_args()
+
     print("""
 ╔═══════════════════════════════════════════════════════════════╗
 ║                                                               ║
@@ -53,12 +74,13 @@ def main():
     
     print("\n[1/3] Checking system prerequisites...")
     
-    # Check Java
-    java_ok, java_msg = check_java()
+    # Check Java and PowerShell; the two version probes run side by side.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        java_future = pool.submit(check_java, args.fast)
+        ps_future = pool.submit(check_powershell, args.fast)
+        java_ok, java_msg = java_future.result()
+        ps_ok, ps_msg = ps_future.result()
     print(f"  {'✓' if java_ok else '✗'} Java: {java_msg}")
-    
-    # Check PowerShell
-    ps_ok, ps_msg = check_powershell()
     print(f"  {'✓' if ps_ok else '✗'} PowerShell: {ps_msg}")
     
     # Check script files